@@ -1,5 +1,60 @@
 """
 File in charge of doing a rebind for the asciimatics library
+The classes and the submodules (widgets, example_scripts, ...) are imported on their first access,
+so importing the package does not import asciimatics, numpy or the widgets.
 """
-from .asciimatics_overlay_main import AsciiMaticsOverlayMain as AsciimaticsOverlay
-from .asciimatics_overlay_main import AsciiMaticsOverlayMain
+import sys
+
+
+def _import_submodule(name: str, package: str = __name__) -> object:
+    """ Import a submodule of a package (with the import statement machinery, so that -X importtime accounts for it) """
+    __import__(f"{package}.{name}")
+    return sys.modules[f"{package}.{name}"]
+
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "AsciimaticsOverlay": ("asciimatics_overlay_main", "AsciiMaticsOverlayMain"),
+    "AsciiMaticsOverlayMain": ("asciimatics_overlay_main", "AsciiMaticsOverlayMain"),
+    "Colour": ("colour_class", "Colour"),
+    "Get": ("get_class", "Get"),
+    "Is": ("is_class", "Is"),
+    "Display": ("display_class", "Display"),
+    "MyScreen": ("screen_class", "MyScreen"),
+    "CellBuffer": ("cell_buffer_class", "CellBuffer"),
+    "Layer": ("layer_compositor_class", "Layer"),
+    "LayerCompositor": ("layer_compositor_class", "LayerCompositor"),
+    "Logger": ("logger_class", "Logger"),
+    "RingBufferHandler": ("logger_class", "RingBufferHandler"),
+    "HeadlessScreen": ("headless_screen_class", "HeadlessScreen"),
+    "FrameScheduler": ("frame_scheduler_class", "FrameScheduler"),
+    "AsyncDriver": ("async_driver_class", "AsyncDriver"),
+    "UiCommandQueue": ("ui_command_queue_class", "UiCommandQueue"),
+    "DeferredCallback": ("deferred_callback_class", "DeferredCallback"),
+    "SceneRegistry": ("scene_registry_class", "SceneRegistry"),
+    "LazyScene": ("scene_registry_class", "LazyScene"),
+    "Instrumentation": ("instrumentation_class", "Instrumentation"),
+    "RenderStats": ("instrumentation_class", "RenderStats"),
+    "MethodStats": ("instrumentation_class", "MethodStats"),
+    "resolve_colour": ("colour_class", "resolve_colour"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> object:
+    """ Import a class or a submodule of the package on its first access """
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        try:
+            return _import_submodule(name)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_submodule(target[0]), target[1])
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,8 +5,6 @@ import sys
 import asciimatics_overlay_ov.example_scripts as ES
 
 
-print("Hello world")
-
 if __name__ == "__main__":
     SUCCESS = 0
     ERROR = 1
@@ -12,14 +12,49 @@ from .colour_class import Colour
 from .widgets import FrameNodes
 
 
+class _SharedNode:
+    """
+    Descriptor standing in for a node attribute (is_, screen_, get_, ...) that was not created eagerly
+    It returns the overlay itself, which already is an instance of every node class, so the node shares the overlay's state instead of copying it.
+    It is a non-data descriptor: the node instances created by the eager construction mode take precedence over it.
+    """
+
+    def __get__(self, instance: object, owner: type = None) -> object:
+        if instance is None:
+            return self
+        return instance
+
+
 class AsciiMaticsOverlayMain(Is, MyScreen, Get, Display, Colour, FrameNodes):
     """
     The class in charge of simplifying the usage of some functionalities from asciimatics
     """
 
-    def __init__(self, event: Event = None, screen: SC = None, success: int = 0, error: int = 84) -> None:
+    is_ = _SharedNode()
+    screen_ = _SharedNode()
+    get_ = _SharedNode()
+    colour_ = _SharedNode()
+    display_ = _SharedNode()
+    frame_nodes_ = _SharedNode()
+
+    def __init__(self, event: Event = None, screen: SC = None, success: int = 0, error: int = 84, headless: bool = False, lightweight: bool = False) -> None:
+        """
+        :param event: The event to bind
+        :param screen: The screen to bind
+        :param success: The status returned on success
+        :param error: The status returned on error
+        :param headless: When no screen (or event) is provided, bind an in-memory HeadlessScreen (and an empty Event) instead of returning uninitialised
+        :param lightweight: Do not build a second set of node instances, the node attributes (is_, screen_, get_, colour_, display_, frame_nodes_) are then views on this overlay, sharing its state
+        """
         self.success: int = success
         self.error: int = error
+        if headless is True:
+            if screen is None:
+                # Imported here: the headless screen needs NumPy
+                from .headless_screen_class import HeadlessScreen
+                screen = HeadlessScreen()
+            if event is None:
+                event = Event()
         if event is None or screen is None:
             return
         self.__version__: str = '1.0.0'
@@ -41,7 +76,9 @@ class AsciiMaticsOverlayMain(Is, MyScreen, Get, Display, Colour, FrameNodes):
         )
         Colour.__init__(self)
         Display.__init__(self, self.my_asciimatics_overlay_main_screen)
-        FrameNodes.__init__(self)
+        FrameNodes.__init__(self, self.success, self.error)
+        if lightweight is True:
+            return
         # ---- Initialise the node classes version ----
         self.is_ = Is(
             self.my_asciimatics_overlay_main_event
@@ -0,0 +1,169 @@
+"""
+File in charge of running the render and input loop of the overlay inside an asyncio event loop
+"""
+
+import asyncio
+from asciimatics.screen import Screen as SC
+from .frame_scheduler_class import FrameScheduler
+
+
+class AsyncDriver:
+    """
+    The class in charge of driving a FrameScheduler from an asyncio event loop
+    Between two frames, the driver awaits the readiness of the input file (with loop.add_reader) so that the events are handled as soon as they arrive
+    and the other coroutines of the event loop keep running. When the input cannot be watched (no file descriptor, or an event loop without add_reader),
+    the screen is polled once per frame instead.
+    The reader is only added while input handlers read the events, and it is removed after each wakeup: unread input (left to the asciimatics widgets,
+    which read it during the frame) cannot wake the loop up again and again until the next frame.
+    """
+
+    def __init__(self, scheduler: FrameScheduler, screen: SC = None, input_file: object = None) -> None:
+        """
+        :param scheduler: The scheduler running the per-frame callbacks and the refresh
+        :param screen: The screen the events are read from (with get_event)
+        :param input_file: Optional file whose readiness signals new input (usually sys.stdin)
+        """
+        self.scheduler: FrameScheduler = scheduler
+        self.screen: SC = screen
+        self.input_file: object = input_file
+        self.input_handlers: list = []
+        self.tasks: set = set()
+        self.watching_input: bool = False
+        self._input_ready: asyncio.Event = None
+        self._loop: asyncio.AbstractEventLoop = None
+        self._input_fd: int = None
+        self._reader_added: bool = False
+
+    def add_input_handler(self, handler: object) -> None:
+        """
+        Add a function called with every event read from the screen
+        When no handler is added, the events are left on the screen (for the asciimatics widgets to read them).
+        """
+        self.input_handlers.append(handler)
+
+    def spawn(self, coroutine: object) -> asyncio.Task:
+        """
+        Run a coroutine alongside the frames, it is cancelled when the driver stops
+        The coroutine runs on the same thread as the frames: it can update the widgets and draw with the Display methods directly.
+        """
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def stop(self) -> None:
+        """ Stop the driver at the end of the current frame """
+        self.scheduler.stop()
+        if self._input_ready is not None:
+            self._input_ready.set()
+
+    def dispatch_input(self) -> int:
+        """
+        Read the pending events of the screen and give them to the input handlers
+        :return: The number of events dispatched
+        """
+        if self.screen is None or len(self.input_handlers) == 0:
+            return 0
+        count = 0
+        event = self.screen.get_event()
+        while event is not None:
+            for handler in tuple(self.input_handlers):
+                handler(event)
+            count += 1
+            event = self.screen.get_event()
+        return count
+
+    def _get_input_fd(self) -> int:
+        """ Get the file descriptor of the input file, None when there is none """
+        if self.input_file is None:
+            return None
+        if isinstance(self.input_file, int) is True:
+            return self.input_file
+        try:
+            return self.input_file.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def _watch_input(self, loop: asyncio.AbstractEventLoop, input_fd: int) -> bool:
+        """ Check that the event loop can signal when the input is readable (the reader is removed right away, it is added when waiting) """
+        if input_fd is None:
+            return False
+        try:
+            loop.add_reader(input_fd, self._on_input_ready)
+        except (NotImplementedError, OSError, ValueError):
+            return False
+        loop.remove_reader(input_fd)
+        self._loop = loop
+        self._input_fd = input_fd
+        return True
+
+    def _add_reader(self) -> None:
+        """ Wake up once when the input becomes readable """
+        if self._reader_added is False:
+            self._loop.add_reader(self._input_fd, self._on_input_ready)
+            self._reader_added = True
+
+    def _remove_reader(self) -> None:
+        """ Stop watching the input """
+        if self._reader_added is True:
+            self._loop.remove_reader(self._input_fd)
+            self._reader_added = False
+
+    def _on_input_ready(self) -> None:
+        """ Signal the readable input, the reader is removed because it fires as long as the input is not read """
+        self._remove_reader()
+        self._input_ready.set()
+
+    async def _wait_for_next_frame(self) -> None:
+        """ Handle the input until the next frame is due """
+        delay = self.scheduler.time_until_next_frame()
+        if self.watching_input is False or self.screen is None or len(self.input_handlers) == 0:
+            await asyncio.sleep(delay)
+            return
+        while delay > 0 and self.scheduler.running is True:
+            self._add_reader()
+            try:
+                await asyncio.wait_for(self._input_ready.wait(), delay)
+            except asyncio.TimeoutError:
+                return
+            finally:
+                self._remove_reader()
+            self._input_ready.clear()
+            if self.dispatch_input() == 0:
+                # The input was not read, wait for the next frame rather than waking up on it again
+                await asyncio.sleep(self.scheduler.time_until_next_frame())
+                return
+            delay = self.scheduler.time_until_next_frame()
+        await asyncio.sleep(0)
+
+    async def run(self, max_frames: int = None) -> int:
+        """
+        Run the frames until stop is called, a callback returns False or max_frames frames were run
+        :param max_frames: Optional maximum number of frames to run
+        :return: The number of frames run
+        """
+        loop = asyncio.get_running_loop()
+        self._input_ready = asyncio.Event()
+        input_fd = self._get_input_fd()
+        self.watching_input = self._watch_input(loop, input_fd)
+        self.scheduler.start()
+        frames = 0
+        try:
+            while self.scheduler.running is True and max_frames != 0:
+                self.scheduler.schedule_next_frame()
+                self.dispatch_input()
+                self.scheduler.tick()
+                frames += 1
+                if self.scheduler.running is False or frames == max_frames:
+                    break
+                await self._wait_for_next_frame()
+        finally:
+            if self.watching_input is True:
+                self._remove_reader()
+                self.watching_input = False
+            self.scheduler.running = False
+            for task in tuple(self.tasks):
+                task.cancel()
+            if len(self.tasks) > 0:
+                await asyncio.gather(*self.tasks, return_exceptions=True)
+        return frames
@@ -0,0 +1,338 @@
+"""
+File in charge of benchmarking the rendering methods of the Display class without a terminal
+
+Usage:
+    python -m asciimatics_overlay_ov.bench [--sizes 80x24,400x120] [--methods mvprintw_colour,...] [--repeat 5] [--headless] [--json]
+"""
+
+import sys
+import json
+import argparse
+import tracemalloc
+from time import perf_counter
+import numpy as np
+from .display_class import Display
+from .cell_buffer_class import CellBuffer
+from .headless_screen_class import HeadlessScreen
+from .layer_compositor_class import LayerCompositor
+
+
+class BenchScreen:
+    """
+    An in-memory screen stand-in that counts what it is asked to draw
+    When a target screen is provided (e.g. a HeadlessScreen), the calls are forwarded to it.
+    """
+
+    def __init__(self, width: int = 80, height: int = 24, target: HeadlessScreen = None) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.colours: int = 8
+        self.print_at_calls: int = 0
+        self.cells_written: int = 0
+        self.target: HeadlessScreen = target
+
+    def print_at(self, text: str, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """ Count the call and the cells it writes """
+        self.print_at_calls += 1
+        self.cells_written += len(str(text))
+        if self.target is not None:
+            self.target.print_at(text, x, y, colour, attr, bg, transparent)
+
+    def refresh(self) -> None:
+        """ Nothing to refresh """
+
+    def clear(self) -> None:
+        """ Nothing to clear """
+
+    def reset_counters(self) -> None:
+        """ Reset the call and cell counters """
+        self.print_at_calls = 0
+        self.cells_written = 0
+
+
+class Benchmark:
+    """ The class in charge of running the Display methods against an in-memory screen """
+
+    default_sizes: list[tuple[int, int]] = [
+        (80, 24),
+        (160, 48),
+        (240, 72),
+        (400, 120)
+    ]
+
+    def __init__(self, sizes: list[tuple[int, int]] = None, methods: list[str] = None, repeat: int = 5, headless: bool = False) -> None:
+        self.headless: bool = headless
+        self.sizes: list[tuple[int, int]] = sizes or self.default_sizes
+        self.cases: dict = {
+            "mvprintw": self._case_mvprintw,
+            "mvprintw_colour": self._case_mvprintw_colour,
+            "print_array": self._case_print_array,
+            "print_array_colour": self._case_print_array_colour,
+            "print_double_array": self._case_print_double_array,
+            "print_block": self._case_print_block,
+            "print_double_array_colour": self._case_print_double_array_colour,
+            "print_array_cloud_points": self._case_print_array_cloud_points,
+            "print_array_cloud_points_batched": self._case_print_array_cloud_points_batched,
+            "print_double_array_cloud_points": self._case_print_double_array_cloud_points,
+            "blit_buffer": self._case_blit_buffer,
+            "print_layers": self._case_print_layers,
+            "print_checker_board": self._case_print_checker_board
+        }
+        if methods is None:
+            methods = list(self.cases)
+        unknown = [method for method in methods if method not in self.cases]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+        self.methods: list[str] = methods
+        self.repeat: int = max(1, repeat)
+
+    # ---- Cases: each one returns a function drawing a full frame ----
+
+    def _case_mvprintw(self, display: Display, width: int, height: int) -> object:
+        line = "x" * width
+
+        def frame() -> None:
+            for posy in range(height):
+                display.mvprintw(line, 0, posy)
+        return frame
+
+    def _case_mvprintw_colour(self, display: Display, width: int, height: int) -> object:
+        line = "x" * width
+
+        def frame() -> None:
+            for posy in range(height):
+                display.mvprintw_colour(line, 0, posy, posy % 8, 0, 0, False)
+        return frame
+
+    def _case_print_array(self, display: Display, width: int, height: int) -> object:
+        words = ["x" * 4] * (width // 5)
+
+        def frame() -> None:
+            for posy in range(height):
+                display.print_array(words, " ", 0, posy)
+        return frame
+
+    def _case_print_array_colour(self, display: Display, width: int, height: int) -> object:
+        rows = [
+            [{"text": "x"} for _ in range(width)]
+            for _ in range(height)
+        ]
+
+        def frame() -> None:
+            for posy, row in enumerate(rows):
+                display.print_array_colour(row, "", 0, posy)
+        return frame
+
+    def _case_print_double_array(self, display: Display, width: int, height: int) -> object:
+        array = [["x"] * width for _ in range(height)]
+
+        def frame() -> None:
+            display.print_double_array(array, "", 0, 0)
+        return frame
+
+    def _case_print_block(self, display: Display, width: int, height: int) -> object:
+        rows = ["x" * width] * height
+
+        def frame() -> None:
+            display.print_block(rows, 0, 0)
+        return frame
+
+    def _case_print_double_array_colour(self, display: Display, width: int, height: int) -> object:
+        array = [
+            [{"text": "x"} for _ in range(width)]
+            for _ in range(height)
+        ]
+
+        def frame() -> None:
+            display.print_double_array_colour(array, "", 0, 0)
+        return frame
+
+    def _cloud(self, width: int, height: int) -> list[dict]:
+        """ Create a heatmap like cloud of points covering the screen """
+        return [
+            {"character": "#", "posx": posx, "posy": posy, "colour": (posx // 8) % 8}
+            for posy in range(height) for posx in range(width)
+        ]
+
+    def _case_print_array_cloud_points(self, display: Display, width: int, height: int) -> object:
+        cloud = self._cloud(width, height)
+
+        def frame() -> None:
+            display.print_array_cloud_points(cloud)
+        return frame
+
+    def _case_print_array_cloud_points_batched(self, display: Display, width: int, height: int) -> object:
+        cloud = self._cloud(width, height)
+
+        def frame() -> None:
+            display.print_array_cloud_points(cloud, batched=True)
+        return frame
+
+    def _case_print_double_array_cloud_points(self, display: Display, width: int, height: int) -> object:
+        array = [
+            [{"character": "#", "colour": (posx // 8) % 8} for posx in range(width)]
+            for _ in range(height)
+        ]
+
+        def frame() -> None:
+            display.print_double_array_cloud_points(array)
+        return frame
+
+    def _case_blit_buffer(self, display: Display, width: int, height: int) -> object:
+        buffer = CellBuffer(width, height, "#")
+        buffer.fg[:, :] = (np.arange(width) // 8) % 8
+
+        def frame() -> None:
+            display.blit_buffer(buffer, 0, 0)
+        return frame
+
+    def _case_print_layers(self, display: Display, width: int, height: int) -> object:
+        compositor = LayerCompositor(width, height)
+        compositor.get_layer("background").fill("#", 4)
+        compositor.get_layer("background").mask.fill(True)
+        popup = compositor.get_layer("overlay")
+        for posy in range(height // 4, height // 2):
+            popup.print_at("x" * (width // 2), width // 4, posy, 2)
+
+        def frame() -> None:
+            display.print_layers(compositor)
+        return frame
+
+    def _case_print_checker_board(self, display: Display, width: int, height: int) -> object:
+        columns = max((width - 4) // 2, 1)
+        rows = max(height - 3, 1)
+
+        def frame() -> None:
+            display.print_checker_board([], columns, rows)
+        return frame
+
+    # ---- Running ----
+
+    def run_case(self, method: str, width: int, height: int) -> dict:
+        """
+        Run a single case
+        :return: a dictionary with the measured throughput of the case
+        """
+        target = None
+        if self.headless is True:
+            target = HeadlessScreen(width, height)
+        screen = BenchScreen(width, height, target)
+        display = Display(screen)
+        frame = self.cases[method](display, width, height)
+        frame()
+        screen.reset_counters()
+        start = perf_counter()
+        for _ in range(self.repeat):
+            frame()
+        elapsed = max(perf_counter() - start, 1e-9)
+        print_at_calls = screen.print_at_calls
+        cells_written = screen.cells_written
+        tracemalloc.start()
+        try:
+            frame()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            "method": method,
+            "width": width,
+            "height": height,
+            "frames": self.repeat,
+            "seconds_per_frame": elapsed / self.repeat,
+            "frames_per_second": self.repeat / elapsed,
+            "print_at_per_frame": print_at_calls / self.repeat,
+            "calls_per_second": print_at_calls / elapsed,
+            "cells_per_second": cells_written / elapsed,
+            "peak_allocated_bytes": peak
+        }
+
+    def run(self) -> list[dict]:
+        """ Run every selected case for every size """
+        results = []
+        for width, height in self.sizes:
+            for method in self.methods:
+                results.append(self.run_case(method, width, height))
+        return results
+
+    @staticmethod
+    def format_report(results: list[dict]) -> str:
+        """ Format the results as a human readable table """
+        header = f"{'method':<34}{'size':>9}{'ms/frame':>11}{'print_at/frame':>16}{'calls/s':>13}{'cells/s':>14}{'peak KiB':>10}"
+        lines = [header, "-" * len(header)]
+        for result in results:
+            lines.append(
+                f"{result['method']:<34}"
+                f"{str(result['width']) + 'x' + str(result['height']):>9}"
+                f"{result['seconds_per_frame'] * 1000:>11.3f}"
+                f"{result['print_at_per_frame']:>16.0f}"
+                f"{result['calls_per_second']:>13.0f}"
+                f"{result['cells_per_second']:>14.0f}"
+                f"{result['peak_allocated_bytes'] / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+def _parse_sizes(sizes: str) -> list[tuple[int, int]]:
+    """ Convert a '80x24,160x48' string to a list of (width, height) tuples """
+    result = []
+    for size in sizes.split(","):
+        width, height = size.lower().split("x")
+        result.append((int(width), int(height)))
+    return result
+
+
+def main(argv: list[str] = None) -> int:
+    """ The entry point of the benchmark """
+    parser = argparse.ArgumentParser(
+        prog="python -m asciimatics_overlay_ov.bench",
+        description="Measure the throughput of the Display methods against an in-memory screen"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=None,
+        help="Comma separated list of WIDTHxHEIGHT sizes (default: 80x24,160x48,240x72,400x120)"
+    )
+    parser.add_argument(
+        "--methods",
+        type=lambda methods: methods.split(","),
+        default=None,
+        help="Comma separated list of the cases to run (default: all of them)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of frames drawn per case (default: 5)"
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Draw into a HeadlessScreen grid instead of only counting the print_at calls"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the raw results as JSON"
+    )
+    args = parser.parse_args(argv)
+    try:
+        benchmark = Benchmark(
+            args.sizes,
+            args.methods,
+            args.repeat,
+            args.headless
+        )
+    except ValueError as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    results = benchmark.run()
+    if args.json is True:
+        print(json.dumps(results, indent=4))
+    else:
+        print(Benchmark.format_report(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
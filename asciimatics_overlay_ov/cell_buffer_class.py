@@ -0,0 +1,161 @@
+"""
+File in charge of containing the array backed buffer of cells that can be blitted on the screen
+"""
+
+import numpy as np
+
+
+class CellBuffer:
+    """
+    The class in charge of storing a block of cells as contiguous NumPy planes
+    Each plane has a (height, width) shape:
+        * character: one unicode character per cell
+        * fg: the foreground colour of the cell
+        * attr: the attribute of the cell
+        * bg: the background colour of the cell
+    """
+
+    character_dtype: str = "<U1"
+    colour_dtype: type = np.int16
+
+    def __init__(self, width: int, height: int, character: str = " ", fg: int = 7, attr: int = 0, bg: int = 0) -> None:
+        if width < 0 or height < 0:
+            raise ValueError("The width and height of a CellBuffer cannot be negative")
+        self.width: int = width
+        self.height: int = height
+        self.character: np.ndarray = np.full(
+            (height, width),
+            character,
+            dtype=self.character_dtype
+        )
+        self.fg: np.ndarray = np.full(
+            (height, width),
+            fg,
+            dtype=self.colour_dtype
+        )
+        self.attr: np.ndarray = np.full(
+            (height, width),
+            attr,
+            dtype=self.colour_dtype
+        )
+        self.bg: np.ndarray = np.full(
+            (height, width),
+            bg,
+            dtype=self.colour_dtype
+        )
+
+    @classmethod
+    def from_strings(cls, rows: list[str], fg: int = 7, attr: int = 0, bg: int = 0) -> "CellBuffer":
+        """
+        Create a buffer from a list of strings, the shorter rows are padded with spaces
+        :param rows: The text of each row
+        :param fg: The foreground colour of the cells
+        :param attr: The attribute of the cells
+        :param bg: The background colour of the cells
+        :return: a CellBuffer instance
+        """
+        width = max((len(row) for row in rows), default=0)
+        buffer = cls(width, len(rows), " ", fg, attr, bg)
+        for posy, row in enumerate(rows):
+            buffer.put_text(row, 0, posy)
+        return buffer
+
+    def fill(self, character: str = " ", fg: int = 7, attr: int = 0, bg: int = 0) -> None:
+        """ Reset every cell of the buffer """
+        self.character.fill(character)
+        self.fg.fill(fg)
+        self.attr.fill(attr)
+        self.bg.fill(bg)
+
+    def put_text(self, text: str, posx: int, posy: int, fg: int = None, attr: int = None, bg: int = None, transparent: bool = False) -> tuple[slice, object]:
+        """
+        Write a string in the buffer, the characters outside of the buffer are dropped
+        :param text: The text to write
+        :param posx: The column of the first character
+        :param posy: The row of the text
+        :param fg: Optional foreground colour, the current one is kept when None
+        :param attr: Optional attribute, the current one is kept when None
+        :param bg: Optional background colour, the current one is kept when None
+        :param transparent: Whether the spaces are skipped, keeping the cells below them
+        :return: the columns written and the cells drawn among them (True for all of them, a boolean mask when transparent), None when nothing is written
+        """
+        if posy < 0 or posy >= self.height:
+            return None
+        start = max(posx, 0)
+        end = min(posx + len(text), self.width)
+        if start >= end:
+            return None
+        columns = slice(start, end)
+        characters = np.array(list(text[start - posx:end - posx]), dtype=self.character_dtype)
+        if transparent is False:
+            self.character[posy, columns] = characters
+            drawn = True
+        else:
+            drawn = characters != " "
+            self.character[posy, columns][drawn] = characters[drawn]
+        if fg is not None:
+            self.fg[posy, columns][drawn] = fg
+        if attr is not None:
+            self.attr[posy, columns][drawn] = attr
+        if bg is not None:
+            self.bg[posy, columns][drawn] = bg
+        return columns, drawn
+
+    def put_cells(self, cells: list[tuple], posx: int, posy: int) -> None:
+        """
+        Write a row of asciimatics cells in the buffer, the cells outside of the buffer are dropped
+        :param cells: The (character, fg, attr, bg, width) tuples of an asciimatics double buffer
+        :param posx: The column of the first cell
+        :param posy: The row of the cells
+        """
+        if posy < 0 or posy >= self.height:
+            return
+        start = max(posx, 0)
+        end = min(posx + len(cells), self.width)
+        if start >= end:
+            return
+        characters, fg, attr, bg, _ = zip(*cells[start - posx:end - posx])
+        # The second half of a double width character has no character of its own
+        self.character[posy, start:end] = [character if character else " " for character in characters]
+        self.fg[posy, start:end] = fg
+        self.attr[posy, start:end] = attr
+        self.bg[posy, start:end] = bg
+
+    def row_text(self, posy: int, start: int = 0, end: int = None) -> str:
+        """ Get the characters of a row (or of a slice of it) as a single string """
+        row = np.ascontiguousarray(self.character[posy, start:end])
+        return row.tobytes().decode("utf-32-le")
+
+    def row_runs(self, posy: int, start: int = 0, end: int = None) -> list[tuple[str, int, int, int, int]]:
+        """
+        Split a row into runs of cells sharing the same fg, attr and bg
+        :param posy: The row to split
+        :param start: The first column to take into account
+        :param end: The column after the last one to take into account
+        :return: a list of (text, offset, fg, attr, bg) tuples where the offset is relative to the start of the buffer
+        """
+        if end is None:
+            end = self.width
+        if start >= end:
+            return []
+        fg = self.fg[posy, start:end]
+        attr = self.attr[posy, start:end]
+        bg = self.bg[posy, start:end]
+        changes = np.flatnonzero(
+            (fg[1:] != fg[:-1]) | (attr[1:] != attr[:-1]) | (bg[1:] != bg[:-1])
+        ) + 1
+        text = self.row_text(posy, start, end)
+        bounds = [0, *changes.tolist(), end - start]
+        runs = []
+        for index in range(len(bounds) - 1):
+            run_start = bounds[index]
+            runs.append(
+                (
+                    text[run_start:bounds[index + 1]],
+                    start + run_start,
+                    int(fg[run_start]),
+                    int(attr[run_start]),
+                    int(bg[run_start])
+                )
+            )
+        return runs
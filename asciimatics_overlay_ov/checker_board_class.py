@@ -0,0 +1,115 @@
+"""
+File in charge of precomputing the layout of the checker boards drawn by the Display class
+"""
+
+from functools import lru_cache
+
+
+class CheckerBoard:
+    """
+    The class in charge of precomputing the layout of a checker board
+    The borders (column letters, separator line and row numbers) and the colour runs of each row are computed once,
+    drawing the board then only costs one print_at per border line and one per colour run.
+    All the positions are relative to the top left corner of the board.
+    """
+
+    alphabet: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    empty_cell: str = "."
+
+    def __init__(self, width: int, height: int, seperator_character_vertical: str = "|", seperator_character_horizontal: str = "-", add_spacing: bool = True) -> None:
+        self.width: int = max(width, 0)
+        self.height: int = max(height, 0)
+        self.seperator_character_vertical: str = seperator_character_vertical
+        self.seperator_character_horizontal: str = seperator_character_horizontal
+        self.cell_width: int = 2 if add_spacing is True else 1
+        self.label_width: int = len(str(max(self.height - 1, 0)))
+        self.board_posx: int = self.label_width + 1
+        self.board_posy: int = 2
+        self.borders: list[tuple[str, int, int]] = self._create_borders()
+        self.row_runs: tuple[list, list] = (
+            self._create_row_runs(0),
+            self._create_row_runs(1)
+        )
+        self.single_run: list[tuple[int, int, int]] = [
+            (0, self.width * self.cell_width, 0)
+        ]
+        self.empty_row: str = self._create_row_text([])
+
+    def _column_label(self, column: int) -> str:
+        """ Get the label of a column, letters first and then numbers """
+        if column < len(self.alphabet):
+            label = self.alphabet[column]
+        else:
+            label = str(column)
+        return label[-self.cell_width:].ljust(self.cell_width)
+
+    def _create_borders(self) -> list[tuple[str, int, int]]:
+        """ Create the lines of the border as (text, posx, posy) tuples """
+        borders = [
+            (
+                "".join(self._column_label(column) for column in range(self.width)),
+                self.board_posx,
+                0
+            ),
+            (
+                self.seperator_character_horizontal * (self.width * self.cell_width),
+                self.board_posx,
+                1
+            )
+        ]
+        for row in range(self.height):
+            borders.append(
+                (
+                    f"{str(row).rjust(self.label_width)}{self.seperator_character_vertical}",
+                    0,
+                    self.board_posy + row
+                )
+            )
+        return borders
+
+    def _create_row_runs(self, parity: int) -> list[tuple[int, int, int]]:
+        """
+        Create the colour runs of a row
+        :param parity: 0 for the rows starting with an even cell, 1 for the others
+        :return: a list of (start, end, style) tuples, style being 0 for the even cells and 1 for the uneven ones
+        """
+        return [
+            (
+                column * self.cell_width,
+                (column + 1) * self.cell_width,
+                (column + parity) % 2
+            )
+            for column in range(self.width)
+        ]
+
+    def _create_row_text(self, data_row: list) -> str:
+        """ Create the text of a row from the content of its cells """
+        padding = " " * (self.cell_width - 1)
+        cells = []
+        for column in range(self.width):
+            character = self.empty_cell
+            if column < len(data_row):
+                cell = data_row[column]
+                if isinstance(cell, (str, list, tuple)) and len(cell) > 0:
+                    cell = cell[0]
+                character = f"{cell}"[:1] or self.empty_cell
+            cells.append(character + padding)
+        return "".join(cells)
+
+    def row_text(self, data_array: list, row: int) -> str:
+        """ Get the text of a row of the board """
+        if row >= len(data_array) or len(data_array[row]) == 0:
+            return self.empty_row
+        return self._create_row_text(data_array[row])
+
+
+@lru_cache(maxsize=32)
+def get_checker_board(width: int, height: int, seperator_character_vertical: str = "|", seperator_character_horizontal: str = "-", add_spacing: bool = True) -> CheckerBoard:
+    """ Get the (cached) layout of a checker board """
+    return CheckerBoard(
+        width,
+        height,
+        seperator_character_vertical,
+        seperator_character_horizontal,
+        add_spacing
+    )
@@ -2,25 +2,289 @@
 File in charge of managing the colours for asciimatics
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
+COLOUR_DEFAULT: int = -1
+COLOUR_BLACK: int = 0
+COLOUR_RED: int = 1
+COLOUR_GREEN: int = 2
+COLOUR_YELLOW: int = 3
+COLOUR_BLUE: int = 4
+COLOUR_MAGENTA: int = 5
+COLOUR_CYAN: int = 6
+COLOUR_WHITE: int = 7
+
+LINUX_BIND: MappingProxyType = MappingProxyType({
+    "default": COLOUR_DEFAULT,
+    "0": COLOUR_DEFAULT,
+    "00": COLOUR_DEFAULT,
+    "30": COLOUR_BLACK,
+    "34": COLOUR_BLUE,
+    "32": COLOUR_GREEN,
+    "36": COLOUR_CYAN,
+    "31": COLOUR_RED,
+    "35": COLOUR_MAGENTA,
+    "33": COLOUR_YELLOW,
+    "37": COLOUR_WHITE,
+    "90": COLOUR_BLACK,
+    "94": COLOUR_BLUE,
+    "92": COLOUR_GREEN,
+    "96": COLOUR_CYAN,
+    "91": COLOUR_RED,
+    "95": COLOUR_MAGENTA,
+    "93": COLOUR_YELLOW,
+    "97": COLOUR_WHITE
+})
+
+WINDOWS_BIND: MappingProxyType = MappingProxyType({
+    "default": COLOUR_DEFAULT,
+    "0": COLOUR_BLACK,
+    "1": COLOUR_BLUE,
+    "2": COLOUR_GREEN,
+    "3": COLOUR_CYAN,
+    "4": COLOUR_RED,
+    "5": COLOUR_MAGENTA,
+    "6": COLOUR_YELLOW,
+    "7": COLOUR_WHITE,
+    "8": COLOUR_BLACK,
+    "9": COLOUR_BLUE,
+    "A": COLOUR_GREEN,
+    "B": COLOUR_CYAN,
+    "C": COLOUR_RED,
+    "D": COLOUR_MAGENTA,
+    "E": COLOUR_YELLOW,
+    "F": COLOUR_WHITE
+})
+
+HUMAN_BIND: MappingProxyType = MappingProxyType({
+    "default": COLOUR_DEFAULT,
+    "black": COLOUR_BLACK,
+    "blue": COLOUR_BLUE,
+    "green": COLOUR_GREEN,
+    "cyan": COLOUR_CYAN,
+    "red": COLOUR_RED,
+    "magenta": COLOUR_MAGENTA,
+    "yellow": COLOUR_YELLOW,
+    "white": COLOUR_WHITE
+})
+
+# The binds are merged so that the human bind wins over the windows one, which wins over the linux one.
+# This is the order in which pick_colour used to probe them.
+COLOUR_LOOKUP: MappingProxyType = MappingProxyType(
+    {**LINUX_BIND, **WINDOWS_BIND, **HUMAN_BIND}
+)
+
+
+class _BindDict(dict):
+    """ A bind of a Colour instance, dropping the merged lookup table of its owner whenever it is modified """
+
+    def __init__(self, values: dict, on_change) -> None:
+        super().__init__(values)
+        self._on_change = on_change
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._on_change()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._on_change()
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_change()
+
+
+def resolve_colour(colour_name: str) -> int:
+    """
+    Get the asciimatics colour matching a human, windows or linux colour name
+    This function has no side effect: it is a single lookup in the merged table of the default binds.
+    Colour.pick_colour also honours the changes made to the binds of an instance.
+    :param colour_name: The name of the colour
+    :return: The colour, or the default colour (-1) when the name is unknown
+    """
+    colour = COLOUR_LOOKUP.get(colour_name)
+    if colour is None:
+        return HUMAN_BIND["default"]
+    return colour
+
+
+def _create_xterm_palette() -> tuple[tuple[int, int, int], ...]:
+    """ Create the RGB values of the 256 xterm colours (16 system colours, 6x6x6 cube, 24 greys) """
+    palette = [
+        (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+        (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+        (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+        (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)
+    ]
+    steps = (0, 95, 135, 175, 215, 255)
+    for red in steps:
+        for green in steps:
+            for blue in steps:
+                palette.append((red, green, blue))
+    for grey in range(24):
+        level = 8 + grey * 10
+        palette.append((level, level, level))
+    return tuple(palette)
+
+
+XTERM_PALETTE: tuple[tuple[int, int, int], ...] = _create_xterm_palette()
+# The 8 basic colours use the asciimatics numbering (black, red, green, yellow, blue, magenta, cyan, white).
+BASIC_PALETTE: tuple[tuple[int, int, int], ...] = XTERM_PALETTE[:8]
+# In 256 colours mode, the 16 system colours are skipped because every terminal theme redefines them.
+EXTENDED_PALETTE_START: int = 16
+
+
+def _palette_range(colours: int) -> tuple[int, int]:
+    """ Get the first and last (excluded) index of the palette usable on a screen with this number of colours """
+    if colours >= 256:
+        return (EXTENDED_PALETTE_START, 256)
+    return (0, len(BASIC_PALETTE))
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_colour(red: int, green: int, blue: int, colours: int = 256) -> int:
+    """
+    Get the palette index that is the nearest to an RGB colour (the results are cached)
+    :param red: The red component (0-255)
+    :param green: The green component (0-255)
+    :param blue: The blue component (0-255)
+    :param colours: The number of colours of the screen (screen.colours), the 8 basic colours are used under 256
+    :return: the index of the nearest colour
+    """
+    start, end = _palette_range(colours)
+    best_index = start
+    best_distance = None
+    for index in range(start, end):
+        pal_red, pal_green, pal_blue = XTERM_PALETTE[index]
+        distance = (red - pal_red) ** 2 + (green - pal_green) ** 2 + (blue - pal_blue) ** 2
+        if best_distance is None or distance < best_distance:
+            best_index = index
+            best_distance = distance
+    return best_index
+
+
+def hex_to_colour(hex_colour: str, colours: int = 256) -> int:
+    """
+    Get the palette index that is the nearest to a hexadecimal colour
+    :param hex_colour: The colour, in the '#rrggbb' or '#rgb' format (the '#' is optional)
+    :param colours: The number of colours of the screen (screen.colours)
+    :return: the index of the nearest colour
+    """
+    value = hex_colour.strip().lstrip("#")
+    if len(value) == 3:
+        value = "".join(character * 2 for character in value)
+    if len(value) != 6:
+        raise ValueError(f"Invalid hexadecimal colour: '{hex_colour}'")
+    return rgb_to_colour(
+        int(value[0:2], 16),
+        int(value[2:4], 16),
+        int(value[4:6], 16),
+        colours
+    )
+
+
+def xterm_to_colour(xterm_colour: int, colours: int = 256) -> int:
+    """
+    Get a colour from its xterm-256 index, downgraded to the nearest basic colour when the screen has less than 256 colours
+    :param xterm_colour: The xterm index (0-255)
+    :param colours: The number of colours of the screen (screen.colours)
+    :return: the index of the colour usable on the screen
+    """
+    if xterm_colour < 0 or xterm_colour > 255:
+        raise ValueError(f"Invalid xterm colour: '{xterm_colour}'")
+    if colours >= 256:
+        return xterm_colour
+    return rgb_to_colour(*XTERM_PALETTE[xterm_colour], colours)
+
+
+# The number of distinct colours whose distances to the palette are computed at once
+_QUANTISATION_CHUNK: int = 4096
+
+
+@lru_cache(maxsize=4)
+def _palette_array(colours: int) -> object:
+    """ Get the palette usable on a screen with this number of colours as a NumPy array """
+    # NumPy is only imported when frames are quantised so that importing the colours stays cheap
+    import numpy as np
+    start, end = _palette_range(colours)
+    return np.array(XTERM_PALETTE[start:end], dtype=np.int32)
+
+
+def quantise_rgb_array(rgb: object, colours: int = 256) -> object:
+    """
+    Convert a whole image of RGB values to palette indexes in a single vectorised pass
+    The result is the exact nearest colour (the one rgb_to_colour gives), each distinct colour of the image being computed once.
+    :param rgb: A NumPy array of shape (..., 3) containing 0-255 values
+    :param colours: The number of colours of the screen (screen.colours)
+    :return: a NumPy int16 array of shape (...) that can be used as the fg or bg plane of a CellBuffer
+    """
+    import numpy as np
+    rgb = np.asarray(rgb)
+    if rgb.shape[-1] != 3:
+        raise ValueError("The last dimension of the array must hold the red, green and blue components")
+    start, _ = _palette_range(colours)
+    palette = _palette_array(256 if colours >= 256 else 8)
+    samples = np.clip(rgb, 0, 255).astype(np.int32)
+    packed = (samples[..., 0] << 16) | (samples[..., 1] << 8) | samples[..., 2]
+    unique, inverse = np.unique(packed.ravel(), return_inverse=True)
+    unique_rgb = np.stack((unique >> 16, (unique >> 8) & 0xFF, unique & 0xFF), axis=-1)
+    indexes = np.empty(len(unique), dtype=np.int16)
+    # |colour - palette|² without the |colour|² term, which is the same for the whole row (exact integer arithmetic)
+    palette_norms = (palette ** 2).sum(axis=-1)
+    # By chunks, to keep the distance matrix small; argmin keeps the first palette colour on ties, like rgb_to_colour
+    for first in range(0, len(unique), _QUANTISATION_CHUNK):
+        chunk = unique_rgb[first:first + _QUANTISATION_CHUNK]
+        distances = palette_norms[np.newaxis, :] - 2 * (chunk @ palette.T)
+        indexes[first:first + _QUANTISATION_CHUNK] = distances.argmin(axis=-1) + start
+    return indexes[inverse].reshape(packed.shape)
+
 
 class Colour:
     """ The class in charge of managing the colours for asciimatics """
 
     your_selected_colour = 0
+    colour_lookup: MappingProxyType = COLOUR_LOOKUP
 
     def __init__(self, colour_name: str = None) -> None:
+        self._colour_lookup: dict = None
         self.windows_bind: dict = {}
         self.linux_bind: dict = {}
         self.human_bind: dict = {}
-        self.colour_default: int = -1
-        self.colour_black: int = 0
-        self.colour_red: int = 1
-        self.colour_green: int = 2
-        self.colour_yellow: int = 3
-        self.colour_blue: int = 4
-        self.colour_magenta: int = 5
-        self.colour_cyan: int = 6
-        self.colour_white: int = 7
+        self.colour_default: int = COLOUR_DEFAULT
+        self.colour_black: int = COLOUR_BLACK
+        self.colour_red: int = COLOUR_RED
+        self.colour_green: int = COLOUR_GREEN
+        self.colour_yellow: int = COLOUR_YELLOW
+        self.colour_blue: int = COLOUR_BLUE
+        self.colour_magenta: int = COLOUR_MAGENTA
+        self.colour_cyan: int = COLOUR_CYAN
+        self.colour_white: int = COLOUR_WHITE
         self._create_windows_bind()
         self._create_linux_bind()
         self._create_human_bind()
@@ -30,74 +294,96 @@ class Colour:
 
     def _create_linux_bind(self) -> None:
         """ Create the linux bind """
-        self.linux_bind = {
-            "default": self.colour_default,
-            "0": self.colour_default,
-            "00": self.colour_default,
-            "30": self.colour_black,
-            "34": self.colour_blue,
-            "32": self.colour_green,
-            "36": self.colour_cyan,
-            "31": self.colour_red,
-            "35": self.colour_magenta,
-            "33": self.colour_yellow,
-            "37": self.colour_white,
-            "90": self.colour_black,
-            "94": self.colour_blue,
-            "92": self.colour_green,
-            "96": self.colour_cyan,
-            "91": self.colour_red,
-            "95": self.colour_magenta,
-            "93": self.colour_yellow,
-            "97": self.colour_white
-        }
+        self.linux_bind = dict(LINUX_BIND)
 
     def _create_windows_bind(self) -> None:
         """ Create the windows bind """
-        self.windows_bind = {
-            "default": -1,
-            "0": self.colour_black,
-            "1": self.colour_blue,
-            "2": self.colour_green,
-            "3": self.colour_cyan,
-            "4": self.colour_red,
-            "5": self.colour_magenta,
-            "6": self.colour_yellow,
-            "7": self.colour_white,
-            "8": self.colour_black,
-            "9": self.colour_blue,
-            "A": self.colour_green,
-            "B": self.colour_cyan,
-            "C": self.colour_red,
-            "D": self.colour_magenta,
-            "E": self.colour_yellow,
-            "F": self.colour_white
-        }
+        self.windows_bind = dict(WINDOWS_BIND)
 
     def _create_human_bind(self) -> None:
         """ Create the human bind """
-        self.human_bind = {
-            "default": self.colour_default,
-            "black": self.colour_black,
-            "blue": self.colour_blue,
-            "green": self.colour_green,
-            "cyan": self.colour_cyan,
-            "red": self.colour_red,
-            "magenta": self.colour_magenta,
-            "yellow": self.colour_yellow,
-            "white": self.colour_white
-        }
+        self.human_bind = dict(HUMAN_BIND)
+
+    @property
+    def linux_bind(self) -> dict:
+        """ The linux bind, modifying it rebuilds the merged lookup table """
+        return self._linux_bind
+
+    @linux_bind.setter
+    def linux_bind(self, bind: dict) -> None:
+        self._linux_bind = _BindDict(bind, self._drop_colour_lookup)
+        self._drop_colour_lookup()
+
+    @property
+    def windows_bind(self) -> dict:
+        """ The windows bind, modifying it rebuilds the merged lookup table """
+        return self._windows_bind
+
+    @windows_bind.setter
+    def windows_bind(self, bind: dict) -> None:
+        self._windows_bind = _BindDict(bind, self._drop_colour_lookup)
+        self._drop_colour_lookup()
+
+    @property
+    def human_bind(self) -> dict:
+        """ The human bind, modifying it rebuilds the merged lookup table """
+        return self._human_bind
+
+    @human_bind.setter
+    def human_bind(self, bind: dict) -> None:
+        self._human_bind = _BindDict(bind, self._drop_colour_lookup)
+        self._drop_colour_lookup()
+
+    def _drop_colour_lookup(self) -> None:
+        """ Drop the merged lookup table, it is rebuilt by the next pick_colour """
+        self._colour_lookup = None
 
     def pick_colour(self, colour_name: str) -> int:
-        """ Pick a colour from the human bind """
-        if colour_name in self.human_bind:
-            self.your_selected_colour = self.human_bind[colour_name]
-            return self.your_selected_colour
-        if colour_name in self.windows_bind:
-            self.your_selected_colour = self.windows_bind[colour_name]
-            return self.your_selected_colour
-        if colour_name in self.linux_bind:
-            self.your_selected_colour = self.linux_bind[colour_name]
-            return self.your_selected_colour
-        self.your_selected_colour = self.human_bind["default"]
+        """
+        Pick a colour from the human, windows or linux bind
+        The binds are merged in one lookup table per instance, rebuilt after a bind has been modified.
+        The result is also stored in your_selected_colour, use resolve_colour for a lookup without side effects.
+        """
+        lookup = self._colour_lookup
+        if lookup is None:
+            lookup = self._colour_lookup = {**self.linux_bind, **self.windows_bind, **self.human_bind}
+        colour = lookup.get(colour_name)
+        if colour is None:
+            colour = self.human_bind["default"]
+        self.your_selected_colour = colour
         return self.your_selected_colour
+
+    def _screen_colours(self, colours: int = None) -> int:
+        """ Get the number of colours to target, read from the bound screen when not provided """
+        if colours is not None:
+            return colours
+        screen = getattr(self, "my_asciimatics_overlay_main_screen", None)
+        return getattr(screen, "colours", 8)
+
+    def pick_rgb_colour(self, red: int, green: int, blue: int, colours: int = None) -> int:
+        """
+        Pick the colour that is the nearest to an RGB value
+        :param colours: The number of colours to target, screen.colours of the bound screen is used when None (8 when there is no screen)
+        """
+        return rgb_to_colour(red, green, blue, self._screen_colours(colours))
+
+    def pick_hex_colour(self, hex_colour: str, colours: int = None) -> int:
+        """
+        Pick the colour that is the nearest to a '#rrggbb' or '#rgb' value
+        :param colours: The number of colours to target, screen.colours of the bound screen is used when None (8 when there is no screen)
+        """
+        return hex_to_colour(hex_colour, self._screen_colours(colours))
+
+    def pick_xterm_colour(self, xterm_colour: int, colours: int = None) -> int:
+        """
+        Pick an xterm-256 colour, downgraded to the basic colours when the screen does not support 256 colours
+        :param colours: The number of colours to target, screen.colours of the bound screen is used when None (8 when there is no screen)
+        """
+        return xterm_to_colour(xterm_colour, self._screen_colours(colours))
+
+    def quantise_rgb_array(self, rgb: object, colours: int = None) -> object:
+        """
+        Convert a NumPy array of shape (..., 3) of RGB values to colours in a single vectorised pass
+        :param colours: The number of colours to target, screen.colours of the bound screen is used when None (8 when there is no screen)
+        """
+        return quantise_rgb_array(rgb, self._screen_colours(colours))
@@ -0,0 +1,123 @@
+"""
+File in charge of debouncing, throttling and moving the on_change callbacks of the widgets off the UI thread
+"""
+
+import threading
+from concurrent.futures import Executor, Future
+from time import perf_counter
+from .logger_class import LOGGER
+from .ui_command_queue_class import UiCommandQueue
+
+
+class DeferredCallback:
+    """
+    The class in charge of wrapping a widget callback so that it runs after the changes settle instead of on every change
+    With a debounce, the callback runs once no change happened for the debounce delay. With a throttle, it runs at most once per throttle delay
+    (the last change of a burst is never lost). With an executor, the callback runs in the executor and its return value is given to on_result on the UI thread.
+    Every change supersedes the previous ones: a pending call is cancelled and the results of the superseded calls are dropped.
+    The timers and the executor only submit commands to the UiCommandQueue, which must be drained by the UI thread once per frame:
+    once a widget is attached, the queue is drained by the update of its Frame (the FrameNodes factories attach the widgets they create).
+    """
+
+    def __init__(self, callback: object, debounce: float = 0, throttle: float = 0, executor: Executor = None, on_result: object = None, queue: UiCommandQueue = None, clock: object = perf_counter, timer_factory: object = threading.Timer) -> None:
+        """
+        :param callback: The function to call (without arguments, like the asciimatics on_change), it must not modify the widgets when an executor is used
+        :param debounce: The delay without change before the callback runs, in seconds
+        :param throttle: The minimum delay between two runs of the callback, in seconds
+        :param executor: Optional executor running the callback
+        :param on_result: Optional function called on the UI thread with the return value of the callback
+        :param queue: The queue the deferred calls and the results are passed through to the UI thread
+        :param clock: The monotonic clock used for the throttle, in seconds
+        :param timer_factory: The function creating the timers, with the threading.Timer signature
+        """
+        self.callback: object = callback
+        self.debounce: float = max(debounce, 0)
+        self.throttle: float = max(throttle, 0)
+        self.executor: Executor = executor
+        self.on_result: object = on_result
+        self.queue: UiCommandQueue = queue if queue is not None else UiCommandQueue()
+        self.clock: object = clock
+        self.timer_factory: object = timer_factory
+        self.generation: int = 0
+        self.run_count: int = 0
+        self.stale_count: int = 0
+        self._last_run: float = None
+        self._timer: threading.Timer = None
+        self._future: Future = None
+        self.widget: object = None
+        self._drained_frame: object = None
+
+    def attach_widget(self, widget: object) -> object:
+        """
+        Drain the queue from the Frame of the widget calling this callback
+        The widget is usually not in a frame yet: the queue is attached to its frame (UiCommandQueue.attach_frame) on the first change.
+        :return: The widget
+        """
+        self.widget = widget
+        return widget
+
+    def __call__(self) -> None:
+        """ Signal a change, this must be called from the UI thread (the widgets do it) """
+        if self.widget is not None and self.widget.frame is not self._drained_frame:
+            self._drained_frame = self.widget.frame
+            if self._drained_frame is not None:
+                self.queue.attach_frame(self._drained_frame)
+        self.cancel()
+        generation = self.generation
+        delay = self.debounce
+        if self.throttle > 0 and self._last_run is not None:
+            delay = max(delay, self._last_run + self.throttle - self.clock())
+        if delay <= 0:
+            self._start(generation)
+            return
+        self._timer = self.timer_factory(delay, self._expire, (generation,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """ Cancel the pending call, the result of the running one is dropped """
+        self.generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def _expire(self, generation: int) -> None:
+        """ The end of the delay (in the timer thread), the call is passed to the UI thread """
+        if generation == self.generation:
+            self.queue.call_soon_threadsafe(self._start, generation, key=(self, "start"))
+
+    def _start(self, generation: int) -> None:
+        """ Run the callback, or submit it to the executor (on the UI thread) """
+        if generation != self.generation:
+            self.stale_count += 1
+            return
+        self._timer = None
+        self._last_run = self.clock()
+        self.run_count += 1
+        if self.executor is None:
+            result = self.callback()
+            if self.on_result is not None:
+                self.on_result(result)
+            return
+        self._future = self.executor.submit(self.callback)
+        self._future.add_done_callback(
+            lambda future: self.queue.call_soon_threadsafe(
+                self._deliver, generation, future, key=(self, "result")
+            )
+        )
+
+    def _deliver(self, generation: int, future: Future) -> None:
+        """ Give the result of the executor to on_result (on the UI thread), unless a newer change superseded it """
+        if generation != self.generation or future.cancelled() is True:
+            self.stale_count += 1
+            return
+        self._future = None
+        error = future.exception()
+        if error is not None:
+            LOGGER.error("DeferredCallback: the callback %r failed: %r", self.callback, error)
+            return
+        if self.on_result is not None:
+            self.on_result(future.result())
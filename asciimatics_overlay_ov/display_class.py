@@ -2,15 +2,195 @@
 File in charge of displaying content on the screen
 """
 
+import sys
+import logging
+from functools import wraps
+from inspect import signature
+from typing import TYPE_CHECKING
 from asciimatics.screen import Screen as SC
+from .checker_board_class import get_checker_board
+from .logger_class import LOGGER
+
+# The buffers need NumPy, they are only imported by the code creating them
+if TYPE_CHECKING:
+    from .cell_buffer_class import CellBuffer
+    from .layer_compositor_class import LayerCompositor
+
+
+class _FrameDiffRecorder:
+    """ The class in charge of collecting the print_at calls of a region, grouped by row """
+
+    def __init__(self, screen: SC) -> None:
+        self.screen: SC = screen
+        self.width: int = screen.width
+        self.height: int = screen.height
+        self._start_line: int = getattr(screen, "_start_line", 0)
+        self.rows: dict = {}
+
+    def print_at(self, text: str, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """ Record a print_at call """
+        self.rows.setdefault(y, []).append(
+            (text, x, y, colour, attr, bg, transparent)
+        )
+
+    def flush(self, previous_rows: dict) -> dict:
+        """
+        Send the rows that changed since the previous frame to the screen
+        :param previous_rows: The rows recorded for this region during the previous frame
+        :return: The rows of the current frame
+        """
+        print_at = self.screen.print_at
+        for posy, calls in self.rows.items():
+            calls = tuple(calls)
+            self.rows[posy] = calls
+            if previous_rows.get(posy) == calls:
+                continue
+            for call in calls:
+                print_at(*call)
+        return self.rows
+
+
+def _clip_text(text: str, posx: int, posy: int, rectangle: tuple[int, int, int, int]) -> tuple[str, int]:
+    """
+    Clip a text to a rectangle, every character is considered to be single width
+    :param rectangle: The (left, top, right, bottom) visible area, right and bottom being excluded
+    :return: the visible (text, posx), or None when nothing is visible
+    """
+    left, top, right, bottom = rectangle
+    if posy < top or posy >= bottom or posx >= right:
+        return None
+    text = f"{text}"
+    end = posx + len(text)
+    if posx >= left and end <= right:
+        return text, posx
+    if end <= left:
+        return None
+    start = max(left - posx, 0)
+    return text[start:right - posx], posx + start
+
+
+# The code of the wrappers standing between a Display method and its caller (the measured methods of the instrumentation), skipped to find the call site
+_CALL_SITE_SKIPPED_CODES: set = set()
+
+
+def _frame_diffed(function: object) -> object:
+    """
+    Route the print_at calls of a Display method through the frame diff layer when it is enabled
+    The region is identified by the 'region_id' keyword argument, or by the call site when it is not provided.
+    """
+    parent_screen_index = list(signature(function).parameters).index(
+        "parent_screen"
+    ) - 1
+
+    @wraps(function)
+    def wrapper(self, *args, region_id: str = None, **kwargs) -> None:
+        if self.frame_diff_enabled is False or self._frame_diff_active is True:
+            return function(self, *args, **kwargs)
+        if region_id is None:
+            caller = sys._getframe(1)
+            while caller.f_code in _CALL_SITE_SKIPPED_CODES:
+                caller = caller.f_back
+            region_id = (caller.f_code.co_filename, caller.f_lineno)
+        if len(args) > parent_screen_index:
+            parent_screen = args[parent_screen_index]
+        else:
+            parent_screen = kwargs.get("parent_screen")
+        if parent_screen is None:
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        recorder = _FrameDiffRecorder(parent_screen)
+        if len(args) > parent_screen_index:
+            args = list(args)
+            args[parent_screen_index] = recorder
+        else:
+            kwargs["parent_screen"] = recorder
+        self._frame_diff_active = True
+        try:
+            result = function(self, *args, **kwargs)
+        finally:
+            self._frame_diff_active = False
+        key = (region_id, id(parent_screen))
+        self._frame_diff_cache[key] = recorder.flush(
+            self._frame_diff_cache.get(key, {})
+        )
+        return result
+    return wrapper
 
 
 class Display:
     """ Class in charge of displaying content on the screen """
 
+    frame_diff_enabled: bool = False
+    _frame_diff_active: bool = False
+    viewport: tuple[int, int, int, int] = None
+
     def __init__(self, screen: SC) -> None:
         self.my_asciimatics_overlay_main_screen: SC = screen
+        self._frame_diff_cache: dict = {}
+
+    def enable_frame_diff(self) -> None:
+        """
+        Only send the rows that changed since the previous frame to the screen
+        Every display method then accepts an optional 'region_id' keyword argument identifying the region it draws.
+        When it is not provided, the call site is used as the region identifier.
+        Call reset_frame_diff whenever the screen is modified by something else (clearing, other widgets, ...).
+        """
+        self._frame_diff_cache = {}
+        self.frame_diff_enabled = True
+
+    def disable_frame_diff(self) -> None:
+        """ Send every row to the screen again """
+        self.frame_diff_enabled = False
+        self._frame_diff_cache = {}
+
+    def reset_frame_diff(self, region_id: str = None) -> None:
+        """
+        Forget the content remembered for a region (or for all of them) so that it is fully redrawn on the next call
+        :param region_id: The region to forget, all of them are forgotten when None
+        """
+        if region_id is None:
+            self._frame_diff_cache = {}
+            return
+        for key in list(self._frame_diff_cache):
+            if key[0] == region_id:
+                del self._frame_diff_cache[key]
+
+    def set_viewport(self, posx: int, posy: int, width: int, height: int) -> None:
+        """
+        Restrict the cloud points and the colour arrays to a rectangle of the screen
+        The points outside of it are dropped and the texts crossing its edges are trimmed before print_at is called.
+        :param posx: The column of the top left corner of the viewport
+        :param posy: The row of the top left corner of the viewport
+        :param width: The width of the viewport
+        :param height: The height of the viewport
+        """
+        self.viewport = (posx, posy, width, height)
+
+    def clear_viewport(self) -> None:
+        """ Only clip to the dimensions of the screen again """
+        self.viewport = None
+
+    def _get_clip_rectangle(self, target: SC, viewport: tuple[int, int, int, int] = None) -> tuple[int, int, int, int]:
+        """
+        Get the area of the target that is visible, intersected with the viewport
+        :param target: The screen (or canvas) drawn on
+        :param viewport: The (posx, posy, width, height) viewport, the one set with set_viewport when None
+        :return: the (left, top, right, bottom) rectangle, right and bottom being excluded
+        """
+        top = getattr(target, "_start_line", 0)
+        right = getattr(target, "width", sys.maxsize)
+        bottom = top + getattr(target, "height", sys.maxsize - top)
+        left = 0
+        if viewport is None:
+            viewport = self.viewport
+        if viewport is not None:
+            posx, posy, width, height = viewport
+            left = max(left, posx)
+            top = max(top, posy)
+            right = min(right, posx + width)
+            bottom = min(bottom, posy + height)
+        return left, top, right, bottom
 
+    @_frame_diffed
     def mvprintw(self, text: str, posx: int, posy: int, width: int = 0, parent_screen: SC = None) -> None:
         """ Display a string at a specific location """
         if parent_screen is None:
@@ -28,6 +208,7 @@ class Display:
                 width
             )
 
+    @_frame_diffed
     def mvprintw_colour(self, text: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
         """ Display a string at a specific location with a specific colour """
         if parent_screen is None:
@@ -51,6 +232,7 @@ class Display:
                 transparent
             )
 
+    @_frame_diffed
     def print_array(self, array: list, seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
         """ Display an array at a specific location with a specific colour """
         if parent_screen is None:
@@ -74,62 +256,97 @@ class Display:
                 transparent
             )
 
-    def print_array_colour(self, array: list[dict], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
-        """ Display an array at a specific location with a specific colour """
-        display_function = None
+    @_frame_diffed
+    def print_array_colour(self, array: list[dict], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display an array at a specific location with a specific colour
+        Every item is a dictionary containing a 'text', it is drawn at posx + its index on the posy line with the given colours,
+        these values (and the seperator) are written into the item before it is drawn.
+        The items outside of the screen (or of the viewport) are dropped and the ones crossing its edges are trimmed.
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
         if parent_screen is None:
-            display_function = self.my_asciimatics_overlay_main_screen.print_at
-        else:
-            display_function = parent_screen.print_at
-        default_list = {
-            "seperator": seperator,
-            "posx": posx,
-            "posy": posy,
-            "colour": colour,
-            "attr": attr,
-            "bg": bg,
-            "transparent": transparent
-        }
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        display_function = parent_screen.print_at
+        rectangle = self._get_clip_rectangle(parent_screen, viewport)
         for index, item in enumerate(array):
-            for key, value in default_list.items():
-                if hasattr(item, key) is False and key == "posx":
-                    item[key] = posx + index
-                if hasattr(item, key) is False:
-                    item[key] = value
-            display_function(
-                item["text"],
-                item["posx"],
-                item["posy"],
-                item["colour"],
-                item["attr"],
-                item["bg"],
-                item["transparent"]
+            item.update(
+                seperator=seperator,
+                posx=posx + index,
+                posy=posy,
+                colour=colour,
+                attr=attr,
+                bg=bg,
+                transparent=transparent
             )
+            clipped = _clip_text(item["text"], item["posx"], posy, rectangle)
+            if clipped is None:
+                continue
+            display_function(clipped[0], clipped[1], posy, colour, attr, bg, transparent)
 
-    def print_double_array(self, array: list[list], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
-        """ Display a double array at a specific location with a specific colour """
-        display_function = None
+    @_frame_diffed
+    def print_double_array(self, array: list[list], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display a double array at a specific location with a specific colour
+        Each row is joined with the seperator and displayed on its own line, only the visible rows are joined.
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
         if parent_screen is None:
-            display_function = self.my_asciimatics_overlay_main_screen.print_at
-        else:
-            display_function = parent_screen.print_at
-
-        result = ""
-        for i in array:
-            result += seperator.join(i)
-            result += "\n"
-        display_function(
-            result,
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        _, top, _, bottom = self._get_clip_rectangle(parent_screen, viewport)
+        first = max(top - posy, 0)
+        rows = [
+            seperator.join(row)
+            for row in array[first:max(bottom - posy, first)]
+        ]
+        self.print_block(
+            rows,
             posx,
-            posy,
+            posy + first,
             colour,
             attr,
             bg,
-            transparent
+            transparent,
+            parent_screen,
+            viewport
         )
 
-    def print_double_array_colour(self, array: list[list[dict]], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
-        """ Display a double array at a specific location with a specific colour """
+    @_frame_diffed
+    def print_block(self, rows: list[str], posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display a block of precomputed lines, one print_at per visible line
+        The lines outside of the screen (or of the viewport) are skipped without being read and the others are trimmed to it.
+        :param rows: The lines of the block, from top to bottom
+        :param posx: The column of the top left corner of the block
+        :param posy: The row of the top left corner of the block
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
+        if parent_screen is None:
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        display_function = parent_screen.print_at
+        rectangle = self._get_clip_rectangle(parent_screen, viewport)
+        first = max(rectangle[1] - posy, 0)
+        last = min(rectangle[3] - posy, len(rows))
+        for index in range(first, last):
+            clipped = _clip_text(rows[index], posx, posy + index, rectangle)
+            if clipped is None:
+                continue
+            display_function(
+                clipped[0],
+                clipped[1],
+                posy + index,
+                colour,
+                attr,
+                bg,
+                transparent
+            )
+
+    @_frame_diffed
+    def print_double_array_colour(self, array: list[list[dict]], seperator: str, posx: int, posy: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display a double array at a specific location with a specific colour
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
         for index, item in enumerate(array):
             self.print_array_colour(
                 item,
@@ -140,230 +357,261 @@ class Display:
                 attr,
                 bg,
                 transparent,
-                parent_screen
+                parent_screen,
+                viewport
             )
 
-    def print_array_cloud_points(self, array: list[dict], iposx: int = 0, iposy: int = 0, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
-        """ Display a double array at a specific location with a specific colour """
-        display_function = None
-        if parent_screen is None:
-            display_function = self.my_asciimatics_overlay_main_screen.print_at
-        else:
-            display_function = parent_screen.print_at
-        new_posx = 0
-        new_posy = 0
-        new_character = ""
-        new_colour = colour
-        new_attr = attr
-        new_bg = bg
-        new_transparent = transparent
-        prev_y = 0
+    def _resolve_cloud_points(self, array: list[dict], iposx: int = 0, iposy: int = 0, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, posy: int = 0, carry_posy: bool = True) -> list[tuple]:
+        """
+        Resolve the position and style of every point of a cloud, applying the defaults of the missing keys
+        A point without 'posx' is placed at its index, a point without 'posy' on the row of the previous point that had one (carry_posy) or on posy.
+        :return: a list of (posx, posy, text, colour, attr, bg, transparent) tuples, in the order of the array
+        """
+        resolved = []
+        prev_y = posy
         for line, character in enumerate(array):
-            if "posx" in character:
-                new_posx = character["posx"]+iposx
-            else:
-                new_posx = line + iposx
-            if "posy" in character:
-                new_posy = character["posy"] + iposy
-                prev_y = character["posy"]
-            else:
-                new_posy = prev_y + iposy
-            if "character" in character:
-                new_character = character["character"]
-            else:
-                new_character = " "
-            if "colour" in character:
-                new_colour = character["colour"]
-            else:
-                new_colour = colour
-            if "attr" in character:
-                new_attr = character["attr"]
-            else:
-                new_attr = attr
-            if "bg" in character:
-                new_bg = character["bg"]
-            else:
-                new_bg = bg
-            if "transparent" in character:
-                new_transparent = character["transparent"]
-            else:
-                new_transparent = transparent
-            display_function(
-                new_character,
-                new_posx,
-                new_posy,
-                new_colour,
-                new_attr,
-                new_bg,
-                new_transparent
+            point_y = character.get("posy")
+            if point_y is None:
+                point_y = prev_y
+            elif carry_posy is True:
+                prev_y = point_y
+            resolved.append(
+                (
+                    character.get("posx", line) + iposx,
+                    point_y + iposy,
+                    f"{character.get('character', ' ')}",
+                    character.get("colour", colour),
+                    character.get("attr", attr),
+                    character.get("bg", bg),
+                    character.get("transparent", transparent)
+                )
             )
+        return resolved
 
-    def print_double_array_cloud_points(self, array: list[list[dict]], iposx: int = 0, iposy: int = 0, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
-        """ Display a double array at a specific location with a specific colour """
-        display_function = None
-        if parent_screen is None:
-            display_function = self.my_asciimatics_overlay_main_screen.print_at
-        else:
-            display_function = parent_screen.print_at
-        new_posx = 0
-        new_posy = 0
-        new_character = ""
-        new_colour = colour
-        new_attr = attr
-        new_bg = bg
-        new_transparent = transparent
-        for index, item in enumerate(array):
-            for line, character in enumerate(item):
-                if "posx" in character:
-                    new_posx = character["posx"]+iposx
-                else:
-                    new_posx = line + iposx
-                if "posy" in character:
-                    new_posy = character["posy"] + iposy
-                else:
-                    new_posy = index + iposy
-                if "character" in character:
-                    new_character = character["character"]
-                else:
-                    new_character = " "
-                if "colour" in character:
-                    new_colour = character["colour"]
-                else:
-                    new_colour = colour
-                if "attr" in character:
-                    new_attr = character["attr"]
-                else:
-                    new_attr = attr
-                if "bg" in character:
-                    new_bg = character["bg"]
-                else:
-                    new_bg = bg
-                if "transparent" in character:
-                    new_transparent = character["transparent"]
-                else:
-                    new_transparent = transparent
-                display_function(
-                    new_character,
-                    new_posx,
-                    new_posy,
-                    new_colour,
-                    new_attr,
-                    new_bg,
-                    new_transparent
-                )
+    @staticmethod
+    def _sort_cloud_points(points: list[tuple]) -> list[tuple]:
+        """
+        Sort the points by (posy, posx) so that more of them can be merged
+        The draw order only matters when points overlap: the points are then kept in the order of the array.
+        """
+        ordered = sorted(points, key=lambda point: (point[1], point[0]))
+        run_y = None
+        run_end = 0
+        for posx, posy, text, *_ in ordered:
+            if posy == run_y and posx < run_end:
+                return points
+            run_y = posy
+            run_end = posx + len(text)
+        return ordered
 
-    def _print_sides_of_checker_board(self, width: int, height: int, iposx: int = 0, iposy: int = 0, seperator_character_horizontal: str = "-", seperator_character_vertical: str = "|", fg: int = 7, bg: int = 6, transparent: bool = False, add_spacing: bool = True, parent_screen: SC = None) -> None:
-        """ Print the borders (and characters) for the checker board """
-        print("In _print_sides_of_checker_board")
-        alphabet = [
-            "A", "B", "C", "D", "E", "F",
-            "G", "H", "I", "J", "K",
-            "L", "M", "N", "O", "P",
-            "Q", "R", "S", "T", "U",
-            "V", "W", "X", "Y", "Z"
-        ]
-        alphabet_length = len(alphabet)-1
-        current_id = alphabet[0]
-        display_function = None
-        print(
-            f"alphabet = {alphabet}, alphabet_length = {alphabet_length}"
-        )
-        print(
-            f"current_id = {current_id}, display_function = {display_function}"
+    @staticmethod
+    def _merge_cloud_points(points: list[tuple]) -> list[tuple]:
+        """
+        Merge the consecutive points that are horizontally adjacent and share the same colour, attr, bg and transparency into runs
+        :param points: The points returned by _resolve_cloud_points
+        :return: a list of (posx, posy, text, colour, attr, bg, transparent) tuples, one per run
+        """
+        runs = []
+        chunks = []
+        run_x = run_y = run_end = 0
+        run_style = None
+        for posx, posy, text, *style in points:
+            if chunks and posx == run_end and posy == run_y and style == run_style:
+                chunks.append(text)
+                run_end += len(text)
+                continue
+            if chunks:
+                runs.append((run_x, run_y, "".join(chunks), *run_style))
+            chunks = [text]
+            run_x = posx
+            run_y = posy
+            run_end = posx + len(text)
+            run_style = style
+        if chunks:
+            runs.append((run_x, run_y, "".join(chunks), *run_style))
+        return runs
+
+    def _print_cloud_points(self, points: list[tuple], parent_screen: SC, rectangle: tuple[int, int, int, int]) -> None:
+        """ Display resolved points (or runs) in their order, clipped to a rectangle """
+        display_function = parent_screen.print_at
+        for posx, posy, text, *style in points:
+            clipped = _clip_text(text, posx, posy, rectangle)
+            if clipped is not None:
+                display_function(clipped[0], clipped[1], posy, *style)
+
+    @_frame_diffed
+    def print_array_cloud_points(self, array: list[dict], iposx: int = 0, iposy: int = 0, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, batched: bool = False, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display a double array at a specific location with a specific colour
+        The points outside of the screen (or of the viewport) are dropped and the ones crossing its edges are trimmed.
+        :param batched: Merge the horizontally adjacent points that share the same style and emit one print_at per run instead of one per point.
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
+        if parent_screen is None:
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        rectangle = self._get_clip_rectangle(parent_screen, viewport)
+        points = self._resolve_cloud_points(
+            array,
+            iposx,
+            iposy,
+            colour,
+            attr,
+            bg,
+            transparent
         )
+        if batched is True:
+            points = self._merge_cloud_points(self._sort_cloud_points(points))
+        self._print_cloud_points(points, parent_screen, rectangle)
+
+    @_frame_diffed
+    def print_double_array_cloud_points(self, array: list[list[dict]], iposx: int = 0, iposy: int = 0, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False, parent_screen: SC = None, viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Display a double array at a specific location with a specific colour
+        The points outside of the screen (or of the viewport) are dropped and the ones crossing its edges are trimmed.
+        :param viewport: Optional (posx, posy, width, height) rectangle overriding the one set with set_viewport
+        """
         if parent_screen is None:
-            display_function = self.my_asciimatics_overlay_main_screen.print_at
-        else:
-            display_function = parent_screen.print_at
-        x_offset = (len(str(width))+1)
-        if add_spacing is True:
-            x_offset *= 2
-        for i in range(x_offset, (width+x_offset)):
-            print(
-                f"i = {i}, width = {width}, alphabet_length = {alphabet_length}")
-            if i > alphabet_length:
-                current_id = str(i-x_offset)[1:]
-            else:
-                current_id = alphabet[i-x_offset]
-            display_function(
-                current_id,
-                i+iposx,
+            parent_screen = self.my_asciimatics_overlay_main_screen
+        rectangle = self._get_clip_rectangle(parent_screen, viewport)
+        for index, item in enumerate(array):
+            points = self._resolve_cloud_points(
+                item,
+                iposx,
                 iposy,
-                fg,
-                0,
-                bg,
-                transparent
-            )
-            display_function(
-                seperator_character_horizontal,
-                i+iposx,
-                iposy+1,
-                fg,
-                0,
+                colour,
+                attr,
                 bg,
-                transparent
+                transparent,
+                posy=index,
+                carry_posy=False
             )
-            if add_spacing is True:
-                display_function(
-                    " ",
-                    i+iposx,
-                    iposy,
-                    fg,
-                    0,
-                    bg,
-                    transparent
+            self._print_cloud_points(points, parent_screen, rectangle)
+
+    @_frame_diffed
+    def blit_buffer(self, buffer: "CellBuffer", posx: int = 0, posy: int = 0, transparent: bool = False, parent_screen: SC = None) -> None:
+        """
+        Display the content of a CellBuffer at a specific location
+        When the target owns an asciimatics double buffer, the rows are written straight into it, otherwise one print_at is issued per run of cells sharing the same style.
+        Every character is considered to be single width.
+        :param buffer: The buffer to display
+        :param posx: The column of the top left corner of the buffer
+        :param posy: The row of the top left corner of the buffer
+        :param transparent: Whether the spaces of the buffer should be skipped
+        :param parent_screen: Optional screen (or canvas) to draw on
+        """
+        if parent_screen is None:
+            target = self.my_asciimatics_overlay_main_screen
+        else:
+            target = parent_screen
+        start = max(0, -posx)
+        end = min(buffer.width, target.width - posx)
+        if start >= end:
+            return
+        double_buffer = getattr(target, "_buffer", None)
+        if double_buffer is None or hasattr(double_buffer, "set") is False:
+            for row in range(max(0, -posy), min(buffer.height, target.height - posy)):
+                for text, offset, fg, attr, bg in buffer.row_runs(row, start, end):
+                    target.print_at(
+                        text,
+                        posx + offset,
+                        posy + row,
+                        fg,
+                        attr,
+                        bg,
+                        transparent
+                    )
+            return
+        start_line = getattr(target, "_start_line", 0)
+        buffer_height = getattr(target, "_buffer_height", target.height)
+        for row in range(buffer.height):
+            line = posy + row - start_line
+            if line < 0 or line >= buffer_height:
+                continue
+            cells = [
+                (character, fg, attr, bg, 1)
+                for character, fg, attr, bg in zip(
+                    buffer.row_text(row, start, end),
+                    buffer.fg[row, start:end].tolist(),
+                    buffer.attr[row, start:end].tolist(),
+                    buffer.bg[row, start:end].tolist()
                 )
-                display_function(
-                    seperator_character_horizontal,
-                    i+iposx,
-                    iposy+1,
-                    fg,
-                    0,
-                    bg,
-                    transparent
+            ]
+            if transparent is False:
+                double_buffer.set(
+                    slice(posx + start, posx + end),
+                    line,
+                    cells
                 )
-                i += 1
+                continue
+            for offset, cell in enumerate(cells):
+                if cell[0] != " ":
+                    double_buffer.set(posx + start + offset, line, cell)
 
-        y_offset = len(str(height))+1
-        for i in range(y_offset, (height+y_offset)):
-            print(f"i = {i}, height = {height}")
-            display_function(
-                i-y_offset,
-                iposx,
-                i+iposy,
-                fg,
-                0,
-                bg,
-                transparent
+    @_frame_diffed
+    def print_layers(self, compositor: "LayerCompositor", posx: int = 0, posy: int = 0, parent_screen: SC = None) -> None:
+        """
+        Composite the layers of a LayerCompositor and display the resulting frame in a single pass
+        :param compositor: The layers to display
+        :param posx: The column of the top left corner of the layers
+        :param posy: The row of the top left corner of the layers
+        :param parent_screen: Optional screen (or canvas) to draw on
+        """
+        self.blit_buffer(
+            compositor.composite(),
+            posx,
+            posy,
+            False,
+            parent_screen
+        )
+
+    def _print_sides_of_checker_board(self, width: int, height: int, iposx: int = 0, iposy: int = 0, seperator_character_horizontal: str = "-", seperator_character_vertical: str = "|", fg: int = 7, bg: int = 6, transparent: bool = False, add_spacing: bool = True, parent_screen: SC = None) -> None:
+        """ Print the borders (and characters) for the checker board """
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug is True:
+            LOGGER.debug(
+                "Drawing the sides of a %sx%s checker board at (%s, %s)",
+                width, height, iposx, iposy
             )
+        if parent_screen is None:
+            display_function = self.my_asciimatics_overlay_main_screen.print_at
+        else:
+            display_function = parent_screen.print_at
+        board = get_checker_board(
+            width,
+            height,
+            seperator_character_vertical,
+            seperator_character_horizontal,
+            add_spacing
+        )
+        for text, posx, posy in board.borders:
             display_function(
-                seperator_character_vertical,
-                iposx+1,
-                i+iposy,
+                text,
+                posx + iposx,
+                posy + iposy,
                 fg,
                 0,
                 bg,
                 transparent
             )
-        print("Out of _print_sides_of_checker_board")
+        if debug is True:
+            LOGGER.debug("Drew %d border lines", len(board.borders))
 
+    @_frame_diffed
     def print_checker_board(self, data_array: list[list[str, int, float]], width: int = 30, height: int = 30, iposx: int = 0, iposy: int = 0, seperator_character_vertical: str = "|", seperator_character_horizontal: str = "-", even_bg_colour: int = 7, even_fg_colour: int = 6, uneven_bg_colour: int = 6, uneven_fg_colour: int = 7, border_fg: int = 7, border_bg: int = 6, transparent_even: bool = False, transparent_uneven: bool = False, border_transparent: bool = False, attr_even: int = 0, attr_uneven: int = 0, add_spacing: bool = True, parent_screen: SC = None) -> None:
-        """ Display a checker board """
-        line = 0
-        character = 0
-        display_function = None
-        has_character = True
-        if len(data_array) > 0:
-            has_line = True
-        else:
-            has_line = False
-        print(f"has_line = {has_line}, has_character = {has_character}")
-        current_display = ""
+        """
+        Display a checker board
+        :param data_array: The content of the cells, row by row, the missing cells are displayed as '.'
+        :param width: The number of columns of the board
+        :param height: The number of rows of the board
+        The layout of the board is cached, each row is then drawn with one print_at per colour run.
+        """
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug is True:
+            LOGGER.debug("parent_screen = %s", parent_screen)
         if parent_screen is None:
             display_function = self.my_asciimatics_overlay_main_screen.print_at
         else:
             display_function = parent_screen.print_at
-        print(f"parent_screen = {parent_screen}")
         self._print_sides_of_checker_board(
             width,
             height,
@@ -377,49 +625,34 @@ class Display:
             add_spacing,
             parent_screen
         )
-        border_width = len(str(width))+1
-        iposx += border_width
-        width -= border_width
-        iposy += border_width
-        height -= border_width
-        line = 0
-        character = 0
-        print(f"border_width = {border_width}, iposx = {iposx}")
-        print(f"iposy = {iposy}, width = {width}, height = {height}")
-        while line < height:
-            character = 0
-            if has_line is True and len(data_array[line]) == 0:
-                has_character = False
-            else:
-                has_character = True
-            print(
-                f"line = {line}, character = {character}, height = {height}, has_character = {has_character}")
-            while character < width:
-                if has_character is False or has_line is False or len(current_display[line]) == 0:
-                    current_display = "."
-                else:
-                    current_display = data_array[line][character][0]
-                print(
-                    f"line = {line}, character = {character}, height = {height}, has_character = {has_character}")
-                if character % 2 == 0:
-                    display_function(
-                        current_display,
-                        line*width+iposx,
-                        character*height+iposy,
-                        even_fg_colour,
-                        attr_even,
-                        even_bg_colour,
-                        transparent_even
-                    )
-                else:
-                    display_function(
-                        current_display,
-                        line*width+iposx,
-                        character*height+iposy,
-                        uneven_fg_colour,
-                        attr_uneven,
-                        uneven_bg_colour,
-                        transparent_uneven
-                    )
-                character += 1
-            line += 1
+        board = get_checker_board(
+            width,
+            height,
+            seperator_character_vertical,
+            seperator_character_horizontal,
+            add_spacing
+        )
+        styles = (
+            (even_fg_colour, attr_even, even_bg_colour, transparent_even),
+            (uneven_fg_colour, attr_uneven, uneven_bg_colour, transparent_uneven)
+        )
+        if styles[0] == styles[1]:
+            row_runs = (board.single_run, board.single_run)
+        else:
+            row_runs = board.row_runs
+        iposx += board.board_posx
+        iposy += board.board_posy
+        if debug is True:
+            LOGGER.debug(
+                "iposx = %s, iposy = %s, width = %s, height = %s",
+                iposx, iposy, width, height
+            )
+        for line in range(board.height):
+            text = board.row_text(data_array, line)
+            for start, end, style in row_runs[line % 2]:
+                display_function(
+                    text[start:end],
+                    iposx + start,
+                    iposy + line,
+                    *styles[style]
+                )
@@ -1,6 +1,19 @@
-from .test_menu_input import Main
+"""
+File in charge of exposing the example scripts, they are imported on the first access to Main
+"""
+
+
+def __getattr__(name: str) -> object:
+    """ Import the example launcher on its first access """
+    if name != "Main":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .test_menu_input import Main
+    globals()["Main"] = Main
+    return Main
+
 
 if __name__ == "__main__":
+    from asciimatics_overlay_ov.example_scripts.test_menu_input import Main
     SUCCESS = 0
     ERROR = 1
     SCREEN = None
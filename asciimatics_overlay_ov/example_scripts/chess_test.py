@@ -24,7 +24,7 @@ class ChessTest(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         )
         self.frame_node = FrameNodes()
         self.event = Event()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(self.event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(self.event, screen, lightweight=True)
         self.asciimatics_overlay.update_initial_pointers(self.event, screen)
         self.layout = WIG.Layout([100], fill_frame=True)
         self.add_layout(self.layout)
@@ -25,7 +25,7 @@ class CloseWithoutRaisingChild(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         self.usr_input = ""
         self.child_destination = None
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.layout = WIG.Layout([1, 1])  # Define a layout with three columns
         self.add_layout(self.layout)
         self.layout2 = WIG.Layout([1, 1])  # Define a layout with three columns
@@ -103,7 +103,7 @@ class CloseWithoutRaising(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         self.frame_node = FrameNodes()
         self.usr_input = ""
         self.usr_input_label = None
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.layout = WIG.Layout([1, 1])  # Define a layout with three columns
         self.add_layout(self.layout)
         self.layout2 = WIG.Layout([1, 1])  # Define a layout with three columns
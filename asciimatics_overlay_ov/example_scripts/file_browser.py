@@ -23,7 +23,7 @@ class FileBrowser(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="Input Field"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.error = self.frame_node.error
         self.success = self.frame_node.success
         self.layout = WIG.Layout([100], fill_frame=True)
@@ -66,7 +66,8 @@ class FileBrowser(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
                     "filebrowser",
                     "filebrowser_output"
                 ),
-                file_filter=".*.txt$|.*.py$"
+                file_filter=".*.txt$|.*.py$",
+                background_scan=True
             )
         )
         self.layout.add_widget(
@@ -138,36 +139,20 @@ class FileBrowser(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
 
     def _update_usr_input(self, object_name: str, destination: str) -> None:
         """ Update the choice of the user based on their selection """
-        object_name = self.find_widget(object_name)
+        object_name = self.find_widget_by_name(self, object_name)
         data = self.get_widget_value(object_name)
-        destination_var = self.find_widget(destination)
+        destination_var = self.find_widget_by_name(self, destination)
         self.apply_text_to_display(destination_var, f"{data}")
 
     def _reset_layout(self, display_widgets: list[str] or str = "", value: list[str] or str = "") -> None:
         """ Reset the current selection and options """
-        print(f"Reset layout ({display_widgets}, {value})")
-        if isinstance(value, str) is True and isinstance(display_widgets, list) is True:
-            data = list()
-            for i in value:
-                data.append(value)
-        else:
-            data = value
-        if isinstance(display_widgets, list) is True:
-            for index, display_widget in enumerate(display_widgets):
-                destination_var = self.find_widget(display_widget)
-                status = self.apply_text_to_display(
-                    destination_var,
-                    data[index]
-                )
-                if status != self.success:
-                    status2 = self.apply_text_to_input_box(
-                        destination_var, data[index])
-                    if status2 != self.success:
-                        raise Exception(f"Failed to reset {display_widget}")
-        else:
-            destination_var = self.find_widget(display_widget)
-            self.apply_text_to_display(destination_var, value)
-        self.fix()
+        if isinstance(display_widgets, list) is False:
+            display_widgets = [display_widgets]
+        if isinstance(value, list) is False:
+            value = [value] * len(display_widgets)
+        status = self.apply_values(self, dict(zip(display_widgets, value)))
+        if status != self.success:
+            raise Exception(f"Failed to reset {display_widgets}")
 
     def _exit(self):
         # self._reset_layout(
@@ -21,7 +21,7 @@ class HelloWorld(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="Hello World"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.layout = WIG.Layout([1, 1])  # Define a layout with three columns
         self.add_layout(self.layout)
         self.place_content_on_screen()
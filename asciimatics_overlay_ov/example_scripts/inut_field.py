@@ -21,7 +21,7 @@ class InputField(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="Input Field"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.error = self.frame_node.error
         self.success = self.frame_node.success
         self.data_nodes = {
@@ -89,9 +89,9 @@ class InputField(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
 
     def _get_usr_input(self) -> None:
         """ Get the input of the user for both boxes """
-        input_a = self.get_text_input(self.find_widget("text"))
-        input_b = self.get_text_input(self.find_widget("text2"))
-        input_c = self.find_widget("Input_data")
+        input_a = self.get_text_input(self.find_widget_by_name(self, "text"))
+        input_b = self.get_text_input(self.find_widget_by_name(self, "text2"))
+        input_c = self.find_widget_by_name(self, "Input_data")
         if input_a != self.error and input_b != self.error:
             self.apply_text_to_display(
                 input_c,
@@ -100,9 +100,9 @@ class InputField(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
 
     def _reset_input(self) -> None:
         """ Reset the content of the boxes using pre-built functions """
-        self.apply_text_to_input_box(self.find_widget("text"), "")
-        self.apply_text_to_input_box(self.find_widget("text2"), "")
-        self.apply_text_to_display(self.find_widget("Input_data"), "")
+        self.apply_text_to_input_box(self.find_widget_by_name(self, "text"), "")
+        self.apply_text_to_input_box(self.find_widget_by_name(self, "text2"), "")
+        self.apply_text_to_display(self.find_widget_by_name(self, "Input_data"), "")
 
     def _exit(self):
         self._reset_input()
@@ -23,7 +23,7 @@ class ListFields(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="List Fields"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.error = self.frame_node.error
         self.success = self.frame_node.success
         self.data_nodes = {
@@ -127,8 +127,8 @@ class ListFields(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
     def _display_new_selection(self, source, destination) -> None:
         """ Display the new selection """
         self.apply_text_to_display(
-            self.find_widget(destination),
-            self.get_text_input(self.find_widget(source))
+            self.find_widget_by_name(self, destination),
+            self.get_text_input(self.find_widget_by_name(self, source))
         )
 
     def _exit(self):
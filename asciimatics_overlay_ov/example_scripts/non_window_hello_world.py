@@ -7,6 +7,7 @@ import asciimatics.widgets as WIG
 from asciimatics.event import Event
 from asciimatics.exceptions import NextScene
 from asciimatics_overlay_ov import AsciiMaticsOverlayMain
+from asciimatics_overlay_ov.colour_class import resolve_colour
 from asciimatics_overlay_ov.widgets import FrameNodes
 
 
@@ -53,7 +54,7 @@ class NonWindowHelloWorld(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             "Smile, be happy"
         ]
         self.event = Event()
-        self.amom = AsciiMaticsOverlayMain(self.event, screen)
+        self.amom = AsciiMaticsOverlayMain(self.event, screen, lightweight=True)
         self.amom.update_initial_pointers(self.event, screen)
         self.main_loop = True
         self.colour_data = self._get_colour_data()
@@ -184,34 +185,38 @@ class NonWindowHelloWorld(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         self._exit()
 
     def _funk_up_the_display(self) -> int:
-        """ Update the display with funny text """
+        """ Update the display with funny text, a few quotes per frame """
         screen_width = self.amom.get_screen_width()
         screen_height = self.amom.get_screen_height()-1
         quotes_length = len(self.quotes)-1
-        while self.main_loop is True:
-            x = randint(0, screen_width)
-            y = randint(0, screen_height)
-            random_foreground = self.amom.pick_colour(
-                self._get_random_colour()
-            )
-            random_background = self.amom.pick_colour(
-                self._get_random_colour()
-            )
-            random_content = self.quotes[randint(0, quotes_length)]
-            random_transparent = self._make_transparent()
-            self.amom.mvprintw_colour(
-                random_content,
-                x,
-                y,
-                random_foreground,
-                0,
-                random_background,
-                random_transparent
-            )
-            if self._is_quit_key_pressed() is True:
-                self._goodbye_message()
-                break
-            self.amom.my_asciimatics_overlay_main_screen.refresh()
+        quotes_per_frame = 4
+        quit_key_pressed = False
+
+        def draw_frame(frame_number: int) -> bool:
+            nonlocal quit_key_pressed
+            for _ in range(quotes_per_frame):
+                x = randint(0, screen_width)
+                y = randint(0, screen_height)
+                random_foreground = resolve_colour(self._get_random_colour())
+                random_background = resolve_colour(self._get_random_colour())
+                random_content = self.quotes[randint(0, quotes_length)]
+                random_transparent = self._make_transparent()
+                self.amom.mvprintw_colour(
+                    random_content,
+                    x,
+                    y,
+                    random_foreground,
+                    0,
+                    random_background,
+                    random_transparent
+                )
+            quit_key_pressed = self._is_quit_key_pressed()
+            return quit_key_pressed is False and self.main_loop is True
+
+        scheduler = self.amom.create_frame_scheduler(30, draw_frame)
+        scheduler.run()
+        if quit_key_pressed is True:
+            self._goodbye_message()
 
     def _exit(self) -> None:
         raise NextScene("Main")
@@ -22,7 +22,7 @@ class Popup(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="Popup"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.error = self.frame_node.error
         self.success = self.frame_node.success
         self.layout = WIG.Layout([100], fill_frame=True)
@@ -483,28 +483,13 @@ class Popup(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
 
     def _reset_layout(self, display_widgets: list[str] or str = "", value: list[str] or str = "") -> None:
         """ Reset the current selection and options """
-        if isinstance(value, str) is True and isinstance(display_widgets, list) is True:
-            data = list()
-            for i in value:
-                data.append(value)
-        else:
-            data = value
-        if isinstance(display_widgets, list) is True:
-            for index, display_widget in enumerate(display_widgets):
-                destination_var = self.find_widget(display_widget)
-                status = self.apply_text_to_display(
-                    destination_var,
-                    data[index]
-                )
-                if status != self.success:
-                    status2 = self.apply_text_to_input_box(
-                        destination_var, data[index])
-                    if status2 != self.success:
-                        raise Exception(f"Failed to reset {display_widget}")
-        else:
-            destination_var = self.find_widget(display_widget)
-            self.apply_text_to_display(destination_var, value)
-        self.fix()
+        if isinstance(display_widgets, list) is False:
+            display_widgets = [display_widgets]
+        if isinstance(value, list) is False:
+            value = [value] * len(display_widgets)
+        status = self.apply_values(self, dict(zip(display_widgets, value)))
+        if status != self.success:
+            raise Exception(f"Failed to reset {display_widgets}")
 
     def _exit(self):
         raise NextScene("Main")
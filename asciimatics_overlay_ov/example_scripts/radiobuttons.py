@@ -24,7 +24,7 @@ class Radiobuttons(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             title="Input Field"
         )
         self.frame_node = FrameNodes()
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.error = self.frame_node.error
         self.success = self.frame_node.success
         self.radio_options = list()
@@ -132,9 +132,9 @@ class Radiobuttons(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
 
     def _update_usr_input(self, checkbox_name: str, destination: str) -> None:
         """ Update the choice of the user based on their selection """
-        checkbox_input = self.find_widget(checkbox_name)
+        checkbox_input = self.find_widget_by_name(self, checkbox_name)
         checkbox_input_value = self.get_text_input(checkbox_input)
-        destination_var = self.find_widget(destination)
+        destination_var = self.find_widget_by_name(self, destination)
         self.apply_text_to_display(
             destination_var,
             f"{self.radio_options[checkbox_input_value][0]}"
@@ -145,7 +145,7 @@ class Radiobuttons(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         if chosen_layout is None:
             chosen_layout = self.layout4
         chosen_layout.clear_widgets()
-        destination_var = self.find_widget(display_widget)
+        destination_var = self.find_widget_by_name(self, display_widget)
         self.apply_text_to_display(destination_var, "")
         self.fix()
 
@@ -153,7 +153,7 @@ class Radiobuttons(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
         """ Reset the current selection and options """
         self._remove_layout(self.layout4, display_widget)
         self._create_checkboxes(self.layout4)
-        destination_var = self.find_widget(display_widget)
+        destination_var = self.find_widget_by_name(self, display_widget)
         self.apply_text_to_display(destination_var, "")
         self.fix()
 
@@ -8,7 +8,7 @@ import asciimatics.widgets as WIG
 from asciimatics.scene import Scene
 from asciimatics.screen import Screen
 from asciimatics.exceptions import ResizeScreenError, NextScene, StopApplication
-from asciimatics_overlay_ov import AsciiMaticsOverlayMain
+from asciimatics_overlay_ov import AsciiMaticsOverlayMain, SceneRegistry
 from asciimatics_overlay_ov.widgets import FrameNodes
 from .hello_world import HelloWorld
 from .inut_field import InputField
@@ -34,7 +34,7 @@ class MainMenu(WIG.Frame, AsciiMaticsOverlayMain, FrameNodes):
             has_border=True,
             title="Main Menu"
         )
-        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen)
+        self.asciimatics_overlay = AsciiMaticsOverlayMain(Event, screen, lightweight=True)
         self.frame_node = FrameNodes()
 
         # Define a layout with three columns
@@ -204,26 +204,25 @@ class Main:
         self.screen = screen
         self.error = error
         self.last_scene = last_scene
+        self.registry: SceneRegistry = None
 
-    def create_scenes(self, screen: Screen) -> int:
-        """ Create the screens that will be used for the windows """
-        scenes = [
-            Scene([MainMenu(screen)], -1, name="Main"),
-            Scene([HelloWorld(screen)], -1, name="HelloWorld"),
-            Scene([InputField(screen)], -1, name="InputField"),
-            Scene([ListFields(screen)], -1, name="ListFields"),
-            Scene([Checkboxes(screen)], -1, name="Checkboxes"),
-            Scene([Radiobuttons(screen)], -1, name="Radiobuttons"),
-            Scene([DateAndTime(screen)], -1, name="DateAndTime"),
-            Scene([FileBrowser(screen)], -1, name="FileBrowser"),
-            Scene([NonWindowHelloWorld(screen)],
-                  (-1), name="NonWindowHelloWorld"),
-            Scene([Popup(screen)], -1, name="Popup"),
-            Scene([ChessTest(screen)], -1, name="ChessTest"),
-            Scene([CloseWithoutRaising(screen)], -
-                  1, name="CloseWithoutRaising")
-        ]
-        return scenes
+    def create_scenes(self, screen: Screen) -> list[Scene]:
+        """ Declare the screens that will be used for the windows, each one is created when it is first displayed """
+        registry = SceneRegistry(screen)
+        registry.register("Main", MainMenu)
+        registry.register("HelloWorld", HelloWorld)
+        registry.register("InputField", InputField)
+        registry.register("ListFields", ListFields)
+        registry.register("Checkboxes", Checkboxes)
+        registry.register("Radiobuttons", Radiobuttons)
+        registry.register("DateAndTime", DateAndTime)
+        registry.register("FileBrowser", FileBrowser)
+        registry.register("NonWindowHelloWorld", NonWindowHelloWorld)
+        registry.register("Popup", Popup)
+        registry.register("ChessTest", ChessTest)
+        registry.register("CloseWithoutRaising", CloseWithoutRaising)
+        self.registry = registry
+        return registry.scenes
 
     def main(self, screen: Screen) -> int:
         """ Create the main window """
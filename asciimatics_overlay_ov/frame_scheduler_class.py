@@ -0,0 +1,105 @@
+"""
+File in charge of pacing the render loops to a target frame rate
+"""
+
+from time import perf_counter, sleep
+
+
+class FrameScheduler:
+    """
+    The class in charge of running the per-frame callbacks at a target frame rate
+    Every tick runs all the callbacks and then refreshes the screen once, whatever the number of callbacks.
+    The next frame is scheduled from the theoretical start of the current one (and not from the end of its callbacks),
+    so the time spent drawing does not accumulate as drift. When a tick overruns the next frame, the frames it overran are dropped instead of being run back to back.
+    """
+
+    def __init__(self, fps: float = 30.0, refresh: object = None, clock: object = perf_counter, sleep_function: object = sleep) -> None:
+        """
+        :param fps: The target number of frames per second
+        :param refresh: The function called once per tick, after the callbacks (usually the refresh of the screen)
+        :param clock: The monotonic clock used to schedule the frames, in seconds
+        :param sleep_function: The function used to wait for the next frame, in seconds
+        """
+        if fps <= 0:
+            raise ValueError("The number of frames per second must be positive")
+        self.fps: float = fps
+        self.frame_duration: float = 1 / fps
+        self.refresh: object = refresh
+        self.clock: object = clock
+        self.sleep_function: object = sleep_function
+        self.callbacks: list = []
+        self.frame_number: int = 0
+        self.dropped_frames: int = 0
+        self.running: bool = False
+        self._next_frame: float = None
+
+    def add_callback(self, callback: object) -> None:
+        """
+        Add a function called once per frame
+        :param callback: A function taking the frame number, returning False stops the scheduler
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: object) -> None:
+        """ Remove a function added with add_callback """
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def start(self) -> None:
+        """ Mark the scheduler as running, the first frame is due immediately """
+        self.running = True
+        self._next_frame = None
+
+    def stop(self) -> None:
+        """ Stop the scheduler at the end of the current tick """
+        self.running = False
+
+    def tick(self) -> bool:
+        """
+        Run the callbacks of one frame and refresh once
+        :return: False when a callback asked to stop, True otherwise
+        """
+        for callback in tuple(self.callbacks):
+            if callback(self.frame_number) is False:
+                self.running = False
+        if self.refresh is not None:
+            self.refresh()
+        self.frame_number += 1
+        return self.running
+
+    def time_until_next_frame(self) -> float:
+        """ Get the number of seconds left before the next frame is due """
+        if self._next_frame is None:
+            return 0.0
+        return max(self._next_frame - self.clock(), 0.0)
+
+    def schedule_next_frame(self) -> None:
+        """ Compute the start of the next frame from the start of the current one """
+        now = self.clock()
+        if self._next_frame is None:
+            self._next_frame = now
+        self._next_frame += self.frame_duration
+        if now >= self._next_frame:
+            skipped = int((now - self._next_frame) / self.frame_duration) + 1
+            self.dropped_frames += skipped
+            self._next_frame += skipped * self.frame_duration
+
+    def run(self, max_frames: int = None) -> int:
+        """
+        Run the frames until stop is called, a callback returns False or max_frames frames were run
+        :param max_frames: Optional maximum number of frames to run
+        :return: The number of frames run
+        """
+        self.start()
+        frames = 0
+        while self.running is True and max_frames != 0:
+            self.schedule_next_frame()
+            self.tick()
+            frames += 1
+            if self.running is False or frames == max_frames:
+                break
+            delay = self.time_until_next_frame()
+            if delay > 0:
+                self.sleep_function(delay)
+        self.running = False
+        return frames
@@ -0,0 +1,158 @@
+"""
+File in charge of containing an in-memory screen that can be used without a terminal
+"""
+
+from collections import deque
+from typing import Union
+import numpy as np
+from asciimatics.event import Event, KeyboardEvent
+from asciimatics.screen import Screen
+from .cell_buffer_class import CellBuffer
+
+
+class HeadlessScreen:
+    """
+    The class in charge of emulating the subset of the asciimatics Screen used by the overlay
+    Everything is drawn into a CellBuffer (the double buffer), refresh copies it into the displayed CellBuffer.
+    Keys and events are never read from a terminal, they are fed with feed_keys and feed_events.
+    The asciimatics Frames (and their widgets) are drawn through block_transfer, and the Scenes are played with set_scenes and draw_next_frame,
+    which are the ones of the asciimatics Screen.
+    """
+
+    set_scenes = Screen.set_scenes
+    draw_next_frame = Screen.draw_next_frame
+    force_update = Screen.force_update
+    _unhandled_event_default = Screen._unhandled_event_default
+
+    def __init__(self, width: int = 80, height: int = 24, colours: int = 8, unicode_aware: bool = False) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.colours: int = colours
+        self.unicode_aware: bool = unicode_aware
+        self.title: str = ""
+        self.closed: bool = False
+        self.refresh_count: int = 0
+        self.print_at_count: int = 0
+        self.current_colours: tuple = (7, 0, 0)
+        self.buffer: CellBuffer = CellBuffer(width, height)
+        self.displayed: CellBuffer = CellBuffer(width, height)
+        self._events: deque = deque()
+        self._scenes: list = []
+        self._scene_index: int = 0
+        self._unhandled_input: object = None
+        self._frame: int = 0
+        self._idle_frame_count: int = 0
+        self._forced_update: bool = False
+
+    @classmethod
+    def open(cls, width: int = 80, height: int = 24, colours: int = 8, unicode_aware: bool = False) -> "HeadlessScreen":
+        """ Create a new headless screen (mirrors Screen.open) """
+        return cls(width, height, colours, unicode_aware)
+
+    def close(self, restore: bool = True) -> None:
+        """ Close the screen """
+        self.closed = True
+
+    def print_at(self, text: str, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """
+        Print the text at the specified location using the specified colour and attributes
+        The text is clipped to the screen and every character is considered to be single width.
+        """
+        self.print_at_count += 1
+        self.buffer.put_text(str(text), x, y, colour, attr, bg, transparent)
+
+    def block_transfer(self, buffer: object, x: int, y: int) -> None:
+        """
+        Copy an asciimatics double buffer (the canvas of a Frame) into the double buffer at a specific location
+        :param buffer: The asciimatics double buffer to copy
+        :param x: The column of its top left corner
+        :param y: The row of its top left corner
+        """
+        start = max(x, 0)
+        end = min(x + buffer.width, self.width)
+        if start >= end:
+            return
+        for row in range(max(y, 0), min(y + buffer.height, self.height)):
+            self.buffer.put_cells(buffer.slice(start - x, row - y, end - start), start, row)
+
+    def get_from(self, x: int, y: int) -> Union[tuple[int, int, int, int], None]:
+        """ Get the (character code, fg, attr, bg) of a cell of the double buffer """
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return None
+        return (
+            ord(self.buffer.character[y, x]),
+            int(self.buffer.fg[y, x]),
+            int(self.buffer.attr[y, x]),
+            int(self.buffer.bg[y, x])
+        )
+
+    def refresh(self) -> None:
+        """ Copy the double buffer to the displayed cells """
+        np.copyto(self.displayed.character, self.buffer.character)
+        np.copyto(self.displayed.fg, self.buffer.fg)
+        np.copyto(self.displayed.attr, self.buffer.attr)
+        np.copyto(self.displayed.bg, self.buffer.bg)
+        self.refresh_count += 1
+
+    def clear_buffer(self, fg: int, attr: int, bg: int, x: int = 0, y: int = 0, w: int = None, h: int = None) -> None:
+        """ Clear a box of the double buffer """
+        if w is None:
+            w = self.width - x
+        if h is None:
+            h = self.height - y
+        rows = slice(max(y, 0), max(y + h, 0))
+        columns = slice(max(x, 0), max(x + w, 0))
+        self.buffer.character[rows, columns] = " "
+        self.buffer.fg[rows, columns] = fg
+        self.buffer.attr[rows, columns] = attr
+        self.buffer.bg[rows, columns] = bg
+
+    def clear(self) -> None:
+        """ Clear the screen (both the double buffer and the displayed cells) """
+        self.buffer.fill()
+        self.refresh()
+
+    def set_title(self, title: str) -> None:
+        """ Set the title of the screen """
+        self.title = title
+
+    def _change_colours(self, colour: int, attr: int, bg: int) -> None:
+        """ Change the current colours """
+        self.current_colours = (colour, attr, bg)
+
+    def has_resized(self) -> bool:
+        """ A headless screen is never resized """
+        return False
+
+    def feed_keys(self, keys: list[Union[int, str]]) -> None:
+        """ Queue keys, they will be returned by get_key and get_event """
+        for key in keys:
+            if isinstance(key, str) is True:
+                key = ord(key)
+            self._events.append(KeyboardEvent(key))
+
+    def feed_events(self, events: list[Event]) -> None:
+        """ Queue events, they will be returned by get_event """
+        self._events.extend(events)
+
+    def get_event(self) -> Union[Event, None]:
+        """ Get the next queued event """
+        if len(self._events) == 0:
+            return None
+        return self._events.popleft()
+
+    def get_key(self) -> Union[int, None]:
+        """ Get the key code of the next queued keyboard event, the other events are dropped """
+        while len(self._events) > 0:
+            event = self._events.popleft()
+            if isinstance(event, KeyboardEvent) is True:
+                return event.key_code
+        return None
+
+    def get_text(self, displayed: bool = True) -> list[str]:
+        """
+        Get the characters of the screen as a list of strings (one per row)
+        :param displayed: Read the displayed cells (the state after the last refresh) instead of the double buffer
+        """
+        source = self.displayed if displayed is True else self.buffer
+        return [source.row_text(row) for row in range(self.height)]
@@ -0,0 +1,230 @@
+"""
+File in charge of measuring the time and the screen writes of the overlay calls
+"""
+
+from collections import deque
+from functools import wraps
+from inspect import isfunction
+from time import perf_counter
+
+_MISSING = object()
+
+
+class MethodStats:
+    """ The class in charge of accumulating the measures of one method """
+
+    def __init__(self, name: str, max_samples: int = 10000) -> None:
+        """
+        :param name: The name of the method (Class.method)
+        :param max_samples: The number of durations kept for the percentiles (the most recent ones)
+        """
+        self.name: str = name
+        self.calls: int = 0
+        self.cells: int = 0
+        self.total_time: float = 0.0
+        self.samples: deque = deque(maxlen=max_samples)
+
+    def record(self, duration: float, cells: int = 0) -> None:
+        """ Add the measures of a call """
+        self.calls += 1
+        self.cells += cells
+        self.total_time += duration
+        self.samples.append(duration)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a percentile of the durations of the calls (nearest rank)
+        :param percent: The percentile, between 0 and 100
+        :return: the duration in seconds, 0 when there was no call
+        """
+        if len(self.samples) == 0:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = min(max(int(len(ordered) * percent / 100 + 0.5), 1), len(ordered))
+        return ordered[rank - 1]
+
+    @property
+    def p50(self) -> float:
+        """ The median duration of the calls, in seconds """
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> float:
+        """ The 99th percentile of the durations of the calls, in seconds """
+        return self.percentile(99)
+
+    def as_dict(self) -> dict:
+        """ Get the measures as a dictionary """
+        return {
+            "calls": self.calls,
+            "cells": self.cells,
+            "total_time": self.total_time,
+            "p50": self.p50,
+            "p99": self.p99
+        }
+
+
+class RenderStats:
+    """
+    The class in charge of holding the measures taken while the instrumentation is enabled
+    The cells are the characters given to print_at plus the cells written straight into the double buffer of a screen,
+    the cells of a method include the ones written by the methods it calls. A frame ends with every call to refresh_screen.
+    """
+
+    def __init__(self, max_samples: int = 10000, max_frames: int = 1000) -> None:
+        """
+        :param max_samples: The number of durations kept per method for the percentiles
+        :param max_frames: The number of frames whose print_at count is kept
+        """
+        self.max_samples: int = max_samples
+        self.methods: dict[str, MethodStats] = {}
+        self.cells: int = 0
+        self.print_at_calls: int = 0
+        self.frame_print_at_calls: int = 0
+        self.frames: deque = deque(maxlen=max_frames)
+        self._print_at_depth: int = 0
+
+    def record(self, name: str, duration: float, cells: int = 0) -> None:
+        """ Add the measures of a call to the stats of a method """
+        method = self.methods.get(name)
+        if method is None:
+            method = self.methods[name] = MethodStats(name, self.max_samples)
+        method.record(duration, cells)
+
+    def get(self, name: str) -> MethodStats:
+        """ Get the stats of a method (Class.method), None when it was not called """
+        return self.methods.get(name)
+
+    def end_frame(self) -> None:
+        """ Close the current frame """
+        self.frames.append(self.frame_print_at_calls)
+        self.frame_print_at_calls = 0
+
+    @property
+    def print_at_per_frame(self) -> list[int]:
+        """ The number of print_at calls of each closed frame, the oldest first """
+        return list(self.frames)
+
+    def reset(self) -> None:
+        """ Forget every measure """
+        self.methods.clear()
+        self.cells = 0
+        self.print_at_calls = 0
+        self.frame_print_at_calls = 0
+        self.frames.clear()
+
+    def summary(self) -> dict[str, dict]:
+        """ Get the measures of every method, the most expensive (in cumulative time) first """
+        ordered = sorted(self.methods.values(), key=lambda method: method.total_time, reverse=True)
+        return {method.name: method.as_dict() for method in ordered}
+
+
+class Instrumentation:
+    """
+    The class in charge of swapping the measured methods in and out
+    While it is disabled, the original methods are in place, so the overlay runs without any overhead.
+    The methods are replaced on their classes: every instance (and every AsciiMaticsOverlayMain) is measured while it is enabled.
+    """
+
+    stats: RenderStats = None
+    _originals: list = []
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """ Whether the methods are measured """
+        return len(cls._originals) > 0
+
+    @classmethod
+    def enable_instrumentation(cls, stats: RenderStats = None, clock: object = perf_counter) -> RenderStats:
+        """
+        Start measuring the Display methods, MyScreen.refresh_screen and clear_screen, the FrameNodes helpers and the print_at calls
+        The print_at calls of every screen and canvas are counted, including the ones drawing the asciimatics widgets.
+        :param stats: Optional stats to add the measures to, new ones are created otherwise
+        :param clock: The clock used to time the calls, in seconds
+        :return: The stats receiving the measures
+        """
+        from asciimatics.screen import _AbstractCanvas, _DoubleBuffer
+        from .display_class import Display, _CALL_SITE_SKIPPED_CODES
+        from .screen_class import MyScreen
+        from .headless_screen_class import HeadlessScreen
+        from .widgets.frame_nodes.frame_nodes import FrameNodes
+        cls.disable_instrumentation()
+        if stats is None:
+            stats = RenderStats()
+        cls.stats = stats
+        for owner in (Display, FrameNodes):
+            for name, function in list(vars(owner).items()):
+                if name.startswith("_") is False and isfunction(function) is True:
+                    wrapper = cls._wrap_method(stats, f"{owner.__name__}.{name}", function, clock)
+                    # The frame diff layer identifies the regions by the call site of the Display methods, not by this wrapper
+                    _CALL_SITE_SKIPPED_CODES.add(wrapper.__code__)
+                    cls._swap(owner, name, wrapper)
+        for name in ("clear_screen", "refresh_screen"):
+            cls._swap(
+                MyScreen,
+                name,
+                cls._wrap_method(stats, f"MyScreen.{name}", vars(MyScreen)[name], clock, name == "refresh_screen")
+            )
+        for owner in (_AbstractCanvas, HeadlessScreen):
+            cls._swap(owner, "print_at", cls._wrap_print_at(stats, owner.print_at, clock))
+        cls._swap(_DoubleBuffer, "set", cls._wrap_buffer_set(stats, _DoubleBuffer.set))
+        return stats
+
+    @classmethod
+    def disable_instrumentation(cls) -> None:
+        """ Put the original methods back, the stats are kept """
+        while len(cls._originals) > 0:
+            owner, name, original = cls._originals.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    @classmethod
+    def _swap(cls, owner: type, name: str, replacement: object) -> None:
+        """ Replace a method of a class, remembering the original one """
+        cls._originals.append((owner, name, vars(owner).get(name, _MISSING)))
+        setattr(owner, name, replacement)
+
+    @staticmethod
+    def _wrap_method(stats: RenderStats, label: str, function: object, clock: object, ends_frame: bool = False) -> object:
+        """ Create the measured version of a method """
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> object:
+            cells = stats.cells
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.record(label, clock() - start, stats.cells - cells)
+                if ends_frame is True:
+                    stats.end_frame()
+        return wrapper
+
+    @staticmethod
+    def _wrap_print_at(stats: RenderStats, function: object, clock: object) -> object:
+        """ Create the counted version of the print_at method of a screen """
+        @wraps(function)
+        def wrapper(self, text: str, *args, **kwargs) -> object:
+            cells = len(f"{text}")
+            stats.print_at_calls += 1
+            stats.frame_print_at_calls += 1
+            stats.cells += cells
+            stats._print_at_depth += 1
+            start = clock()
+            try:
+                return function(self, text, *args, **kwargs)
+            finally:
+                stats._print_at_depth -= 1
+                stats.record("print_at", clock() - start, cells)
+        return wrapper
+
+    @staticmethod
+    def _wrap_buffer_set(stats: RenderStats, function: object) -> object:
+        """ Create the counted version of the method writing cells straight into a double buffer (the writes of print_at are already counted) """
+        @wraps(function)
+        def wrapper(self, x: object, y: int, value: object) -> object:
+            if stats._print_at_depth == 0:
+                stats.cells += len(value) if isinstance(x, slice) is True else 1
+            return function(self, x, y, value)
+        return wrapper
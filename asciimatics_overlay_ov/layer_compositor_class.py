@@ -0,0 +1,125 @@
+"""
+File in charge of stacking named layers of cells and compositing them into a single frame
+"""
+
+import numpy as np
+from .cell_buffer_class import CellBuffer
+
+
+class Layer(CellBuffer):
+    """
+    The class in charge of storing the cells drawn on one layer
+    A layer can be given as the parent_screen of the Display methods: it records the cells drawn (the mask)
+    so that the cells left untouched let the layers below show through.
+    """
+
+    def __init__(self, name: str, width: int, height: int, z_index: int = 0) -> None:
+        super().__init__(width, height)
+        self.name: str = name
+        self.z_index: int = z_index
+        self.visible: bool = True
+        self.colours: int = 8
+        self.mask: np.ndarray = np.zeros((height, width), dtype=bool)
+
+    def print_at(self, text: str, x: int, y: int, colour: int = 7, attr: int = 0, bg: int = 0, transparent: bool = False) -> None:
+        """
+        Draw a text on the layer, the characters outside of it are dropped
+        When transparent is True, the spaces are not drawn and keep showing the layers below.
+        """
+        written = self.put_text(f"{text}", x, y, colour, attr, bg, transparent)
+        if written is not None:
+            columns, drawn = written
+            self.mask[y, columns] |= drawn
+
+    def clear(self) -> None:
+        """ Forget everything drawn on the layer """
+        self.fill()
+        self.mask.fill(False)
+
+
+class LayerCompositor:
+    """
+    The class in charge of compositing named layers into one grid of cells per frame
+    The layers are drawn on independently (in any order) and stacked by z_index: a cell drawn on a layer hides the cells of the layers below it.
+    The resulting frame is drawn with Display.print_layers, one print_at per run of cells sharing the same style.
+    """
+
+    default_layers: tuple[str, ...] = (
+        "background",
+        "content",
+        "overlay",
+        "hud"
+    )
+
+    def __init__(self, width: int, height: int, layers: tuple[str, ...] = None, character: str = " ", fg: int = 7, attr: int = 0, bg: int = 0) -> None:
+        """
+        :param width: The width of the layers
+        :param height: The height of the layers
+        :param layers: The names of the layers, from the bottom one to the top one
+        :param character: The character of the cells no layer covers
+        :param fg: The foreground colour of the cells no layer covers
+        :param attr: The attribute of the cells no layer covers
+        :param bg: The background colour of the cells no layer covers
+        """
+        self.width: int = width
+        self.height: int = height
+        self.empty_cell: tuple[str, int, int, int] = (character, fg, attr, bg)
+        self.layers: dict[str, Layer] = {}
+        self.frame: CellBuffer = CellBuffer(width, height, character, fg, attr, bg)
+        if layers is None:
+            layers = self.default_layers
+        for z_index, name in enumerate(layers):
+            self.add_layer(name, z_index)
+
+    def add_layer(self, name: str, z_index: int = None) -> Layer:
+        """
+        Add a layer (or get the existing one)
+        :param name: The name of the layer
+        :param z_index: The position of the layer in the stack, on top of the others when None
+        """
+        if name in self.layers:
+            return self.layers[name]
+        if z_index is None:
+            z_index = max(
+                (layer.z_index for layer in self.layers.values()),
+                default=-1
+            ) + 1
+        self.layers[name] = Layer(name, self.width, self.height, z_index)
+        return self.layers[name]
+
+    def get_layer(self, name: str) -> Layer:
+        """ Get a layer by its name """
+        if name not in self.layers:
+            raise KeyError(f"Unknown layer: {name}")
+        return self.layers[name]
+
+    def remove_layer(self, name: str) -> None:
+        """ Remove a layer """
+        self.layers.pop(name, None)
+
+    def clear(self, name: str = None) -> None:
+        """
+        Clear a layer, or all of them
+        :param name: The layer to clear, all of them are cleared when None
+        """
+        if name is not None:
+            self.get_layer(name).clear()
+            return
+        for layer in self.layers.values():
+            layer.clear()
+
+    def composite(self) -> CellBuffer:
+        """
+        Stack the visible layers into the frame
+        :return: the frame, a CellBuffer that is reused by the next calls
+        """
+        self.frame.fill(*self.empty_cell)
+        stack = sorted(self.layers.values(), key=lambda layer: layer.z_index)
+        for layer in stack:
+            if layer.visible is False:
+                continue
+            np.copyto(self.frame.character, layer.character, where=layer.mask)
+            np.copyto(self.frame.fg, layer.fg, where=layer.mask)
+            np.copyto(self.frame.attr, layer.attr, where=layer.mask)
+            np.copyto(self.frame.bg, layer.bg, where=layer.mask)
+        return self.frame
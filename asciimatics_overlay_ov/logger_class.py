@@ -0,0 +1,94 @@
+"""
+File in charge of routing the diagnostics of the library away from the terminal
+"""
+
+import logging
+from collections import deque
+
+LOGGER_NAME: str = "asciimatics_overlay_ov"
+LOGGER: logging.Logger = logging.getLogger(LOGGER_NAME)
+LOGGER.addHandler(logging.NullHandler())
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    The class in charge of keeping the last log records in memory
+    Each record is stored as a dictionary so that it can be filtered or serialised without parsing text.
+    """
+
+    def __init__(self, capacity: int = 1000, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.records: deque = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """ Store a record """
+        self.records.append(
+            {
+                "created": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "function": record.funcName,
+                "line": record.lineno,
+                "message": record.getMessage()
+            }
+        )
+
+    def get_records(self, level: int = logging.NOTSET) -> list[dict]:
+        """ Get the stored records whose level is at least the one provided """
+        return [
+            record for record in self.records
+            if logging.getLevelName(record["level"]) >= level
+        ]
+
+    def clear(self) -> None:
+        """ Forget the stored records """
+        self.records.clear()
+
+
+class Logger:
+    """
+    The class in charge of configuring where the diagnostics of the library go
+    Nothing is emitted by default: the library logger only has a NullHandler and the hot paths check the level once per call.
+    """
+
+    _handlers: list = []
+
+    @staticmethod
+    def get_logger() -> logging.Logger:
+        """ Get the logger used by the library """
+        return LOGGER
+
+    @classmethod
+    def enable_logging(cls, level: int = logging.DEBUG, file_path: str = None, ring_buffer_size: int = None, log_format: str = "%(asctime)s %(levelname)s %(funcName)s: %(message)s") -> RingBufferHandler:
+        """
+        Route the diagnostics of the library to a file and/or to an in-memory ring buffer
+        :param level: The minimum level of the records to keep
+        :param file_path: Optional path of the file the records are appended to
+        :param ring_buffer_size: Optional number of records to keep in memory
+        :param log_format: The format of the records written to the file
+        :return: The RingBufferHandler when ring_buffer_size is provided, None otherwise
+        """
+        cls.disable_logging()
+        ring_buffer = None
+        if file_path is not None:
+            file_handler = logging.FileHandler(file_path, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(log_format))
+            cls._handlers.append(file_handler)
+        if ring_buffer_size is not None:
+            ring_buffer = RingBufferHandler(ring_buffer_size)
+            cls._handlers.append(ring_buffer)
+        for handler in cls._handlers:
+            LOGGER.addHandler(handler)
+        LOGGER.setLevel(level)
+        LOGGER.propagate = False
+        return ring_buffer
+
+    @classmethod
+    def disable_logging(cls) -> None:
+        """ Remove the handlers added by enable_logging and silence the library again """
+        for handler in cls._handlers:
+            LOGGER.removeHandler(handler)
+            handler.close()
+        cls._handlers = []
+        LOGGER.setLevel(logging.NOTSET)
+        LOGGER.propagate = True
@@ -0,0 +1,155 @@
+"""
+File in charge of creating the scenes of an application only when they are first displayed
+"""
+
+import threading
+from asciimatics.scene import Scene
+from asciimatics.screen import Screen
+
+
+class _PendingEffect:
+    """ The effect listed by a LazyScene that is not built yet, it only answers the checks done by Screen.set_scenes """
+
+    def __init__(self, safe_to_default_unhandled_input: bool) -> None:
+        self.safe_to_default_unhandled_input: bool = safe_to_default_unhandled_input
+
+
+class LazyScene(Scene):
+    """
+    A Scene whose effects are created by a factory the first time the scene is reset (when asciimatics plays it, after a NextScene for example)
+    Until then, the effects property only lists a placeholder, so that giving the scene to Screen.play does not build it.
+    """
+
+    def __init__(self, factory: object, screen: Screen, duration: int = -1, clear: bool = True, name: str = None, safe_to_default_unhandled_input: bool = False) -> None:
+        """
+        :param factory: A function taking the screen and returning the effect (a Frame for example) or the list of effects of the scene
+        :param screen: The screen given to the factory
+        :param duration: The number of frames of the scene, -1 means don't stop (0 asks the effects, which builds the scene)
+        :param clear: Whether to clear the Screen at the start of the Scene
+        :param name: The name of the scene, used by NextScene
+        :param safe_to_default_unhandled_input: Whether the effects accept the default unhandled input handler of asciimatics (the Frames do not)
+        """
+        super().__init__([], duration=-1, clear=clear, name=name)
+        self._duration = duration
+        self.factory: object = factory
+        self.screen: Screen = screen
+        self.safe_to_default_unhandled_input: bool = safe_to_default_unhandled_input
+        self._build_lock: threading.Lock = threading.Lock()
+        self._built_effects: list = None
+
+    @property
+    def _effects(self) -> list:
+        """ The effects of the scene, built on first access """
+        if self._built_effects is None:
+            self.build()
+        return self._built_effects
+
+    @_effects.setter
+    def _effects(self, effects: list) -> None:
+        self._built_effects = effects
+
+    @property
+    def built(self) -> bool:
+        """ Whether the effects of the scene were created """
+        return self._built_effects is not None
+
+    def build(self) -> bool:
+        """
+        Create the effects of the scene, unless it is already built
+        :return: True when the effects were created by this call
+        """
+        with self._build_lock:
+            if self._built_effects is not None:
+                return False
+            effects = self.factory(self.screen)
+            if isinstance(effects, (list, tuple)) is False:
+                effects = [effects]
+            self._built_effects = []
+            for effect in effects:
+                self.add_effect(effect, reset=False)
+            return True
+
+    @property
+    def effects(self) -> list:
+        """ The effects of the scene, a placeholder until the scene is built """
+        if self._built_effects is None:
+            return [_PendingEffect(self.safe_to_default_unhandled_input)]
+        return self._built_effects
+
+    @property
+    def duration(self) -> int:
+        """ The length of the scene in frames """
+        if self._duration == 0:
+            self._duration = max(effect.stop_frame for effect in self._effects)
+        return self._duration
+
+
+class SceneRegistry:
+    """
+    The class in charge of declaring the scenes of an application without creating them
+    Every scene is a LazyScene: its frames are created on its first NextScene transition instead of when the application starts.
+    The scenes likely to be opened can be pre-warmed (in the background) once the first scene is displayed.
+    """
+
+    def __init__(self, screen: Screen) -> None:
+        """
+        :param screen: The screen given to the factories
+        """
+        self.screen: Screen = screen
+        self._scenes: dict[str, LazyScene] = {}
+
+    def register(self, name: str, factory: object, duration: int = -1, clear: bool = True, safe_to_default_unhandled_input: bool = False) -> LazyScene:
+        """
+        Declare a scene, the scene registered with the same name is replaced
+        Example: registry.register("Popup", Popup) where Popup is a Frame class taking the screen
+        :param name: The name of the scene, used by NextScene
+        :param factory: A function taking the screen and returning the effect or the list of effects of the scene
+        :return: The LazyScene
+        """
+        scene = LazyScene(
+            factory,
+            self.screen,
+            duration=duration,
+            clear=clear,
+            name=name,
+            safe_to_default_unhandled_input=safe_to_default_unhandled_input
+        )
+        self._scenes[name] = scene
+        return scene
+
+    def get_scene(self, name: str) -> LazyScene:
+        """ Get a registered scene, None when there is none with this name """
+        return self._scenes.get(name)
+
+    @property
+    def scenes(self) -> list[LazyScene]:
+        """ The scenes in their registration order, to give to Screen.play """
+        return list(self._scenes.values())
+
+    @property
+    def built_names(self) -> list[str]:
+        """ The names of the scenes already built """
+        return [name for name, scene in self._scenes.items() if scene.built is True]
+
+    def prewarm(self, names: list[str] = None, background: bool = False) -> threading.Thread:
+        """
+        Build scenes before they are displayed
+        :param names: The names of the scenes to build, all of them when None
+        :param background: Whether to build them in a worker thread instead of now
+        :return: The worker thread when background is True, None otherwise
+        """
+        if names is None:
+            names = list(self._scenes)
+        scenes = [self._scenes[name] for name in names]
+        if background is False:
+            self._build_scenes(scenes)
+            return None
+        thread = threading.Thread(target=self._build_scenes, args=(scenes,), daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _build_scenes(scenes: list[LazyScene]) -> None:
+        """ Build the scenes that are not built yet """
+        for scene in scenes:
+            scene.build()
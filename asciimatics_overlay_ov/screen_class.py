@@ -2,8 +2,15 @@
 File in charge of containing binders for the Screen interraction
 """
 
+import sys
+from typing import TYPE_CHECKING
 from asciimatics.screen import Screen as SC
 from asciimatics_overlay_ov.colour_class import Colour
+from asciimatics_overlay_ov.logger_class import LOGGER
+
+if TYPE_CHECKING:
+    from asciimatics_overlay_ov.frame_scheduler_class import FrameScheduler
+    from asciimatics_overlay_ov.async_driver_class import AsyncDriver
 
 
 class MyScreen:
@@ -19,14 +26,30 @@ class MyScreen:
         self.my_asciimatics_overlay_main_screen.close()
         return self.success
 
-    def create_game_screen(self) -> int:
-        """ Create the game screen """
-        self.my_asciimatics_overlay_main_screen = SC.open()
+    def create_game_screen(self, headless: bool = False, width: int = 80, height: int = 24) -> int:
+        """
+        Create the game screen
+        :param headless: Create an in-memory HeadlessScreen instead of opening the terminal
+        :param width: The width of the headless screen
+        :param height: The height of the headless screen
+        """
+        if headless is True:
+            # Imported here: the headless screen needs NumPy
+            from asciimatics_overlay_ov.headless_screen_class import HeadlessScreen
+            self.my_asciimatics_overlay_main_screen = HeadlessScreen.open(
+                width,
+                height
+            )
+        else:
+            self.my_asciimatics_overlay_main_screen = SC.open()
         return self.success
 
     def clear_screen(self) -> int:
         """ Clear the screen """
         self.my_asciimatics_overlay_main_screen.clear()
+        # The rows remembered by the frame diff layer of the Display class are no longer on the screen
+        if getattr(self, "frame_diff_enabled", False) is True:
+            self.reset_frame_diff()
         return self.success
 
     def refresh_screen(self) -> int:
@@ -34,13 +57,45 @@ class MyScreen:
         self.my_asciimatics_overlay_main_screen.refresh()
         return self.success
 
+    def create_frame_scheduler(self, fps: float = 30.0, callback: object = None) -> "FrameScheduler":
+        """
+        Create a scheduler running callbacks at a target frame rate and refreshing the screen once per frame
+        :param fps: The target number of frames per second
+        :param callback: Optional function called every frame with the frame number, returning False stops the scheduler
+        """
+        from asciimatics_overlay_ov.frame_scheduler_class import FrameScheduler
+        scheduler = FrameScheduler(fps, self.refresh_screen)
+        if callback is not None:
+            scheduler.add_callback(callback)
+        return scheduler
+
+    def create_async_driver(self, fps: float = 30.0, callback: object = None) -> "AsyncDriver":
+        """
+        Create a driver running the frames (and reading the input) from an asyncio event loop
+        The input is awaited on the standard input, a headless screen is polled once per frame instead.
+        Usage: await overlay.create_async_driver(30, draw).run()
+        :param fps: The target number of frames per second
+        :param callback: Optional function called every frame with the frame number, returning False stops the driver
+        """
+        # Imported here: the driver needs asyncio and the headless screen NumPy
+        from asciimatics_overlay_ov.async_driver_class import AsyncDriver
+        from asciimatics_overlay_ov.headless_screen_class import HeadlessScreen
+        input_file = sys.stdin
+        if isinstance(self.my_asciimatics_overlay_main_screen, HeadlessScreen) is True:
+            input_file = None
+        return AsyncDriver(
+            self.create_frame_scheduler(fps, callback),
+            self.my_asciimatics_overlay_main_screen,
+            input_file
+        )
+
     def set_screen_title(self, title: str) -> int:
         """ Set the screen title """
         if isinstance(title, str) is True:
             self.my_asciimatics_overlay_main_screen.set_title(title)
             return self.success
         if isinstance(title, (list, tuple, float, int, object)) is False:
-            print("Title must be of type 'string'")
+            LOGGER.warning("Title must be of type 'string'")
             return self.error
         content = ""
         if isinstance(title, (list, tuple)) is True:
@@ -0,0 +1,123 @@
+"""
+File in charge of passing the widget updates and draw commands of worker threads to the UI thread
+"""
+
+import threading
+from collections import deque
+from .logger_class import LOGGER
+from .frame_scheduler_class import FrameScheduler
+
+
+class UiCommandQueue:
+    """
+    The class in charge of queueing commands submitted from any thread and running them on the UI thread
+    A command submitted with a key replaces the pending command with the same key (it keeps its place in the queue),
+    so only the last write per widget (or per region) is applied when the queue is drained.
+    The lock is only held to append a command or to swap the pending commands out, never while a command runs.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._order: deque = deque()
+        self._commands: dict = {}
+        self.drained_count: int = 0
+        self.coalesced_count: int = 0
+        self._wakeups: list = []
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def call_soon_threadsafe(self, callback: object, *args: object, key: object = None, **kwargs: object) -> None:
+        """
+        Submit a command, it can be called from any thread
+        :param callback: The function to run on the UI thread
+        :param args: The positional arguments of the function
+        :param key: Optional hashable identifying what the command writes, the pending command with the same key is replaced
+        :param kwargs: The keyword arguments of the function
+        """
+        if key is None:
+            key = object()
+        with self._lock:
+            if key in self._commands:
+                self.coalesced_count += 1
+            else:
+                self._order.append(key)
+            self._commands[key] = (callback, args, kwargs)
+        for wakeup in tuple(self._wakeups):
+            wakeup()
+
+    def update_widget(self, widget: object, callback: object, *args: object, kind: object = None) -> None:
+        """
+        Submit a widget update, only the last update of each kind submitted for the widget before the next drain is applied
+        Example: queue.update_widget(label, overlay.apply_text_to_display, "42 %")
+        :param widget: The widget updated, given as the first argument of the callback
+        :param callback: The function applying the update
+        :param args: The other arguments of the function
+        :param kind: Optional hashable naming what the update writes (e.g. "text", "options"), the callback is used by default
+        """
+        if kind is None:
+            kind = callback
+        self.call_soon_threadsafe(callback, widget, *args, key=(widget, kind))
+
+    def drain(self) -> int:
+        """
+        Run the pending commands in their submission order, this must be called from the UI thread (once per frame)
+        The commands submitted while the queue is drained are run by the next drain.
+        :return: The number of commands run
+        """
+        if len(self._order) == 0:
+            return 0
+        with self._lock:
+            order = self._order
+            commands = self._commands
+            self._order = deque()
+            self._commands = {}
+        for key in order:
+            callback, args, kwargs = commands[key]
+            try:
+                callback(*args, **kwargs)
+            except Exception:
+                LOGGER.exception("UiCommandQueue: the command %r failed", callback)
+        self.drained_count += len(order)
+        return len(order)
+
+    def clear(self) -> None:
+        """ Drop the pending commands """
+        with self._lock:
+            self._order = deque()
+            self._commands = {}
+
+    def attach(self, scheduler: FrameScheduler) -> None:
+        """
+        Drain the queue at the start of every frame of a scheduler
+        With the asciimatics Screen.play loop, use attach_frame instead.
+        """
+        scheduler.callbacks.insert(0, self._drain_frame)
+
+    def attach_frame(self, frame: object) -> bool:
+        """
+        Drain the queue at the start of every update of an asciimatics Frame
+        The Screen.play loop skips the updates of an idle frame: every command submitted forces the screen of the frame to update on its next frame.
+        :param frame: The Frame, its _update method is wrapped on the instance
+        :return: False when the queue was already attached to the frame
+        """
+        attached = frame.__dict__.setdefault("_attached_ui_queues", [])
+        if any(queue is self for queue in attached) is True:
+            return False
+        attached.append(self)
+        update = frame._update
+
+        def _update(frame_no: int) -> None:
+            self.drain()
+            update(frame_no)
+
+        frame._update = _update
+        # force_update only raises a flag of the screen, it can be called from the worker threads
+        self._wakeups.append(frame.screen.force_update)
+        if len(self._order) > 0:
+            frame.screen.force_update()
+        return True
+
+    def _drain_frame(self, frame_number: int) -> None:
+        """ The per-frame callback added by attach """
+        self.drain()
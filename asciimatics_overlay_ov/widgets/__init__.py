@@ -1 +1,30 @@
-from .frame_nodes import FrameNodes
+"""
+File in charge of exposing the widgets, they are imported on their first access (asciimatics.widgets is only imported when needed)
+"""
+from .. import _import_submodule
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "FrameNodes": "frame_nodes",
+    "VirtualOptions": "virtual_listbox",
+    "VirtualListBox": "virtual_listbox",
+    "VirtualMultiColumnListBox": "virtual_listbox",
+    "FilterIndex": "filterable_listbox",
+    "FilterableListBox": "filterable_listbox",
+    "ScandirFileBrowser": "scandir_filebrowser",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> object:
+    """ Import a widget on its first access """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_submodule(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1 @@
+from .filterable_listbox import FilterIndex, FilterableListBox
@@ -0,0 +1,152 @@
+"""
+File in charge of filtering large option sets as the user types
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Union
+from ..virtual_listbox import VirtualOptions, VirtualListBox
+
+
+class FilterIndex:
+    """
+    The class in charge of finding the options whose text contains a query
+    A n-gram index (trigrams by default) over the texts is built once: a new query only checks the options containing its rarest n-gram.
+    When the new query contains the previous one (the user typed one more character), only the previous results are checked.
+    The results are the indexes of the matching options, in the order of the options.
+    """
+
+    def __init__(self, options: list[tuple[str, object]], ngram_size: int = 3, case_sensitive: bool = False) -> None:
+        """
+        :param options: The (text, value) options to filter
+        :param ngram_size: The length of the indexed n-grams
+        :param case_sensitive: Whether the case of the query matters
+        """
+        self.options: list[tuple[str, object]] = list(options)
+        self.ngram_size: int = max(ngram_size, 1)
+        self.case_sensitive: bool = case_sensitive
+        self.texts: list[str] = [self._normalise(f"{text}") for text, _ in self.options]
+        self.value_indexes: dict = {}
+        self.postings: dict[str, list[int]] = {}
+        for index, (_, value) in enumerate(self.options):
+            self.value_indexes.setdefault(value, index)
+        size = self.ngram_size
+        for index, text in enumerate(self.texts):
+            for ngram in {text[start:start + size] for start in range(len(text) - size + 1)}:
+                self.postings.setdefault(ngram, []).append(index)
+        self.query: str = ""
+        self.result: Sequence = range(len(self.options))
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def _normalise(self, text: str) -> str:
+        """ Apply the case sensitivity to a text """
+        if self.case_sensitive is True:
+            return text
+        return text.casefold()
+
+    def _candidates(self, query: str) -> Sequence:
+        """ Get the options that can contain a query, in the order of the options """
+        if self.query != "" and self.query in query:
+            return self.result
+        size = self.ngram_size
+        if len(query) < size:
+            return range(len(self.options))
+        smallest = None
+        for start in range(len(query) - size + 1):
+            posting = self.postings.get(query[start:start + size])
+            if posting is None:
+                return []
+            if smallest is None or len(posting) < len(smallest):
+                smallest = posting
+        return smallest
+
+    def search(self, query: str) -> Sequence:
+        """
+        Get the indexes of the options whose text contains the query
+        :param query: The text to look for, every option matches an empty query
+        :return: the indexes, in the order of the options
+        """
+        query = self._normalise(query)
+        if query == "":
+            result = range(len(self.options))
+        else:
+            texts = self.texts
+            result = [
+                index for index in self._candidates(query)
+                if query in texts[index]
+            ]
+        self.query = query
+        self.result = result
+        return result
+
+    def filter(self, query: str) -> list[tuple[str, object]]:
+        """ Get the options whose text contains the query """
+        options = self.options
+        return [options[index] for index in self.search(query)]
+
+
+class _FilteredOptions(Sequence):
+    """ A view on the options of a FilterIndex selected by a search """
+
+    def __init__(self, index: FilterIndex, result: Sequence) -> None:
+        self.index: FilterIndex = index
+        self.result: Sequence = result
+
+    def __len__(self) -> int:
+        return len(self.result)
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[tuple, list[tuple]]:
+        options = self.index.options
+        if isinstance(position, slice) is True:
+            return [options[index] for index in self.result[position]]
+        return options[self.result[position]]
+
+    def position_of(self, value: object) -> int:
+        """ Get the position of the option with a value, None when it is filtered out """
+        index = self.index.value_indexes.get(value)
+        if index is None:
+            return None
+        position = bisect_left(self.result, index)
+        if position < len(self.result) and self.result[position] == index:
+            return position
+        return None
+
+
+class FilterableListBox(VirtualListBox):
+    """
+    A ListBox displaying the options of a FilterIndex that match a query
+    Calling filter swaps the options in place (the widget is not recreated), and only the visible options are materialised.
+    """
+
+    def __init__(self, height: int, index: FilterIndex, prefetch: int = 64, **kwargs: object) -> None:
+        """
+        :param height: The required number of input lines for this ListBox.
+        :param index: The options to display, indexed
+        :param prefetch: The number of options materialised before and after the visible ones
+        :param kwargs: The other arguments of the asciimatics ListBox
+        """
+        self.filter_index: FilterIndex = index
+        self.prefetch: int = prefetch
+        self._query: str = ""
+        super().__init__(height, self._create_options(""), **kwargs)
+
+    def _create_options(self, query: str) -> VirtualOptions:
+        """ Create the options matching a query """
+        view = _FilteredOptions(self.filter_index, self.filter_index.search(query))
+        return VirtualOptions(view, len(view), self.prefetch, view.position_of)
+
+    @property
+    def query(self) -> str:
+        """ The query currently applied to this widget, the index can be shared with other widgets """
+        return self._query
+
+    def filter(self, query: str) -> int:
+        """
+        Only display the options whose text contains the query, the selection is kept when it still matches
+        :return: The number of matching options
+        """
+        self.options = self._create_options(query)
+        self._query = query
+        return len(self._options)
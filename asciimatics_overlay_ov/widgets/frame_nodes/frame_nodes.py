@@ -1,9 +1,42 @@
-from typing import Union
+from typing import Union, TYPE_CHECKING
 from datetime import datetime
 import asciimatics.widgets as WIG
 from asciimatics.screen import Screen
 from asciimatics.scene import Scene
 from asciimatics.widgets import Frame
+from ...logger_class import LOGGER
+
+# The other widgets and the deferred callbacks are imported by the factories using them
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from ...ui_command_queue_class import UiCommandQueue
+    from ..virtual_listbox import VirtualListBox, VirtualMultiColumnListBox
+    from ..filterable_listbox import FilterIndex, FilterableListBox
+
+
+def _get_text(widget: WIG.Widget) -> str:
+    """ Read the text of a widget displaying a text (Label, Button) """
+    return widget.text
+
+
+def _set_text(widget: WIG.Widget, value: object) -> None:
+    """ Write the text of a widget displaying a text (Label, Button) """
+    widget.text = f"{value}" if isinstance(value, (int, float)) is True else value
+
+
+def _get_value(widget: WIG.Widget) -> object:
+    """ Read the value of an input widget """
+    return widget.value
+
+
+def _set_value(widget: WIG.Widget, value: object) -> None:
+    """ Write the value of an input widget """
+    widget.value = value
+
+
+def _set_input_value(widget: WIG.Widget, value: object) -> None:
+    """ Write the value of a text input widget (Text, TextBox), the numbers are converted to text """
+    widget.value = f"{value}" if isinstance(value, (int, float)) is True else value
 
 
 class FrameNodes:
@@ -11,6 +44,8 @@ class FrameNodes:
     The class in charge of containing functions that will ease the implementation process
     """
 
+    _value_accessors: dict = {}
+
     def __init__(self, success: int = 0, error: int = 84) -> None:
         self.label_left: str = "<"
         self.label_right: str = ">"
@@ -18,7 +53,7 @@ class FrameNodes:
         self.success: int = success
         self.error: int = error
 
-    def add_listbox(self, input_data: list[tuple[str, int]], on_change: object, on_select: object, height: int = WIG.Widget.FILL_FRAME, name: str = "my_listbox", center: bool = False, scrollbar: bool = True, label: str = None) -> WIG.ListBox:
+    def add_listbox(self, input_data: list[tuple[str, int]], on_change: object, on_select: object, height: int = WIG.Widget.FILL_FRAME, name: str = "my_listbox", center: bool = False, scrollbar: bool = True, label: str = None, debounce: float = 0, throttle: float = 0, executor: "Executor" = None, on_result: object = None) -> WIG.ListBox:
         """
         Add a listbox to the layout
         :param input_data: The options for each row in the widget.
@@ -29,24 +64,30 @@ class FrameNodes:
         :param centre: Whether to centre the selected line in the list.
         :param scrollbar: Whether to add a scrollbar or not to the box
         :param label: An optional label for the widget.
+        :param debounce: Optional delay (in seconds) without change before on_change is called
+        :param throttle: Optional minimum delay (in seconds) between two calls of on_change
+        :param executor: Optional executor running on_change off the UI thread, on_change must then return its result instead of modifying the widgets
+        :param on_result: Optional function called on the UI thread with the return value of on_change
         :return: A new ListBox instance.
 
         The options are a list of tuples, where the first value is the string to be displayed to the user and the second is an interval value to identify the entry to the program.
         For example:
             input_data=[("First option", 1), ("Second option", 2)]
         """
-        return WIG.ListBox(
-            height=height,
-            options=input_data,
-            centre=center,
-            name=name,
-            add_scroll_bar=scrollbar,
-            on_change=on_change,
-            on_select=on_select,
-            label=label
+        return self._attach_deferred(
+            WIG.ListBox(
+                height=height,
+                options=input_data,
+                centre=center,
+                name=name,
+                add_scroll_bar=scrollbar,
+                on_change=self._defer_on_change(on_change, debounce, throttle, executor, on_result),
+                on_select=on_select,
+                label=label
+            )
         )
 
-    def add_textbox(self, height: int = 1, label: str = "Place Question", name: str = None, as_string: bool = True, line_wrap: bool = True, on_change: object = None, readonly: bool = False) -> WIG.TextBox:
+    def add_textbox(self, height: int = 1, label: str = "Place Question", name: str = None, as_string: bool = True, line_wrap: bool = True, on_change: object = None, readonly: bool = False, debounce: float = 0, throttle: float = 0, executor: "Executor" = None, on_result: object = None) -> WIG.TextBox:
         """
         Add a textbox to the layout
         :param height: The required number of input lines for this TextBox.
@@ -57,19 +98,25 @@ class FrameNodes:
         :param line_wrap: Whether to wrap at the end of the line.
         :param on_change: Optional function to call when text changes.
         :param readonly: Whether the widget prevents user input to change values. Default is False.
+        :param debounce: Optional delay (in seconds) without change before on_change is called
+        :param throttle: Optional minimum delay (in seconds) between two calls of on_change
+        :param executor: Optional executor running on_change off the UI thread, on_change must then return its result instead of modifying the widgets
+        :param on_result: Optional function called on the UI thread with the return value of on_change
         :return: A TextBox instance
         """
-        return WIG.TextBox(
-            height=height,
-            label=label,
-            name=name,
-            as_string=as_string,
-            line_wrap=line_wrap,
-            on_change=on_change,
-            readonly=readonly
+        return self._attach_deferred(
+            WIG.TextBox(
+                height=height,
+                label=label,
+                name=name,
+                as_string=as_string,
+                line_wrap=line_wrap,
+                on_change=self._defer_on_change(on_change, debounce, throttle, executor, on_result),
+                readonly=readonly
+            )
         )
 
-    def add_input(self, label: str = "Hello World !", name: str = None, on_change: object = None, hide_char: str = None, max_length: int = None, readonly: bool = False) -> WIG.Text:
+    def add_input(self, label: str = "Hello World !", name: str = None, on_change: object = None, hide_char: str = None, max_length: int = None, readonly: bool = False, debounce: float = 0, throttle: float = 0, executor: "Executor" = None, on_result: object = None) -> WIG.Text:
         """
         Add an input to the layout
         :param label: An optional label for the widget.
@@ -79,15 +126,21 @@ class FrameNodes:
         :param max_length: Optional maximum length of the field. If set, the widget will limit
             data entry to this length.
         :param readonly: Whether the widget prevents user input to change values. Default is False.
+        :param debounce: Optional delay (in seconds) without change before on_change is called
+        :param throttle: Optional minimum delay (in seconds) between two calls of on_change
+        :param executor: Optional executor running on_change off the UI thread, on_change must then return its result instead of modifying the widgets
+        :param on_result: Optional function called on the UI thread with the return value of on_change
         :return: A new Text instance.
         """
-        return WIG.Text(
-            label=label,
-            name=name,
-            on_change=on_change,
-            hide_char=hide_char,
-            max_length=max_length,
-            readonly=readonly
+        return self._attach_deferred(
+            WIG.Text(
+                label=label,
+                name=name,
+                on_change=self._defer_on_change(on_change, debounce, throttle, executor, on_result),
+                hide_char=hide_char,
+                max_length=max_length,
+                readonly=readonly
+            )
         )
 
     def add_button(self, text: str, on_click: object, label: str = None, box: bool = True, name: str = None) -> WIG.Button:
@@ -171,7 +224,7 @@ class FrameNodes:
             line_char=line_char
         )
 
-    def add_dropdownlist(self, options: list[tuple[str, int]], label: str = None, name: str = None, on_change: object = None, fit: bool = False) -> WIG.DropdownList:
+    def add_dropdownlist(self, options: list[tuple[str, int]], label: str = None, name: str = None, on_change: object = None, fit: bool = False, debounce: float = 0, throttle: float = 0, executor: "Executor" = None, on_result: object = None) -> WIG.DropdownList:
         """
         Add a dropdown list
         :param options: The options for each row in the widget.
@@ -179,20 +232,26 @@ class FrameNodes:
         :param name: The name for the ListBox.
         :param on_change: Optional function to call when selection changes.
         :param fit: Shrink width of dropdown to fit the width of options. Default False.
+        :param debounce: Optional delay (in seconds) without change before on_change is called
+        :param throttle: Optional minimum delay (in seconds) between two calls of on_change
+        :param executor: Optional executor running on_change off the UI thread, on_change must then return its result instead of modifying the widgets
+        :param on_result: Optional function called on the UI thread with the return value of on_change
         :return: a DropdownList instance
         The options are a list of tuples, where the first value is the string to be displayed to the user and the second is an interval value to identify the entry to the program.
         For example:
             options=[("First option", 1), ("Second option", 2)]
         """
-        return WIG.DropdownList(
-            options=options,
-            label=label,
-            name=name,
-            on_change=on_change,
-            fit=fit
+        return self._attach_deferred(
+            WIG.DropdownList(
+                options=options,
+                label=label,
+                name=name,
+                on_change=self._defer_on_change(on_change, debounce, throttle, executor, on_result),
+                fit=fit
+            )
         )
 
-    def add_filebrowser(self, height: int = 10, root: str = ".", name: str = "File browser", on_select: object = None, on_change: object = None, file_filter: str = ".*.txt$") -> WIG.FileBrowser:
+    def add_filebrowser(self, height: int = 10, root: str = ".", name: str = "File browser", on_select: object = None, on_change: object = None, file_filter: str = ".*.txt$", background_scan: bool = False) -> WIG.FileBrowser:
         """
         Add a file browser to the layout
         :param height: The desired height for this widget.
@@ -205,8 +264,19 @@ class FrameNodes:
         Most people will want to use a filter to find files with a particular extension.
         In this case, you must use a regex that matches to the end of the line - e.g. use ".*.txt$" to find files ending with ".txt".
         This ensures that you don't accidentally pick up files containing the filter.
+        :param background_scan: List the directories in a worker thread (streaming the entries into the list) and cache the listings per directory, see ScandirFileBrowser
         :return: a FileBrowser instance
         """
+        if background_scan is True:
+            from ..scandir_filebrowser import ScandirFileBrowser
+            return ScandirFileBrowser(
+                height=height,
+                root=root,
+                name=name,
+                on_select=on_select,
+                on_change=on_change,
+                file_filter=file_filter
+            )
         return WIG.FileBrowser(
             height=height,
             root=root,
@@ -308,6 +378,114 @@ class FrameNodes:
             space_delimiter=space_delimiter
         )
 
+    def add_virtual_listbox(self, source: Union[list, object], on_change: object, on_select: object, height: int = WIG.Widget.FILL_FRAME, name: str = "my_listbox", center: bool = False, scrollbar: bool = True, label: str = None, length: int = None, prefetch: int = 64, value_to_index: object = None) -> "VirtualListBox":
+        """
+        Add a listbox that only materialises the options it displays
+        :param source: A sequence of items, or a fetch(start, stop) function returning the items of a range
+        :param on_change: Optional function to call when selection changes.
+        :param on_select: Optional function to call when the user actually selects an entry from
+        :param height: The required number of input lines for this ListBox.
+        :param name: The name for the ListBox.
+        :param center: Whether to centre the selected line in the list.
+        :param scrollbar: Whether to add a scrollbar or not to the box
+        :param label: An optional label for the widget.
+        :param length: The number of items, mandatory when the source is a function
+        :param prefetch: The number of options fetched before and after the visible ones
+        :param value_to_index: Optional function finding the index of the option with a value
+        :return: A new VirtualListBox instance.
+
+        The items are either (text, value) tuples, or bare texts whose value is then their index.
+        For example, with the lines of a file:
+            source=lines, where lines[index] is the text of the option with the value index
+        """
+        from ..virtual_listbox import VirtualOptions, VirtualListBox
+        return VirtualListBox(
+            height=height,
+            options=VirtualOptions(source, length, prefetch, value_to_index),
+            centre=center,
+            name=name,
+            add_scroll_bar=scrollbar,
+            on_change=on_change,
+            on_select=on_select,
+            label=label
+        )
+
+    def add_virtual_multicolumnlistbox(self, source: Union[list, object], height: int = 10, columns: list[int] = None, titles: list[str] = None, label: str = None, name: str = None, add_scroll_bar: bool = False, on_change: object = None, on_select: object = None, space_delimiter: str = " ", length: int = None, prefetch: int = 64, value_to_index: object = None) -> "VirtualMultiColumnListBox":
+        """
+        Add a multi column listbox that only materialises the rows it displays
+        :param source: A sequence of items, or a fetch(start, stop) function returning the items of a range
+        :param length: The number of items, mandatory when the source is a function
+        :param prefetch: The number of rows fetched before and after the visible ones
+        :param value_to_index: Optional function finding the index of the row with a value
+        The other parameters are the ones of add_multicolumnlistbox.
+        The items are either ([val1, ... , valn], value) tuples, or bare [val1, ... , valn] rows whose value is then their index.
+        """
+        from ..virtual_listbox import VirtualOptions, VirtualMultiColumnListBox
+        return VirtualMultiColumnListBox(
+            height=height,
+            columns=columns,
+            options=VirtualOptions(source, length, prefetch, value_to_index),
+            titles=titles,
+            label=label,
+            name=name,
+            add_scroll_bar=add_scroll_bar,
+            on_change=on_change,
+            on_select=on_select,
+            space_delimiter=space_delimiter
+        )
+
+    def add_filterable_listbox(self, options: Union[list[tuple[str, int]], "FilterIndex"], on_change: object, on_select: object, height: int = WIG.Widget.FILL_FRAME, name: str = "my_listbox", center: bool = False, scrollbar: bool = True, label: str = None, prefetch: int = 64) -> "FilterableListBox":
+        """
+        Add a listbox whose options can be filtered as the user types, without recreating the widget
+        :param options: The options for each row in the widget, or a FilterIndex already built over them (it can be shared between widgets).
+        :param on_change: Optional function to call when selection changes.
+        :param on_select: Optional function to call when the user actually selects an entry from
+        :param height: The required number of input lines for this ListBox.
+        :param name: The name for the ListBox.
+        :param center: Whether to centre the selected line in the list.
+        :param scrollbar: Whether to add a scrollbar or not to the box
+        :param label: An optional label for the widget.
+        :param prefetch: The number of options materialised before and after the visible ones
+        :return: A new FilterableListBox instance.
+
+        Call the filter method of the listbox with the query, for example from the on_change of an input:
+            listbox.filter(self.get_widget_value(search_input))
+        """
+        from ..filterable_listbox import FilterIndex, FilterableListBox
+        if isinstance(options, FilterIndex) is False:
+            options = FilterIndex(options)
+        return FilterableListBox(
+            height,
+            options,
+            prefetch,
+            centre=center,
+            name=name,
+            add_scroll_bar=scrollbar,
+            on_change=on_change,
+            on_select=on_select,
+            label=label
+        )
+
+    def apply_filter_to_options(self, widget: object, index: "FilterIndex", query: str) -> int:
+        """
+        Replace the options of a widget (a DropdownList for instance) by the options of an index containing a query
+        :param widget: The widget to update
+        :param index: The index over all the options of the widget
+        :param query: The text the options must contain
+        :return: 0 if success, 1 if error (these are based on the self.success and self.error of the class)
+        """
+        if widget is None or hasattr(widget, "options") is False:
+            LOGGER.warning(
+                "apply_filter_to_options: 'widget' does not have the 'options' attribute"
+            )
+            return self.error
+        from ..filterable_listbox import FilterableListBox
+        if isinstance(widget, FilterableListBox) is True:
+            widget.filter(query)
+            return self.success
+        widget.options = index.filter(query)
+        return self.success
+
     def add_radiobuttons(self, options: list[tuple[str, int]], label: str = None, name: str = None, on_change: object = None) -> WIG.RadioButtons:
         """
         Add a radio button to the layout
@@ -451,7 +629,7 @@ class FrameNodes:
         :return: The text from the text box
         """
         if text_box is None:
-            print(
+            LOGGER.warning(
                 "get_text_input: 'text_box' cannot be equal to 'None'"
             )
             return self.error
@@ -460,7 +638,7 @@ class FrameNodes:
         if hasattr(text_box, "value") is True:
             return text_box.value
 
-        print(
+        LOGGER.warning(
             "get_text_input: 'text_box' does not have the 'value' attribute"
         )
         return self.error
@@ -472,17 +650,94 @@ class FrameNodes:
         :return: The value from the widget
         """
         if widget is None:
-            print(
+            LOGGER.warning(
                 "get_widget_input: 'widget' cannot be equal to 'None'"
             )
             return self.error
         if hasattr(widget, "value") is True:
             return widget.value
-        print(
+        LOGGER.warning(
             "get_widget_input: 'widget' does not have the 'value' attribute"
         )
         return self.error
 
+    @property
+    def ui_queue(self) -> "UiCommandQueue":
+        """
+        The queue passing the deferred on_change calls and their results to the UI thread
+        It is drained by the update of the Frame of the widgets created by the factories, UiCommandQueue.attach drains it from a FrameScheduler too.
+        """
+        queue = self.__dict__.get("_ui_queue")
+        if queue is None:
+            from ...ui_command_queue_class import UiCommandQueue
+            queue = self._ui_queue = UiCommandQueue()
+        return queue
+
+    def _defer_on_change(self, on_change: object, debounce: float, throttle: float, executor: "Executor", on_result: object) -> object:
+        """ Wrap an on_change callback in a DeferredCallback when it is debounced, throttled or run in an executor """
+        if on_change is None or (debounce <= 0 and throttle <= 0 and executor is None):
+            return on_change
+        from ...deferred_callback_class import DeferredCallback
+        return DeferredCallback(
+            on_change,
+            debounce=debounce,
+            throttle=throttle,
+            executor=executor,
+            on_result=on_result,
+            queue=self.ui_queue
+        )
+
+    @staticmethod
+    def _attach_deferred(widget: WIG.Widget) -> WIG.Widget:
+        """ Let the deferred on_change of a widget drain its queue from the Frame the widget is placed in """
+        # Only the DeferredCallback can be attached, checked without importing it for the plain callbacks
+        attach_widget = getattr(getattr(widget, "_on_change", None), "attach_widget", None)
+        if attach_widget is not None:
+            attach_widget(widget)
+        return widget
+
+    @staticmethod
+    def _get_layout_signature(frame: Frame) -> tuple:
+        """ Identify the columns of the layouts of a frame and their length, clearing or filling a layout changes it """
+        return tuple(
+            (id(column), len(column))
+            for layout in frame._layouts
+            for column in layout._columns
+        )
+
+    def _get_widget_index(self, frame: Frame) -> dict:
+        """
+        Get the widget index of a frame, it is stored on the frame and rebuilt (with one walk of the layouts) when they changed
+        :return: a {widget_name: widget} dictionary, the first widget with a name wins (like Frame.find_widget)
+        """
+        signature = self._get_layout_signature(frame)
+        cached = frame.__dict__.get("_widget_index")
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        index = {}
+        for widget in self._iter_named_widgets(frame):
+            index.setdefault(widget.name, widget)
+        frame.__dict__["_widget_index"] = (signature, index)
+        return index
+
+    def clear_widget_index(self, your_self: Frame) -> None:
+        """
+        Drop the widget index of a frame, the next lookup rebuilds it
+        This is only needed after replacing a widget of a layout in place, the widgets added to or cleared from the layouts are noticed.
+        :param your_self: The frame whose index is dropped
+        """
+        your_self.__dict__.pop("_widget_index", None)
+
+    def find_widget_by_name(self, your_self: Frame, widget_name: str) -> WIG.Widget:
+        """
+        Find a widget of a frame by its name
+        The widget index of the frame is used, it only holds the widgets currently in the layouts of the frame.
+        :param your_self: The frame containing the widget
+        :param widget_name: The name of the widget
+        :return: The widget, None when it is not found
+        """
+        return self._get_widget_index(your_self).get(widget_name)
+
     def get_widget_value_by_name(self, your_self: Frame, widget_name: str) -> Union[str, int]:
         """
         Get the value of a widget
@@ -490,14 +745,14 @@ class FrameNodes:
         :return: The value of the widget
         """
         if widget_name is None:
-            print(
+            LOGGER.warning(
                 "get_widget_value: 'widget_name' cannot be equal to 'None'"
             )
             return self.error
-        target_widget = your_self.find_widget(widget_name)
+        target_widget = self.find_widget_by_name(your_self, widget_name)
         if hasattr(target_widget, "value") is True:
             return target_widget.value
-        print(
+        LOGGER.warning(
             "get_widget_value: 'widget_name' does not have the 'value' attribute"
         )
         return self.error
@@ -510,12 +765,12 @@ class FrameNodes:
         :return: 0 if success, 1 if error (these are based on the self.success and self.error of the class)
         """
         if label is None:
-            print(
+            LOGGER.warning(
                 "apply_text_to_display: 'label' cannot be equal to 'None'"
             )
             return self.error
         if isinstance(text, (int, str, float, object)) is False:
-            print(
+            LOGGER.warning(
                 "apply_text_to_display: Text type has to be of type (string, int or float)"
             )
             return self.error
@@ -525,7 +780,7 @@ class FrameNodes:
             else:
                 label.text = text
             return self.success
-        print(
+        LOGGER.warning(
             "apply_text_to_display: 'label' does not have the 'text' attribute"
         )
         return self.error
@@ -538,12 +793,12 @@ class FrameNodes:
         :return: 0 if success, 1 if error (these are based on the self.success and self.error of the class)
         """
         if text_box is None:
-            print(
+            LOGGER.warning(
                 "apply_text_to_input_box: 'text_box' cannot be equal to 'None'"
             )
             return self.error
         if isinstance(text, (int, str, float, object)) is False:
-            print(
+            LOGGER.warning(
                 "apply_text_to_input_box: Text type has to be of type (string, int or float)"
             )
             return self.error
@@ -560,7 +815,7 @@ class FrameNodes:
             else:
                 text_box.value = text
             return self.success
-        print(
+        LOGGER.warning(
             "apply_text_to_input_box: 'text_box' does not have the 'value' attribute"
         )
         return self.error
@@ -583,6 +838,86 @@ class FrameNodes:
         text = self.get_text_input(input_source)
         return self.apply_text_to_input_box(output_source, text)
 
+    @staticmethod
+    def _get_value_accessors(widget_class: type) -> tuple:
+        """
+        Get the (getter, setter) functions of the value of a widget class, resolved once per class
+        :return: the functions, (None, None) when the widgets of the class have no value
+        """
+        accessors = FrameNodes._value_accessors.get(widget_class)
+        if accessors is None:
+            if isinstance(getattr(widget_class, "text", None), property) is True:
+                accessors = (_get_text, _set_text)
+            elif issubclass(widget_class, (WIG.Text, WIG.TextBox)) is True:
+                accessors = (_get_value, _set_input_value)
+            elif isinstance(getattr(widget_class, "value", None), property) is True:
+                accessors = (_get_value, _set_value)
+            else:
+                accessors = (None, None)
+            FrameNodes._value_accessors[widget_class] = accessors
+        return accessors
+
+    @staticmethod
+    def _iter_named_widgets(frame: Frame) -> object:
+        """ Iterate over the named widgets of a frame, in the order of its layouts """
+        for layout in frame._layouts:
+            for column in layout._columns:
+                for widget in column:
+                    if widget.name is not None:
+                        yield widget
+
+    def snapshot_values(self, frame: Frame) -> dict:
+        """
+        Get the values of all the named widgets of a frame in one pass
+        The text of the Labels and Buttons is returned as their value, the widgets without a value are skipped.
+        :param frame: The frame to read
+        :return: a {widget_name: value} dictionary, that can be given back to apply_values
+        """
+        values = {}
+        for widget in self._iter_named_widgets(frame):
+            getter = self._get_value_accessors(type(widget))[0]
+            if getter is not None:
+                values[widget.name] = getter(widget)
+        return values
+
+    def apply_values(self, frame: Frame, mapping: dict, redraw: bool = True) -> int:
+        """
+        Apply values to the named widgets of a frame in one pass, then redraw the frame once
+        The text of the Labels and Buttons is set from their value, the numbers given to a Label, Button, Text or TextBox are converted to text.
+        :param frame: The frame containing the widgets
+        :param mapping: a {widget_name: value} dictionary
+        :param redraw: Whether to redraw the frame once the values are applied
+        :return: 0 if success, 1 if error (these are based on the self.success and self.error of the class)
+        """
+        if frame is None or mapping is None:
+            LOGGER.warning(
+                "apply_values: 'frame' and 'mapping' cannot be equal to 'None'"
+            )
+            return self.error
+        status = self.success
+        applied = set()
+        for widget in self._iter_named_widgets(frame):
+            if widget.name not in mapping:
+                continue
+            applied.add(widget.name)
+            setter = self._get_value_accessors(type(widget))[1]
+            if setter is None:
+                LOGGER.warning(
+                    "apply_values: the widget '%s' does not have a value", widget.name
+                )
+                status = self.error
+                continue
+            setter(widget, mapping[widget.name])
+        if len(applied) < len(mapping):
+            LOGGER.warning(
+                "apply_values: unknown widgets %s",
+                [name for name in mapping if name not in applied]
+            )
+            status = self.error
+        if redraw is True:
+            frame.fix()
+        return status
+
     def set_scene_colour(self, scene: Scene, fg: int = -1, bg: int = -1) -> int:
         """
         Set the colour of a scene
@@ -592,17 +927,17 @@ class FrameNodes:
         :return: 0 if success, 1 if error (these are based on the self.success and self.error of the class)
         """
         if scene is None:
-            print(
+            LOGGER.warning(
                 "set_scene_colour: 'scene' cannot be equal to 'None'"
             )
             return self.error
         if isinstance(fg, int) is False:
-            print(
+            LOGGER.warning(
                 "set_scene_colour: 'fg' has to be of type 'int'"
             )
             return self.error
         if isinstance(bg, int) is False:
-            print(
+            LOGGER.warning(
                 "set_scene_colour: 'bg' has to be of type 'int'"
             )
             return self.error
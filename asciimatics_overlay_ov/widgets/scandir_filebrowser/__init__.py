@@ -0,0 +1 @@
+from .scandir_filebrowser import ScandirFileBrowser
@@ -0,0 +1,258 @@
+"""
+File in charge of containing a file browser listing the directories in a worker thread
+"""
+
+import os
+import heapq
+import threading
+import unicodedata
+from collections import deque, OrderedDict
+from asciimatics.utilities import readable_timestamp, readable_mem
+import asciimatics.widgets as WIG
+
+
+class ScandirFileBrowser(WIG.FileBrowser):
+    """
+    A FileBrowser whose directories are listed with os.scandir in a worker thread
+    The entries are streamed into the list as they are found (each update of the widget adds the ones found since the previous one),
+    the file_filter being applied in the worker. The listings are cached per directory and reused while the modification time of the directory is unchanged,
+    the least recently used listings are dropped beyond listing_cache_size directories.
+    """
+
+    listing_cache: OrderedDict = OrderedDict()
+    listing_cache_size: int = 64
+    batch_size: int = 256
+
+    def __init__(self, height: int, root: str, name: str = None, on_select: object = None, on_change: object = None, file_filter: str = None, use_cache: bool = True) -> None:
+        """
+        :param use_cache: Whether to reuse the listing of a directory that was not modified since it was scanned
+        The other parameters are the ones of the asciimatics FileBrowser.
+        """
+        super().__init__(
+            height,
+            root,
+            name=name,
+            on_select=on_select,
+            on_change=on_change,
+            file_filter=file_filter
+        )
+        self.file_filter_pattern: str = file_filter
+        self.use_cache: bool = use_cache
+        self.scanning: bool = False
+        self._scan_generation: int = 0
+        self._scan_thread: threading.Thread = None
+        self._pending: deque = deque()
+        self._parent_row: tuple = None
+        self._tree_dirs: list = []
+        self._tree_files: list = []
+
+    @classmethod
+    def clear_listing_cache(cls) -> None:
+        """ Forget the cached listings """
+        cls.listing_cache.clear()
+
+    @staticmethod
+    def _get_mtime(path: str) -> int:
+        """ Get the modification time of a directory, None when it cannot be read """
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def frame_update_count(self) -> int:
+        """ Update the widget every frame while entries are found, so that they stream in without waiting for an input """
+        if self.scanning is True or len(self._pending) > 0:
+            return 1
+        return super().frame_update_count
+
+    def update(self, frame_no: int) -> None:
+        """ Add the entries found since the previous frame and draw the widget """
+        if self._initialized is True:
+            self.receive_entries()
+        super().update(frame_no)
+
+    def _populate_list(self, value: str) -> None:
+        """
+        Display the content of a directory, from the cache or by starting a scan in a worker thread
+        :param value: The directory (or a file of the directory) to display
+        """
+        if value is None or self._in_update is True:
+            return
+        self._in_update = True
+        try:
+            self._root = os.path.abspath(
+                value if os.path.isdir(value) else os.path.dirname(value)
+            )
+            self._parent_row = None
+            if len(self._root) > len(os.path.abspath(os.sep)):
+                self._parent_row = (
+                    ["|-+ .."],
+                    os.path.abspath(os.path.join(self._root, ".."))
+                )
+            self._scan_generation += 1
+            self._pending = deque()
+            mtime = self._get_mtime(self._root)
+            cached = self.listing_cache.get((self._root, self.file_filter_pattern))
+            if self.use_cache is True and mtime is not None and cached is not None and cached[0] == mtime:
+                self.listing_cache.move_to_end((self._root, self.file_filter_pattern))
+                self._tree_dirs = list(cached[1])
+                self._tree_files = list(cached[2])
+                self.scanning = False
+            else:
+                self._tree_dirs = []
+                self._tree_files = []
+                self.scanning = True
+                self._scan_thread = threading.Thread(
+                    target=self._scan,
+                    args=(self._root, mtime, self._scan_generation, self._pending),
+                    daemon=True
+                )
+                self._scan_thread.start()
+            self._apply_entries()
+        finally:
+            self._in_update = False
+
+    def _create_row(self, entry: os.DirEntry) -> tuple[bool, tuple]:
+        """
+        Create the row of a directory entry (in the worker thread)
+        :return: a (is_directory, row) tuple, None when the entry is filtered out
+        :raises OSError: When the target of a link cannot be read
+        """
+        try:
+            details = entry.stat(follow_symlinks=False)
+            size, mtime = details.st_size, details.st_mtime
+        except OSError:
+            size, mtime = 0, 0
+        try:
+            is_dir = entry.is_dir()
+            is_link = entry.is_symlink()
+        except OSError:
+            is_dir = is_link = False
+        name = f"|-- {entry.name}"
+        if is_dir is True:
+            if is_link is True:
+                name = f"|-+ {entry.name} -> {os.path.realpath(entry.path)}"
+            else:
+                name = f"|-+ {entry.name}"
+        elif self._file_filter and not self._file_filter.match(entry.name):
+            return None
+        elif is_link is True:
+            try:
+                real_path = os.path.realpath(entry.path)
+            except OSError:
+                real_path = None
+            if real_path and os.path.exists(real_path):
+                details = os.stat(real_path)
+                size, mtime = details.st_size, details.st_mtime
+            name = f"|-- {entry.name} -> {real_path}"
+        return is_dir, (
+            [
+                unicodedata.normalize("NFC", name),
+                readable_mem(size),
+                readable_timestamp(mtime)
+            ],
+            entry.path
+        )
+
+    def _scan(self, root: str, mtime: int, generation: int, pending: deque) -> None:
+        """
+        List a directory (in the worker thread), the rows are sent in batches through the pending queue
+        The scan stops as soon as another directory is displayed. The entries that cannot be read are skipped,
+        the modification time ending the batches is None when the listing itself failed, so that a partial listing is not cached.
+        """
+        batch = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if generation != self._scan_generation:
+                        return
+                    try:
+                        row = self._create_row(entry)
+                    except OSError:
+                        # The entry vanished or its target cannot be read
+                        continue
+                    if row is not None:
+                        batch.append(row)
+                    if len(batch) >= self.batch_size:
+                        pending.append(batch)
+                        batch = []
+        except OSError:
+            # Can fail due to access permissions
+            mtime = None
+        pending.append(batch)
+        pending.append(mtime)
+
+    def receive_entries(self) -> int:
+        """
+        Add the entries found by the worker thread to the list, this must be called from the UI thread
+        :return: The number of entries added
+        """
+        new_dirs = []
+        new_files = []
+        mtime = None
+        finished = False
+        pending = self._pending
+        while len(pending) > 0:
+            batch = pending.popleft()
+            if isinstance(batch, list) is False:
+                finished = True
+                mtime = batch
+                continue
+            for is_dir, row in batch:
+                if is_dir is True:
+                    new_dirs.append(row)
+                else:
+                    new_files.append(row)
+        received = len(new_dirs) + len(new_files)
+        if received > 0:
+            # The lists are kept sorted: only the new rows are sorted, then merged in
+            self._tree_dirs = self._merge_rows(self._tree_dirs, new_dirs)
+            self._tree_files = self._merge_rows(self._tree_files, new_files)
+            self._apply_entries()
+        if finished is True:
+            self.scanning = False
+            if mtime is not None:
+                self._store_listing(mtime)
+        return received
+
+    def _store_listing(self, mtime: int) -> None:
+        """ Cache the listing of the displayed directory, dropping the least recently used listings beyond listing_cache_size """
+        key = (self._root, self.file_filter_pattern)
+        self.listing_cache[key] = (
+            mtime,
+            tuple(self._tree_dirs),
+            tuple(self._tree_files)
+        )
+        self.listing_cache.move_to_end(key)
+        while len(self.listing_cache) > self.listing_cache_size:
+            self.listing_cache.popitem(last=False)
+
+    @staticmethod
+    def _merge_rows(rows: list, new_rows: list) -> list:
+        """ Merge unsorted new rows into a sorted list of rows """
+        if len(new_rows) == 0:
+            return rows
+        new_rows.sort()
+        if len(rows) == 0:
+            return new_rows
+        return list(heapq.merge(rows, new_rows))
+
+    def wait_for_scan(self, timeout: float = None) -> int:
+        """
+        Wait for the current scan to finish and add its entries to the list
+        :return: The number of entries added
+        """
+        if self._scan_thread is not None:
+            self._scan_thread.join(timeout)
+        return self.receive_entries()
+
+    def _apply_entries(self) -> None:
+        """ Display the entries received so far (the sorted lists of rows), the directories first """
+        tree_view = []
+        if self._parent_row is not None:
+            tree_view.append(self._parent_row)
+        tree_view.extend(self._tree_dirs)
+        tree_view.extend(self._tree_files)
+        self.options = tree_view
+        self._titles[0] = self._root
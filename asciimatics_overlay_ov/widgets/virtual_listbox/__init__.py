@@ -0,0 +1 @@
+from .virtual_listbox import VirtualOptions, VirtualListBox, VirtualMultiColumnListBox
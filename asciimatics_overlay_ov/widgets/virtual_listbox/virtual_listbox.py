@@ -0,0 +1,186 @@
+"""
+File in charge of containing the list boxes that only materialise the options they display
+"""
+
+from collections.abc import Sequence
+from typing import Union
+import asciimatics.widgets as WIG
+
+
+class VirtualOptions(Sequence):
+    """
+    The class in charge of exposing a data source as a list of options without materialising it
+    The source is either a sequence or a function fetch(start, stop) returning the items of a range (the length must then be provided).
+    An item is either an option tuple (text, value) or a bare text, whose value is then its index.
+    Only the last fetched window (the requested range plus the prefetch on each side) is kept in memory.
+    """
+
+    def __init__(self, source: Union[Sequence, object], length: int = None, prefetch: int = 64, value_to_index: object = None) -> None:
+        """
+        :param source: The sequence of items, or a fetch(start, stop) function
+        :param length: The number of items, mandatory when the source is a function
+        :param prefetch: The number of items fetched before and after the requested range
+        :param value_to_index: Optional function finding the index of the option with a value,
+        it is required to select the values that are not indexes (outside of the current window), the source is never scanned
+        """
+        if callable(source) is True and isinstance(source, Sequence) is False:
+            if length is None:
+                raise ValueError("The length is required when the source is a function")
+            self._fetch: object = source
+        else:
+            if length is None:
+                length = len(source)
+            self._fetch: object = lambda start, stop: source[start:stop]
+        self.length: int = length
+        self.prefetch: int = max(prefetch, 0)
+        self.value_to_index: object = value_to_index
+        self.fetch_count: int = 0
+        self._window_start: int = 0
+        self._window: list = []
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[tuple, list[tuple]]:
+        if isinstance(index, slice) is True:
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return self.window(start, stop)
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("VirtualOptions index out of range")
+        return self.window(index, index + 1)[0]
+
+    def window(self, start: int, stop: int) -> list[tuple]:
+        """
+        Get the options of a range, fetching it (with the prefetch) when it is not in the current window
+        :return: a list of (text, value) tuples
+        """
+        start = max(start, 0)
+        stop = min(stop, self.length)
+        if start >= stop:
+            return []
+        window_stop = self._window_start + len(self._window)
+        if start < self._window_start or stop > window_stop:
+            self._window_start = max(start - self.prefetch, 0)
+            fetch_stop = min(stop + self.prefetch, self.length)
+            self._window = [
+                self._to_option(item, self._window_start + offset)
+                for offset, item in enumerate(self._fetch(self._window_start, fetch_stop))
+            ]
+            self.fetch_count += 1
+        return self._window[start - self._window_start:stop - self._window_start]
+
+    @staticmethod
+    def _to_option(item: object, index: int) -> tuple:
+        """ Convert an item of the source to a (text, value) option """
+        if isinstance(item, tuple) is True and len(item) == 2:
+            return item
+        return (item, index)
+
+    def index_of(self, value: object) -> int:
+        """
+        Get the index of the option with a value, without fetching the whole source
+        Only the options of the current window and the values that are indexes are found, the other values need value_to_index.
+        :return: the index, or None when no option with this value is found
+        """
+        if value is None:
+            return None
+        if self.value_to_index is not None:
+            return self.value_to_index(value)
+        for offset, (_, option_value) in enumerate(self._window):
+            if option_value == value:
+                return self._window_start + offset
+        if isinstance(value, int) is True and 0 <= value < self.length:
+            if self[value][1] == value:
+                return value
+        return None
+
+
+class _OptionWindow(list):
+    """ The visible options handed to the asciimatics drawing code, its length is the one of the whole source """
+
+    def __init__(self, options: list, length: int) -> None:
+        super().__init__(options)
+        self.length: int = length
+
+    def __len__(self) -> int:
+        return self.length
+
+
+class _VirtualListBoxMixin:
+    """
+    The class in charge of making an asciimatics list box draw and select from VirtualOptions
+    The asciimatics drawing code walks every option, so the options are swapped for the visible window while the widget is drawn.
+    """
+
+    _window_offset: int = 0
+
+    def _parse_options(self, options: Union[Sequence, VirtualOptions]) -> VirtualOptions:
+        """ Wrap the options in VirtualOptions """
+        if options is None:
+            options = []
+        if isinstance(options, VirtualOptions) is False:
+            options = VirtualOptions(options)
+        return options
+
+    def update(self, frame_no: int) -> None:
+        """ Draw the widget, only the visible options are materialised """
+        options = self._options
+        first = max(min(self._start_line, self._line - self._h), 0)
+        last = max(self._start_line, self._line) + self._h + 1
+        self._window_offset = first
+        self._options = _OptionWindow(options.window(first, last), len(options))
+        self._line -= first
+        self._start_line -= first
+        try:
+            super().update(frame_no)
+        finally:
+            self._start_line += first
+            self._line += first
+            self._options = options
+            self._window_offset = 0
+
+    def _get_pos(self) -> float:
+        """ Get the position of the scroll bar """
+        if self._h >= len(self._options):
+            return 0
+        return (self._start_line + self._window_offset) / (len(self._options) - self._h)
+
+    @property
+    def value(self) -> object:
+        """ The current value of the list box """
+        return self._value
+
+    @value.setter
+    def value(self, new_value: object) -> None:
+        old_value = self._value
+        self._value = new_value
+        index = self._options.index_of(new_value)
+        if index is not None:
+            self._line = index
+        elif len(self._options) > 0:
+            self._line = 0
+            self._value = self._options[0][1]
+        else:
+            self._line = -1
+            self._value = None
+        if self._validator:
+            self._is_valid = self._validator(self._value)
+        if old_value != self._value and self._on_change:
+            self._on_change()
+        self._start_line = max(
+            0,
+            self._line - self._h + 1,
+            min(self._start_line, self._line)
+        )
+
+
+class VirtualListBox(_VirtualListBoxMixin, WIG.ListBox):
+    """ A ListBox whose options come from VirtualOptions, drawing and scrolling cost O(visible rows) """
+
+
+class VirtualMultiColumnListBox(_VirtualListBoxMixin, WIG.MultiColumnListBox):
+    """ A MultiColumnListBox whose options come from VirtualOptions, drawing and scrolling cost O(visible rows) """
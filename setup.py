@@ -14,7 +14,8 @@ setuptools.setup(
     install_requires=[
         "asciimatics==1.15.0",
         "english-words==2.0.1",
-        "python-magic==0.4.27"
+        "python-magic==0.4.27",
+        "numpy==1.26.4"
     ],
     author="Henry Letellier",
     author_email="henrysoftwarehouse@protonmail.com",
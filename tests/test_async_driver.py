@@ -0,0 +1,108 @@
+# tests/test_async_driver.py
+import os
+import asyncio
+from asciimatics.event import KeyboardEvent
+from asciimatics_overlay_ov import AsciimaticsOverlay, AsyncDriver, FrameScheduler, HeadlessScreen
+
+
+class PipeScreen(HeadlessScreen):
+    """ A headless screen whose events are the bytes written to a pipe """
+
+    def __init__(self, input_fd: int) -> None:
+        super().__init__(10, 2)
+        self.input_fd = input_fd
+
+    def get_event(self) -> KeyboardEvent:
+        """ Read one key from the pipe """
+        try:
+            data = os.read(self.input_fd, 1)
+        except BlockingIOError:
+            return None
+        return KeyboardEvent(data[0])
+
+
+def test_async_driver_polls_a_headless_screen() -> None:
+    """ Coroutines draw between the frames and the events are polled every frame """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    screen = overlay.get_screen()
+    driver = overlay.create_async_driver(200)
+    keys = []
+    driver.add_input_handler(lambda event: keys.append(event.key_code))
+
+    async def update() -> None:
+        for index in range(3):
+            overlay.mvprintw(str(index), index, 0)
+            screen.feed_keys([ord("a") + index])
+            await asyncio.sleep(0.01)
+        driver.stop()
+
+    async def main() -> int:
+        driver.spawn(update())
+        driver.spawn(asyncio.sleep(10))
+        return await driver.run()
+
+    frames = asyncio.run(main())
+    assert driver.watching_input is False
+    assert keys == [ord("a"), ord("b"), ord("c")]
+    assert screen.get_text()[0].startswith("012")
+    assert screen.refresh_count == frames
+    assert len(driver.tasks) == 0
+
+
+def test_async_driver_wakes_up_on_input() -> None:
+    """ The input is handled as soon as the file is readable, without waiting for the next frame """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    keys = []
+    driver = AsyncDriver(FrameScheduler(1), PipeScreen(read_fd), read_fd)
+
+    def on_key(event: KeyboardEvent) -> None:
+        keys.append(event.key_code)
+        if event.key_code == ord("q"):
+            driver.stop()
+
+    driver.add_input_handler(on_key)
+
+    async def main() -> int:
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, os.write, write_fd, b"xq")
+        start = loop.time()
+        frames = await driver.run()
+        return frames, loop.time() - start
+
+    try:
+        frames, elapsed = asyncio.run(main())
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    assert keys == [ord("x"), ord("q")]
+    assert frames == 1
+    assert elapsed < 0.9
+
+
+def test_async_driver_does_not_spin_on_unread_input() -> None:
+    """ Input nobody reads wakes the driver up at most once per frame """
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"unread")
+    driver = AsyncDriver(FrameScheduler(50), HeadlessScreen(10, 2), read_fd)
+    wakeups = []
+    on_input_ready = driver._on_input_ready
+
+    def count_wakeups() -> None:
+        wakeups.append(1)
+        on_input_ready()
+
+    driver._on_input_ready = count_wakeups
+    try:
+        frames = asyncio.run(driver.run(5))
+        assert frames == 5
+        assert wakeups == []
+        keys = []
+        driver.add_input_handler(keys.append)
+        frames = asyncio.run(driver.run(5))
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    assert keys == []
+    assert 0 < len(wakeups) <= frames
+    assert driver._reader_added is False
@@ -0,0 +1,25 @@
+# tests/test_bench.py
+import json
+from asciimatics_overlay_ov.bench import Benchmark, main
+
+
+def test_benchmark_runs_every_case() -> None:
+    """ Every case must run against the in-memory screen and report its throughput """
+    benchmark = Benchmark(sizes=[(20, 6)], repeat=1)
+    results = benchmark.run()
+    assert [result["method"] for result in results] == list(benchmark.cases)
+    for result in results:
+        assert result["print_at_per_frame"] > 0
+        assert result["cells_per_second"] > 0
+        assert result["peak_allocated_bytes"] >= 0
+    by_method = {result["method"]: result for result in results}
+    assert by_method["print_array_cloud_points_batched"]["print_at_per_frame"] < by_method["print_array_cloud_points"]["print_at_per_frame"]
+
+
+def test_benchmark_entry_point(capsys) -> None:
+    """ The command line entry point must output the results as JSON """
+    status = main(["--sizes", "10x4", "--methods", "mvprintw_colour", "--repeat", "1", "--json"])
+    assert status == 0
+    results = json.loads(capsys.readouterr().out)
+    assert results[0]["print_at_per_frame"] == 4
+    assert main(["--methods", "unknown"]) == 1
@@ -0,0 +1,86 @@
+# tests/test_colour_class.py
+import numpy as np
+from asciimatics_overlay_ov.colour_class import Colour, resolve_colour, rgb_to_colour, quantise_rgb_array
+from asciimatics_overlay_ov.headless_screen_class import HeadlessScreen
+
+
+def test_resolve_colour_matches_the_probe_order() -> None:
+    """ The merged table must give the same result as probing human, windows then linux binds """
+    colour = Colour()
+    for name in [*colour.linux_bind, *colour.windows_bind, *colour.human_bind]:
+        if name in colour.human_bind:
+            expected = colour.human_bind[name]
+        elif name in colour.windows_bind:
+            expected = colour.windows_bind[name]
+        else:
+            expected = colour.linux_bind[name]
+        assert resolve_colour(name) == expected
+
+
+def test_resolve_colour_fallback() -> None:
+    """ Only the exact names are known, the others default to -1 """
+    assert resolve_colour("cyan") == Colour().colour_cyan
+    assert resolve_colour("Cyan") == -1
+    assert resolve_colour("not a colour") == -1
+
+
+def test_pick_colour_keeps_its_selected_colour() -> None:
+    """ pick_colour still stores its result, resolve_colour does not touch any instance """
+    colour = Colour("red")
+    assert colour.your_selected_colour == colour.colour_red
+    assert colour.pick_colour("blue") == colour.colour_blue
+    assert colour.your_selected_colour == colour.colour_blue
+    resolve_colour("green")
+    assert colour.your_selected_colour == colour.colour_blue
+
+
+def test_pick_colour_honours_the_modified_binds() -> None:
+    """ The changes made to the binds of an instance are used by pick_colour, not by resolve_colour """
+    colour = Colour()
+    colour.human_bind["brand"] = colour.colour_magenta
+    colour.windows_bind["blue"] = colour.colour_cyan
+    assert colour.pick_colour("brand") == colour.colour_magenta
+    assert colour.pick_colour("Red") == -1
+    assert colour.pick_colour(1) == -1
+    assert colour.pick_colour("blue") == colour.colour_blue
+    colour.human_bind["blue"] = colour.colour_yellow
+    assert colour.pick_colour("blue") == colour.colour_yellow
+    del colour.human_bind["brand"]
+    assert colour.pick_colour("brand") == -1
+    colour.human_bind = {"default": colour.colour_white}
+    assert colour.pick_colour("not a colour") == colour.colour_white
+    assert resolve_colour("brand") == -1
+    assert resolve_colour("blue") == Colour().colour_blue
+
+
+def test_rgb_hex_and_xterm_colours() -> None:
+    """ The colours are quantised to the palette supported by the screen """
+    colour = Colour()
+    assert colour.pick_rgb_colour(255, 0, 0, 256) == 196
+    assert colour.pick_rgb_colour(250, 10, 10) == colour.colour_red
+    assert colour.pick_hex_colour("#00f", 8) == colour.colour_blue
+    assert colour.pick_hex_colour("#808080", 256) == 244
+    assert colour.pick_xterm_colour(46, 256) == 46
+    assert colour.pick_xterm_colour(46, 8) == colour.colour_green
+    colour.my_asciimatics_overlay_main_screen = HeadlessScreen(colours=256)
+    assert colour.pick_rgb_colour(255, 0, 0) == 196
+
+
+def test_quantise_rgb_array() -> None:
+    """ The vectorised quantiser gives the exact nearest colour, like rgb_to_colour """
+    gradient = np.zeros((4, 64, 3), dtype=np.uint8)
+    gradient[..., 0] = np.linspace(0, 255, 64, dtype=np.uint8)
+    result = quantise_rgb_array(gradient, 256)
+    assert result.shape == (4, 64)
+    assert result.dtype == np.int16
+    assert result[0, 0] == 16
+    assert result[0, -1] == 196
+    for column, red in enumerate(gradient[0, :, 0].tolist()):
+        assert result[0, column] == rgb_to_colour(red, 0, 0)
+    basic = quantise_rgb_array(gradient, 8)
+    assert set(np.unique(basic).tolist()) <= {0, 1}
+    samples = np.random.default_rng(7).integers(0, 256, size=(50, 40, 3))
+    for colours in (256, 8):
+        quantised = quantise_rgb_array(samples, colours)
+        for (row, column), index in np.ndenumerate(quantised):
+            assert index == rgb_to_colour(*samples[row, column].tolist(), colours)
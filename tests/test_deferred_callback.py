@@ -0,0 +1,145 @@
+# tests/test_deferred_callback.py
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import asciimatics.widgets as WIG
+from asciimatics.scene import Scene
+from asciimatics.screen import Screen
+from asciimatics_overlay_ov import DeferredCallback, HeadlessScreen, UiCommandQueue
+from asciimatics_overlay_ov.widgets import FrameNodes
+
+
+class FakeTimer:
+    """ A timer stand-in that only fires when the test asks it to """
+
+    created = []
+
+    def __init__(self, delay: float, function: object, args: tuple) -> None:
+        self.delay = delay
+        self.function = function
+        self.args = args
+        self.cancelled = False
+        self.daemon = False
+        FakeTimer.created.append(self)
+
+    def start(self) -> None:
+        pass
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def fire(self) -> None:
+        self.function(*self.args)
+
+
+def test_debounce_only_runs_the_last_change() -> None:
+    """ A burst of changes runs the callback once, after the queue is drained on the UI thread """
+    FakeTimer.created = []
+    queue = UiCommandQueue()
+    calls = []
+    deferred = DeferredCallback(lambda: calls.append("search"), debounce=0.2, queue=queue, timer_factory=FakeTimer)
+    for _ in range(5):
+        deferred()
+    assert [timer.cancelled for timer in FakeTimer.created] == [True] * 4 + [False]
+    for timer in FakeTimer.created:
+        timer.fire()
+    assert calls == []
+    assert queue.drain() == 1
+    assert calls == ["search"]
+
+
+def test_throttle_runs_the_leading_and_the_trailing_change() -> None:
+    """ The first change runs at once, the following ones wait for the end of the throttle delay """
+    FakeTimer.created = []
+    now = [10.0]
+    queue = UiCommandQueue()
+    calls = []
+    deferred = DeferredCallback(lambda: calls.append(now[0]), throttle=0.5, queue=queue, clock=lambda: now[0], timer_factory=FakeTimer)
+    deferred()
+    now[0] = 10.1
+    deferred()
+    deferred()
+    assert calls == [10.0]
+    assert round(FakeTimer.created[-1].delay, 6) == 0.4
+    now[0] = 10.5
+    FakeTimer.created[-1].fire()
+    queue.drain()
+    assert calls == [10.0, 10.5]
+
+
+def test_executor_results_of_superseded_changes_are_dropped() -> None:
+    """ The results are given to on_result on the UI thread, only for the last change """
+    queue = UiCommandQueue()
+    values = iter(["first", "second"])
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        deferred = DeferredCallback(lambda: next(values), executor=executor, on_result=results.append, queue=queue)
+        deferred()
+        first = deferred._future
+        wait([first])
+        deferred()
+        wait([deferred._future])
+    assert results == []
+    assert queue.drain() == 1
+    assert results == ["second"]
+    deferred.queue.call_soon_threadsafe(deferred._deliver, 1, first)
+    deferred.queue.drain()
+    assert results == ["second"]
+    assert deferred.stale_count == 1
+
+
+def test_factories_only_wrap_the_deferred_callbacks() -> None:
+    """ The factories keep the plain on_change, and pass the deferred calls through the ui_queue of the nodes """
+    HeadlessScreen(40, 10)
+    nodes = FrameNodes()
+    plain = nodes.add_input("Plain", "plain", on_change=print)
+    debounced = nodes.add_input("Search", "search", on_change=print, debounce=0.2)
+    assert plain._on_change is print
+    assert isinstance(debounced._on_change, DeferredCallback)
+    assert debounced._on_change.queue is nodes.ui_queue
+    assert isinstance(nodes.add_listbox([("One", 1)], print, None, throttle=0.1)._on_change, DeferredCallback)
+
+
+def test_deferred_results_are_applied_by_an_idle_screen() -> None:
+    """ The results submitted while the screen idles force its next frame, which drains the queue (Screen.draw_next_frame) """
+    screen = HeadlessScreen(40, 10)
+    nodes = FrameNodes()
+    frame = WIG.Frame(screen, 10, 40, has_border=False)
+    layout = WIG.Layout([100])
+    frame.add_layout(layout)
+    results = []
+    released = threading.Event()
+
+    def search() -> str:
+        released.wait(5)
+        return "found"
+
+    with ThreadPoolExecutor(1) as executor:
+        listbox = layout.add_widget(
+            nodes.add_listbox(
+                [("One", 1), ("Two", 2)],
+                search,
+                None,
+                height=2,
+                executor=executor,
+                on_result=results.append
+            )
+        )
+        frame.fix()
+        screen.set_scenes([Scene([frame], -1)])
+        screen.draw_next_frame()
+        screen.feed_keys([Screen.KEY_DOWN])
+        screen.draw_next_frame()
+        assert listbox.value == 2
+        released.set()
+        # The result is submitted by the done callback of the future, after wait returns
+        wait([listbox._on_change._future])
+        deadline = time.monotonic() + 5
+        while len(nodes.ui_queue) == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+    # The screen idles (no input and no refresh due), the result forces the next frame
+    assert results == []
+    screen.draw_next_frame()
+    assert results == ["found"]
+    assert len(nodes.ui_queue) == 0
+    assert nodes.ui_queue.attach_frame(frame) is False
@@ -0,0 +1,354 @@
+# tests/test_display_class.py
+from asciimatics.screen import _DoubleBuffer
+from asciimatics_overlay_ov.display_class import Display
+from asciimatics_overlay_ov.cell_buffer_class import CellBuffer
+from asciimatics_overlay_ov.layer_compositor_class import LayerCompositor
+from asciimatics_overlay_ov.logger_class import Logger
+
+
+class RecordingScreen:
+    """ A screen stand-in that records every print_at call """
+
+    def __init__(self, width: int = 80, height: int = 24) -> None:
+        self.width = width
+        self.height = height
+        self.calls = []
+
+    def print_at(self, text, x, y, colour=7, attr=0, bg=0, transparent=False) -> None:
+        """ Record the call """
+        self.calls.append((text, x, y, colour, attr, bg, transparent))
+
+
+class DoubleBufferedScreen(RecordingScreen):
+    """ A screen stand-in that owns an asciimatics double buffer """
+
+    def __init__(self, width: int = 80, height: int = 24) -> None:
+        super().__init__(width, height)
+        self._start_line = 0
+        self._buffer_height = height
+        self._buffer = _DoubleBuffer(height, width)
+
+
+def test_print_array_cloud_points_batched_merges_runs() -> None:
+    """ Adjacent points sharing a style must be emitted as a single run """
+    screen = RecordingScreen()
+    display = Display(screen)
+    display.print_array_cloud_points(
+        [
+            {"character": "b", "posx": 1, "posy": 0},
+            {"character": "a", "posx": 0, "posy": 0},
+            {"character": "c", "posx": 2, "posy": 0},
+            {"character": "d", "posx": 3, "posy": 0, "colour": 1},
+            {"character": "e", "posx": 0, "posy": 1}
+        ],
+        batched=True
+    )
+    assert screen.calls == [
+        ("abc", 0, 0, 7, 0, 0, False),
+        ("d", 3, 0, 1, 0, 0, False),
+        ("e", 0, 1, 7, 0, 0, False)
+    ]
+
+
+def test_print_array_cloud_points_batched_matches_unbatched() -> None:
+    """ The batched mode must write the same cells as the per point mode """
+    points = [
+        {"character": "#", "posx": x, "posy": y, "colour": (x // 3) % 8}
+        for y in range(4) for x in range(12)
+    ]
+    unbatched = RecordingScreen()
+    Display(unbatched).print_array_cloud_points(points, 2, 3)
+    batched = RecordingScreen()
+    Display(batched).print_array_cloud_points(points, 2, 3, batched=True)
+
+    def cells(calls: list) -> dict:
+        result = {}
+        for text, x, y, *style in calls:
+            for index, char in enumerate(text):
+                result[(x + index, y)] = (char, *style)
+        return result
+    assert cells(batched.calls) == cells(unbatched.calls)
+    assert len(batched.calls) == 16
+
+
+def test_print_array_cloud_points_batched_keeps_the_order_of_overlapping_points() -> None:
+    """ Overlapping points are drawn in the order of the array, whether they are batched or not """
+    points = [
+        {"character": "abc", "posx": 2, "posy": 0},
+        {"character": "XY", "posx": 0, "posy": 0},
+        {"character": "#", "posx": 1, "posy": 0, "colour": 2},
+        {"character": "de", "posx": 5, "posy": 0},
+        {"character": "f", "posx": 7},
+        {"character": "z", "posy": 1}
+    ]
+    unbatched = DoubleBufferedScreen(10, 3)
+    Display(unbatched).print_array_cloud_points(points)
+    batched = DoubleBufferedScreen(10, 3)
+    Display(batched).print_array_cloud_points(points, batched=True)
+    assert len(batched.calls) == len(unbatched.calls) - 1
+    for screen in (unbatched, batched):
+        for text, x, y, *style in screen.calls:
+            for index, char in enumerate(text):
+                screen._buffer.set(x + index, y, (char, *style[:3], 1))
+    for y in range(3):
+        assert [batched._buffer.get(x, y) for x in range(10)] == [unbatched._buffer.get(x, y) for x in range(10)]
+    assert unbatched._buffer.get(1, 0)[:2] == ("#", 2)
+
+
+def test_cloud_points_are_clipped_to_the_screen() -> None:
+    """ The off-screen points are dropped and the partially visible ones trimmed """
+    screen = RecordingScreen(10, 5)
+    display = Display(screen)
+    cloud = [
+        {"character": "abc", "posx": -1, "posy": 0},
+        {"character": "#", "posx": 50, "posy": 0},
+        {"character": "#", "posx": 2, "posy": 9},
+        {"character": "wxyz", "posx": 8, "posy": 1}
+    ]
+    expected = [("bc", 0, 0, 7, 0, 0, False), ("wx", 8, 1, 7, 0, 0, False)]
+    display.print_array_cloud_points(cloud)
+    assert screen.calls == expected
+    screen.calls = []
+    display.print_array_cloud_points(cloud, batched=True)
+    assert screen.calls == expected
+    screen.calls = []
+    display.print_double_array_cloud_points([[{"character": "#"}] * 12] * 7)
+    assert len(screen.calls) == 50
+
+
+def test_viewport_clipping() -> None:
+    """ The viewport restricts the drawing further than the screen """
+    screen = RecordingScreen(80, 24)
+    display = Display(screen)
+    display.set_viewport(2, 1, 3, 1)
+    row = [{"text": "ab"}, {"text": "cd"}, {"text": "e"}, {"text": "fg"}, {"text": "h"}]
+    display.print_array_colour(row, "", 1, 1)
+    assert screen.calls == [
+        ("b", 2, 1, 7, 0, 0, False),
+        ("cd", 2, 1, 7, 0, 0, False),
+        ("e", 3, 1, 7, 0, 0, False),
+        ("f", 4, 1, 7, 0, 0, False)
+    ]
+    screen.calls = []
+    display.print_array_colour(row, "", 1, 0)
+    assert screen.calls == []
+    screen.calls = []
+    display.clear_viewport()
+    display.print_array_cloud_points([{"character": "#", "posx": 70}], viewport=(60, 0, 5, 5))
+    assert screen.calls == []
+
+
+def test_print_array_colour_uses_the_arguments() -> None:
+    """ The items are drawn at posx + their index with the colours of the arguments, which are written into them """
+    screen = RecordingScreen(80, 24)
+    display = Display(screen)
+    row = [
+        {"text": "a"},
+        {"text": "b", "posx": 10, "posy": 3, "colour": 2, "attr": 1, "bg": 4, "transparent": True}
+    ]
+    display.print_array_colour(row, "--", 1, 0, colour=3)
+    assert screen.calls == [
+        ("a", 1, 0, 3, 0, 0, False),
+        ("b", 2, 0, 3, 0, 0, False)
+    ]
+    assert row[1] == {"text": "b", "seperator": "--", "posx": 2, "posy": 0, "colour": 3, "attr": 0, "bg": 0, "transparent": False}
+
+
+def test_print_double_array_one_line_per_row() -> None:
+    """ Every visible row is drawn on its own line and clipped """
+    screen = RecordingScreen(6, 3)
+    display = Display(screen)
+    array = [["a", "b"], ["c", "d"], ["e", "f"], ["g", "h"]]
+    display.print_double_array(array, "-", 3, -1)
+    assert screen.calls == [
+        ("c-d", 3, 0, 7, 0, 0, False),
+        ("e-f", 3, 1, 7, 0, 0, False),
+        ("g-h", 3, 2, 7, 0, 0, False)
+    ]
+    screen.calls = []
+    display.print_block(["x" * 10] * 10000, -2, 1, 3)
+    assert screen.calls == [("x" * 6, 0, 1, 3, 0, 0, False), ("x" * 6, 0, 2, 3, 0, 0, False)]
+
+
+def test_cell_buffer_row_runs() -> None:
+    """ The runs of a row must be split on every style change """
+    buffer = CellBuffer.from_strings(["Hello World"])
+    buffer.fg[0, 6:] = 2
+    assert buffer.row_text(0) == "Hello World"
+    assert buffer.row_runs(0) == [
+        ("Hello ", 0, 7, 0, 0),
+        ("World", 6, 2, 0, 0)
+    ]
+    assert buffer.row_runs(0, 3, 8) == [
+        ("lo ", 3, 7, 0, 0),
+        ("Wo", 6, 2, 0, 0)
+    ]
+
+
+def test_cell_buffer_put_text_clips_and_skips_spaces() -> None:
+    """ put_text drops the characters outside of the buffer and only draws the non spaces when transparent """
+    buffer = CellBuffer.from_strings(["abcdef"])
+    columns, drawn = buffer.put_text("x y z", -1, 0, 3, transparent=True)
+    assert (columns, drawn.tolist()) == (slice(0, 4), [False, True, False, True])
+    assert buffer.row_text(0) == "ayczef"
+    assert buffer.fg[0].tolist() == [7, 3, 7, 3, 7, 7]
+    assert buffer.put_text("x", 6, 0) is None
+    assert buffer.put_text("uvw", 4, 0, 2) == (slice(4, 6), True)
+    assert buffer.row_text(0) == "ayczuv"
+
+
+def test_blit_buffer_without_double_buffer() -> None:
+    """ Without a double buffer, one print_at must be issued per visible run """
+    screen = RecordingScreen(10, 2)
+    buffer = CellBuffer.from_strings(["abcdef", "ghijkl", "mnopqr"], fg=3)
+    Display(screen).blit_buffer(buffer, 6, 0)
+    assert screen.calls == [
+        ("abcd", 6, 0, 3, 0, 0, False),
+        ("ghij", 6, 1, 3, 0, 0, False)
+    ]
+
+
+def test_blit_buffer_into_double_buffer() -> None:
+    """ The rows must be written straight into the double buffer """
+    screen = DoubleBufferedScreen(10, 3)
+    buffer = CellBuffer.from_strings(["ab", "c "], fg=1, bg=4)
+    Display(screen).blit_buffer(buffer, -1, 1, transparent=True)
+    assert screen.calls == []
+    assert screen._buffer.get(0, 1) == ("b", 1, 0, 4, 1)
+    assert screen._buffer.get(0, 2) == (" ", 7, 0, 0, 1)
+    assert screen._buffer.get(1, 1) == (" ", 7, 0, 0, 1)
+
+
+def test_layer_compositor_stacks_the_layers() -> None:
+    """ The layers are composited by z_index whatever the drawing order """
+    screen = RecordingScreen(6, 2)
+    display = Display(screen)
+    compositor = LayerCompositor(6, 2)
+    display.mvprintw_colour("popup", 1, 0, 3, parent_screen=compositor.get_layer("overlay"))
+    display.mvprintw_colour("dashboard", 0, 0, 2, parent_screen=compositor.get_layer("content"))
+    display.mvprintw_colour("a b", 3, 0, 1, transparent=True, parent_screen=compositor.get_layer("hud"))
+    display.print_layers(compositor)
+    assert screen.calls == [
+        ("d", 0, 0, 2, 0, 0, False),
+        ("po", 1, 0, 3, 0, 0, False),
+        ("a", 3, 0, 1, 0, 0, False),
+        ("u", 4, 0, 3, 0, 0, False),
+        ("b", 5, 0, 1, 0, 0, False),
+        ("      ", 0, 1, 7, 0, 0, False)
+    ]
+    compositor.get_layer("hud").visible = False
+    compositor.clear("overlay")
+    assert compositor.composite().row_text(0) == "dashbo"
+    compositor.clear()
+    assert compositor.composite().row_text(0) == " " * 6
+
+
+def test_frame_diff_skips_unchanged_rows() -> None:
+    """ Only the rows that changed since the previous frame must reach the screen """
+    screen = RecordingScreen()
+    display = Display(screen)
+    display.enable_frame_diff()
+    for _ in range(2):
+        display.print_double_array_colour(
+            [[{"text": "a"}], [{"text": "b"}]],
+            "",
+            0,
+            0,
+            region_id="panel"
+        )
+    assert len(screen.calls) == 2
+    display.print_double_array_colour(
+        [[{"text": "a"}], [{"text": "c"}]],
+        "",
+        0,
+        0,
+        region_id="panel"
+    )
+    assert len(screen.calls) == 3
+    assert screen.calls[-1][0] == "c"
+    display.reset_frame_diff("panel")
+    display.print_double_array_colour(
+        [[{"text": "a"}], [{"text": "c"}]],
+        "",
+        0,
+        0,
+        region_id="panel"
+    )
+    assert len(screen.calls) == 5
+
+
+def test_frame_diff_uses_the_call_site() -> None:
+    """ Two call sites must not share their remembered content """
+    screen = RecordingScreen()
+    display = Display(screen)
+    display.enable_frame_diff()
+    for _ in range(3):
+        display.mvprintw_colour("Hello", 0, 0)
+        display.mvprintw_colour("Hello", 0, 0)
+    assert len(screen.calls) == 2
+    display.disable_frame_diff()
+    display.mvprintw_colour("Hello", 0, 0)
+    assert len(screen.calls) == 3
+
+
+def test_print_checker_board_layout() -> None:
+    """ The board must be drawn with its borders and one print_at per colour run """
+    screen = RecordingScreen()
+    Display(screen).print_checker_board(
+        [["K", "Q"]],
+        width=3,
+        height=2,
+        iposx=1,
+        iposy=1,
+        even_fg_colour=1,
+        even_bg_colour=2,
+        uneven_fg_colour=3,
+        uneven_bg_colour=4,
+        border_fg=5,
+        border_bg=6
+    )
+    assert screen.calls == [
+        ("A B C ", 3, 1, 5, 0, 6, False),
+        ("------", 3, 2, 5, 0, 6, False),
+        ("0|", 1, 3, 5, 0, 6, False),
+        ("1|", 1, 4, 5, 0, 6, False),
+        ("K ", 3, 3, 1, 0, 2, False),
+        ("Q ", 5, 3, 3, 0, 4, False),
+        (". ", 7, 3, 1, 0, 2, False),
+        (". ", 3, 4, 3, 0, 4, False),
+        (". ", 5, 4, 1, 0, 2, False),
+        (". ", 7, 4, 3, 0, 4, False)
+    ]
+
+
+def test_print_checker_board_merges_identical_styles() -> None:
+    """ When both cell styles are identical, a row is a single run """
+    screen = RecordingScreen()
+    Display(screen).print_checker_board(
+        [],
+        width=64,
+        height=64,
+        even_fg_colour=7,
+        even_bg_colour=0,
+        uneven_fg_colour=7,
+        uneven_bg_colour=0,
+        add_spacing=False
+    )
+    assert len(screen.calls) == 2 + 64 + 64
+    assert screen.calls[-1] == ("." * 64, 3, 65, 7, 0, 0, False)
+
+
+def test_checker_board_diagnostics_go_to_the_ring_buffer(capsys) -> None:
+    """ The diagnostics must never reach stdout, only the enabled handlers """
+    screen = RecordingScreen()
+    Display(screen).print_checker_board([], width=2, height=2)
+    ring_buffer = Logger.enable_logging(ring_buffer_size=10)
+    try:
+        Display(screen).print_checker_board([], width=2, height=2)
+    finally:
+        Logger.disable_logging()
+    assert capsys.readouterr().out == ""
+    records = ring_buffer.get_records()
+    assert len(records) > 0
+    functions = {record["function"] for record in records}
+    assert functions == {"print_checker_board", "_print_sides_of_checker_board"}
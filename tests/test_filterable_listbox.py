@@ -0,0 +1,50 @@
+# tests/test_filterable_listbox.py
+import asciimatics.widgets as WIG
+from asciimatics_overlay_ov import AsciimaticsOverlay
+from asciimatics_overlay_ov.widgets import FilterIndex, FilterableListBox
+
+
+WORDS = ["Carrot", "carpet", "scar", "hyacinth", "cart", "valise", "Cetorhinus"]
+OPTIONS = [(word, index) for index, word in enumerate(WORDS)]
+
+
+def test_filter_index_refines_incrementally() -> None:
+    """ The n-gram index and the previous results give the same answers as a scan """
+    index = FilterIndex(OPTIONS)
+    for query in ["", "c", "ca", "car", "carp", "ar", "CAR", "xyz", "t"]:
+        expected = [position for position, word in enumerate(WORDS) if query.lower() in word.lower()]
+        assert list(index.search(query)) == expected, query
+    assert index.filter("car") == [("Carrot", 0), ("carpet", 1), ("scar", 2), ("cart", 4)]
+    index.search("car")
+    index.result = [0]
+    assert index.search("carr") == [0]
+
+
+def test_filterable_listbox_keeps_the_widget_and_the_selection() -> None:
+    """ Filtering replaces the options in place """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    listbox = overlay.add_filterable_listbox(OPTIONS, None, None, height=3)
+    assert len(listbox.options) == len(WORDS)
+    listbox.value = 4
+    assert listbox.filter("car") == 4
+    assert (listbox.value, listbox.query) == (4, "car")
+    assert [text for text, _ in listbox.options] == ["Carrot", "carpet", "scar", "cart"]
+    assert overlay.apply_filter_to_options(listbox, listbox.filter_index, "inth") == overlay.success
+    assert listbox.options[0] == ("hyacinth", 3)
+    assert listbox.value == 3
+    dropdown = WIG.DropdownList(OPTIONS)
+    assert overlay.apply_filter_to_options(dropdown, FilterIndex(OPTIONS), "val") == overlay.success
+    assert dropdown.options == [("valise", 5)]
+
+
+def test_filterable_listboxes_sharing_an_index_keep_their_query() -> None:
+    """ The query of a widget is its own, searching the shared index for another widget does not change it """
+    index = FilterIndex(OPTIONS)
+    first = FilterableListBox(3, index)
+    second = FilterableListBox(3, index)
+    assert first.filter("Car") == 4
+    assert second.filter("inth") == 1
+    assert (first.query, second.query) == ("Car", "inth")
+    index.search("val")
+    assert first.query == "Car"
+    assert [text for text, _ in first.options] == ["Carrot", "carpet", "scar", "cart"]
@@ -0,0 +1,50 @@
+# tests/test_form_values.py
+import asciimatics.widgets as WIG
+from asciimatics_overlay_ov import HeadlessScreen
+from asciimatics_overlay_ov.widgets import FrameNodes
+
+
+class FormFrame(WIG.Frame, FrameNodes):
+    """ A frame containing a small form """
+
+    def __init__(self, screen: HeadlessScreen) -> None:
+        super().__init__(screen, 10, 40, has_border=False)
+        FrameNodes.__init__(self)
+        layout = WIG.Layout([100])
+        self.add_layout(layout)
+        layout.add_widget(self.add_label("Status", name="status"))
+        layout.add_widget(self.add_input("Name", "name"))
+        layout.add_widget(self.add_checkbox("Agree", name="agree"))
+        layout.add_widget(self.add_listbox([("One", 1), ("Two", 2)], None, None, height=2, name="choice"))
+        layout.add_widget(self.add_divider())
+        self.fix()
+        self.reset()
+
+
+def test_snapshot_values_reads_the_named_widgets() -> None:
+    """ The texts of the labels and the values of the inputs are read, the unnamed widgets are skipped """
+    frame = FormFrame(HeadlessScreen(40, 10))
+    assert frame.snapshot_values(frame) == {
+        "status": "Status",
+        "name": "",
+        "agree": False,
+        "choice": 1
+    }
+
+
+def test_apply_values_restores_a_snapshot() -> None:
+    """ A snapshot given back to apply_values restores the form, the numbers are converted for the text widgets """
+    frame = FormFrame(HeadlessScreen(40, 10))
+    snapshot = frame.snapshot_values(frame)
+    status = frame.apply_values(frame, {"status": 42, "name": 7, "agree": True, "choice": 2})
+    assert status == frame.success
+    assert frame.snapshot_values(frame) == {"status": "42", "name": "7", "agree": True, "choice": 2}
+    assert frame.apply_values(frame, snapshot) == frame.success
+    assert frame.snapshot_values(frame) == snapshot
+
+
+def test_apply_values_reports_the_unknown_widgets() -> None:
+    """ The known widgets are still updated when the mapping contains unknown names """
+    frame = FormFrame(HeadlessScreen(40, 10))
+    assert frame.apply_values(frame, {"name": "Ada", "missing": 1}) == frame.error
+    assert frame.get_widget_value_by_name(frame, "name") == "Ada"
@@ -0,0 +1,55 @@
+# tests/test_frame_scheduler.py
+from asciimatics_overlay_ov import AsciimaticsOverlay, FrameScheduler
+
+
+class FakeClock:
+    """ A clock that only moves when the scheduler sleeps or a frame does some work """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """ Advance the time """
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def test_scheduler_paces_and_corrects_drift() -> None:
+    """ The time spent in a frame is deducted from the following sleep """
+    clock = FakeClock()
+    refreshes = []
+    scheduler = FrameScheduler(10, lambda: refreshes.append(clock.now), clock, clock.sleep)
+
+    def frame(frame_number: int) -> bool:
+        clock.now += 0.03
+        return frame_number < 3
+
+    scheduler.add_callback(frame)
+    scheduler.add_callback(lambda frame_number: None)
+    assert scheduler.run() == 4
+    assert clock.sleeps == [0.07, 0.07, 0.07]
+    assert len(refreshes) == 4
+    assert round(clock.now, 6) == 0.33
+
+
+def test_scheduler_drops_late_frames() -> None:
+    """ A frame running far too long does not make the next ones run back to back """
+    clock = FakeClock()
+    durations = iter([0.35, 0.01, 0.01])
+    scheduler = FrameScheduler(10, None, clock, clock.sleep)
+    scheduler.add_callback(lambda frame_number: setattr(clock, "now", clock.now + next(durations)))
+    assert scheduler.run(max_frames=3) == 3
+    assert scheduler.dropped_frames == 2
+    assert clock.sleeps == [0.04]
+
+
+def test_overlay_scheduler_refreshes_the_screen_once_per_frame() -> None:
+    """ The overlay scheduler refreshes the headless screen once per frame """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    scheduler = overlay.create_frame_scheduler(1000, lambda frame_number: frame_number < 4)
+    assert scheduler.run() == 5
+    assert overlay.get_screen().refresh_count == 5
@@ -0,0 +1,82 @@
+# tests/test_headless_screen.py
+import asciimatics.widgets as WIG
+from asciimatics.event import KeyboardEvent
+from asciimatics.scene import Scene
+from asciimatics_overlay_ov import AsciimaticsOverlay, HeadlessScreen
+
+
+def test_headless_overlay_rendering() -> None:
+    """ Draw through the overlay and compare the displayed text with a snapshot """
+    overlay = AsciimaticsOverlay(headless=True)
+    screen = overlay.get_screen()
+    assert isinstance(screen, HeadlessScreen)
+    overlay.mvprintw_colour("Hello", 1, 0, overlay.colour_red)
+    overlay.print_array(["a", "b"], "-", -1, 1)
+    overlay.mvprintw_colour("x y", 3, 0, transparent=True)
+    assert screen.get_text()[0] == " " * 80
+    assert overlay.refresh_screen() == overlay.success
+    assert screen.get_text()[:2] == [
+        " Hexly".ljust(80),
+        "-b".ljust(80)
+    ]
+    assert screen.get_from(1, 0) == (ord("H"), overlay.colour_red, 0, 0)
+    assert overlay.clear_screen() == overlay.success
+    assert screen.get_text()[0] == " " * 80
+
+
+def test_headless_screen_input_and_state() -> None:
+    """ The keys are fed by the test and the screen state is recorded """
+    overlay = AsciimaticsOverlay(headless=True)
+    screen = overlay.get_screen()
+    screen.feed_keys(["q", 27])
+    assert overlay.is_it_this_key(overlay.get_event_key_code(), "q") is True
+    assert overlay.get_event_key_code() == 27
+    assert overlay.get_event_key_code() is None
+    assert overlay.set_screen_title("Title") == overlay.success
+    assert overlay.set_screen_colour(1, 0, 2) == overlay.success
+    assert (screen.title, screen.current_colours) == ("Title", (1, 0, 2))
+    assert overlay.get_screen_dimensions() == (80, 24)
+
+
+def test_create_headless_game_screen() -> None:
+    """ MyScreen must be able to create a headless screen """
+    overlay = AsciimaticsOverlay(headless=True)
+    assert overlay.create_game_screen(headless=True, width=20, height=5) == overlay.success
+    assert overlay.get_screen_dimensions() == (20, 5)
+    assert overlay.destroy_game_screen() == overlay.success
+
+
+def test_lightweight_overlay_shares_its_nodes() -> None:
+    """ The lightweight mode must not duplicate the node instances """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    assert overlay.colour_ is overlay
+    assert overlay.display_ is overlay
+    assert overlay.screen_.my_asciimatics_overlay_main_screen is overlay.get_screen()
+    assert "colour_" not in vars(overlay)
+    assert overlay.update_initial_pointers(success=1, error=2) == 1
+    assert (overlay.frame_nodes_.success, overlay.screen_.error) == (1, 2)
+    eager = AsciimaticsOverlay(headless=True)
+    assert eager.colour_ is not eager
+    assert eager.display_.my_asciimatics_overlay_main_screen is eager.get_screen()
+
+
+def test_headless_screen_draws_and_plays_frames() -> None:
+    """ The asciimatics Frames and their widgets are drawn on the headless screen, and their Scenes are played """
+    screen = HeadlessScreen(30, 6)
+    frame = WIG.Frame(screen, 5, 20, x=2, y=1, title="T")
+    layout = WIG.Layout([100])
+    frame.add_layout(layout)
+    layout.add_widget(WIG.Label("hello"))
+    text = layout.add_widget(WIG.Text("In:", name="text"))
+    frame.fix()
+    frame.reset()
+    frame.update(0)
+    assert screen.get_text(displayed=False)[1:3] == [
+        "  +------- T --------+        ",
+        "  |hello             |        "
+    ]
+    screen.set_scenes([Scene([frame], -1)])
+    screen.feed_events([KeyboardEvent(ord("a")), KeyboardEvent(ord("b"))])
+    screen.draw_next_frame()
+    assert text.value == "ab"
+    assert screen.get_text()[3].startswith("  |In: ab ")
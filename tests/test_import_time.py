@@ -0,0 +1,64 @@
+# tests/test_import_time.py
+import subprocess
+import sys
+
+# The cumulative import time (in microseconds) allowed for the package itself
+IMPORT_BUDGET_US = 50_000
+HEAVY_MODULES = ("asciimatics.widgets", "asciimatics.scene", "numpy", "asyncio")
+
+
+def import_times(code: str) -> tuple[dict[str, int], str]:
+    """ Run code in a new interpreter and get the cumulative import time of every module it imported """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") is False or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit() is True:
+            times[module.strip()] = int(cumulative)
+    return times, process.stdout
+
+
+def test_package_import_is_within_budget() -> None:
+    """ Importing the package does not import the widgets, asciimatics or numpy """
+    times, output = import_times("import asciimatics_overlay_ov")
+    assert times["asciimatics_overlay_ov"] < IMPORT_BUDGET_US
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert "asciimatics.screen" not in times
+    assert output == ""
+
+
+def test_colour_and_get_do_not_import_the_widgets() -> None:
+    """ The classes are imported on their first access, without the rest of the package """
+    times, _ = import_times("from asciimatics_overlay_ov import Colour, Get")
+    assert "asciimatics_overlay_ov.colour_class" in times
+    assert "asciimatics_overlay_ov.get_class" in times
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert "asciimatics_overlay_ov.widgets" not in times
+
+
+def test_main_module_imports_the_examples_lazily() -> None:
+    """ Importing the entry point neither prints nor imports the example scripts """
+    times, output = import_times("import asciimatics_overlay_ov.__main__")
+    assert output == ""
+    assert "asciimatics_overlay_ov.example_scripts.test_menu_input" not in times
+    assert [module for module in HEAVY_MODULES if module in times] == []
+
+
+def test_overlay_class_leaves_the_optional_modules_unimported() -> None:
+    """ The headless screen, the async driver, the buffers and the extra widgets are imported by the code using them """
+    times, _ = import_times("from asciimatics_overlay_ov import AsciimaticsOverlay")
+    assert "asciimatics_overlay_ov.asciimatics_overlay_main" in times
+    assert "numpy" not in times
+    assert "asyncio" not in times
+    assert [
+        module for module in times
+        if module.startswith("asciimatics_overlay_ov.widgets.") and module.startswith("asciimatics_overlay_ov.widgets.frame_nodes") is False
+    ] == []
+    assert "asciimatics_overlay_ov.deferred_callback_class" not in times
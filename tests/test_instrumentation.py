@@ -0,0 +1,92 @@
+# tests/test_instrumentation.py
+import asciimatics.widgets as WIG
+from asciimatics.screen import Canvas, _AbstractCanvas, _DoubleBuffer
+from asciimatics_overlay_ov import AsciimaticsOverlay, CellBuffer, HeadlessScreen, Instrumentation, MethodStats
+from asciimatics_overlay_ov.display_class import Display
+
+
+def test_instrumentation_records_calls_cells_and_frames() -> None:
+    """ The Display methods, the refreshes and the print_at calls are measured while the instrumentation is enabled """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    stats = Instrumentation.enable_instrumentation()
+    try:
+        overlay.print_block(["abc", "de"], 0, 0)
+        overlay.refresh_screen()
+        overlay.mvprintw("hello", 0, 3)
+        overlay.mvprintw("hi", 0, 4)
+        overlay.refresh_screen()
+        overlay.apply_text_to_display(WIG.Label("old"), 42)
+    finally:
+        Instrumentation.disable_instrumentation()
+    assert stats.get("Display.print_block").calls == 1
+    assert stats.get("Display.print_block").cells == 5
+    assert stats.get("Display.mvprintw").as_dict()["calls"] == 2
+    assert stats.get("Display.mvprintw").cells == 7
+    assert stats.get("MyScreen.refresh_screen").calls == 2
+    assert stats.get("FrameNodes.apply_text_to_display").calls == 1
+    assert stats.print_at_per_frame == [2, 2]
+    assert stats.print_at_calls == 4
+    assert stats.cells == 12
+    assert list(stats.summary())[0] in stats.methods
+    stats.reset()
+    assert stats.summary() == {}
+    assert stats.print_at_per_frame == []
+
+
+def test_disabled_instrumentation_restores_the_original_methods() -> None:
+    """ Disabling puts the original functions back, nothing is measured anymore """
+    originals = (Display.__dict__["mvprintw"], _AbstractCanvas.__dict__["print_at"], _DoubleBuffer.__dict__["set"])
+    stats = Instrumentation.enable_instrumentation()
+    assert Instrumentation.is_enabled() is True
+    assert Display.__dict__["mvprintw"] is not originals[0]
+    Instrumentation.disable_instrumentation()
+    assert Instrumentation.is_enabled() is False
+    assert (Display.__dict__["mvprintw"], _AbstractCanvas.__dict__["print_at"], _DoubleBuffer.__dict__["set"]) == originals
+    AsciimaticsOverlay(headless=True, lightweight=True).mvprintw("hello", 0, 0)
+    assert stats.methods == {}
+
+
+def test_direct_buffer_writes_are_counted_once() -> None:
+    """ The cells written into an asciimatics double buffer by print_at are not counted twice """
+    screen = HeadlessScreen(20, 5)
+    canvas = Canvas(screen, 2, 10, 0, 0)
+    display = Display(screen)
+    buffer = CellBuffer(4, 2)
+    stats = Instrumentation.enable_instrumentation()
+    try:
+        display.mvprintw("abc", 0, 0, parent_screen=canvas)
+        display.blit_buffer(buffer, 0, 0, parent_screen=canvas)
+    finally:
+        Instrumentation.disable_instrumentation()
+    assert stats.get("Display.mvprintw").cells == 3
+    assert stats.get("Display.blit_buffer").cells == 8
+    assert stats.get("print_at").calls == 1
+
+
+def test_frame_diff_regions_keep_their_call_site() -> None:
+    """ The measured Display methods still identify the frame diff regions by the call site of the caller """
+    screen = HeadlessScreen(20, 5)
+    display = Display(screen)
+    display.enable_frame_diff()
+    stats = Instrumentation.enable_instrumentation()
+    try:
+        for _ in range(3):
+            display.mvprintw_colour("Hello", 0, 0)
+            display.mvprintw_colour("Hello", 0, 0)
+    finally:
+        Instrumentation.disable_instrumentation()
+    assert stats.get("Display.mvprintw_colour").calls == 6
+    assert stats.print_at_calls == 2
+    assert len(display._frame_diff_cache) == 2
+
+
+def test_method_stats_percentiles() -> None:
+    """ The percentiles use the nearest rank of the recorded durations """
+    method = MethodStats("Display.print_at", max_samples=100)
+    assert method.p50 == 0.0
+    for duration in range(1, 101):
+        method.record(duration / 1000, 1)
+    assert method.p50 == 0.05
+    assert method.p99 == 0.099
+    assert method.calls == 100
+    assert method.cells == 100
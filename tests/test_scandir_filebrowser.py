@@ -0,0 +1,138 @@
+# tests/test_scandir_filebrowser.py
+import os
+import asciimatics.widgets as WIG
+from asciimatics.scene import Scene
+from asciimatics_overlay_ov import AsciimaticsOverlay, HeadlessScreen
+from asciimatics_overlay_ov.widgets import ScandirFileBrowser
+
+
+def _names(browser: ScandirFileBrowser) -> list[str]:
+    """ Get the names displayed by the browser """
+    return [row[0] for row, _ in browser.options]
+
+
+def test_scandir_filebrowser_streams_and_caches(tmp_path) -> None:
+    """ The listing is built in a worker thread, filtered there and cached per directory """
+    for index in range(600):
+        (tmp_path / f"file_{index:03}.txt").write_text("x")
+    (tmp_path / "skipped.bin").write_text("x")
+    (tmp_path / "sub").mkdir()
+    ScandirFileBrowser.clear_listing_cache()
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    browser = overlay.add_filebrowser(5, str(tmp_path), file_filter=r".*\.txt$", background_scan=True)
+    browser._populate_list(str(tmp_path))
+    assert browser.wait_for_scan(5) == 601
+    assert browser.scanning is False
+    names = _names(browser)
+    assert names[:3] == ["|-+ ..", "|-+ sub", "|-- file_000.txt"]
+    assert len(names) == 602 and "|-- skipped.bin" not in names
+    assert browser._titles[0] == str(tmp_path)
+    other = ScandirFileBrowser(5, str(tmp_path), file_filter=r".*\.txt$")
+    other._populate_list(str(tmp_path))
+    assert other.scanning is False and _names(other) == names
+    (tmp_path / "new.txt").write_text("x")
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 10 ** 9))
+    other._populate_list(str(tmp_path))
+    assert other.scanning is True
+    other.wait_for_scan(5)
+    assert "|-- new.txt" in _names(other)
+
+
+def test_scandir_filebrowser_skips_unreadable_entries(tmp_path, monkeypatch) -> None:
+    """ An entry that cannot be read is skipped, a listing that failed part way is not cached """
+    for name in ("a.txt", "b.txt", "target.txt"):
+        (tmp_path / name).write_text("x")
+    os.symlink(tmp_path / "target.txt", tmp_path / "link.txt")
+    target = os.path.realpath(tmp_path / "target.txt")
+    stat = os.stat
+
+    def failing_stat(path, *args, **kwargs):
+        if os.fspath(path) == target:
+            raise PermissionError(path)
+        return stat(path, *args, **kwargs)
+
+    # The target of the link is removed between the existence check and the stat
+    monkeypatch.setattr(os.path, "exists", lambda path: True)
+    monkeypatch.setattr(os, "stat", failing_stat)
+    ScandirFileBrowser.clear_listing_cache()
+    browser = ScandirFileBrowser(5, str(tmp_path))
+    browser._populate_list(str(tmp_path))
+    browser.wait_for_scan(5)
+    assert _names(browser)[1:] == ["|-- a.txt", "|-- b.txt", "|-- target.txt"]
+    assert (str(tmp_path), None) in ScandirFileBrowser.listing_cache
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        entries = scandir(path)
+        first = next(entries)
+
+        def iterate():
+            yield first
+            raise PermissionError(path)
+
+        class Entries:
+            def __enter__(self):
+                return iterate()
+
+            def __exit__(self, *exc_info):
+                entries.close()
+
+        return Entries()
+
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+    ScandirFileBrowser.clear_listing_cache()
+    browser._populate_list(str(tmp_path))
+    assert browser.wait_for_scan(5) <= 1
+    assert browser.scanning is False
+    assert ScandirFileBrowser.listing_cache == {}
+
+
+def test_scandir_filebrowser_merges_the_batches(tmp_path) -> None:
+    """ The rows of every drain are merged into the sorted listing """
+    browser = ScandirFileBrowser(5, str(tmp_path), use_cache=False)
+    browser._populate_list(str(tmp_path))
+    browser.wait_for_scan(5)
+
+    def row(name: str, is_dir: bool = False) -> tuple:
+        return is_dir, ([f"|-{'+' if is_dir else '-'} {name}", "0", "0"], name)
+
+    browser._pending.extend([[row("m"), row("c"), row("y", True)], [row("q")]])
+    assert browser.receive_entries() == 4
+    browser._pending.extend([[row("a"), row("b", True), row("z")], 0])
+    assert browser.receive_entries() == 3
+    assert _names(browser)[1:] == ["|-+ b", "|-+ y", "|-- a", "|-- c", "|-- m", "|-- q", "|-- z"]
+
+
+def test_scandir_filebrowser_streams_without_input(tmp_path) -> None:
+    """ The screen keeps updating the browser while it scans, the entries arrive without any key press """
+    for index in range(10):
+        (tmp_path / f"file_{index}.txt").write_text("x")
+    ScandirFileBrowser.clear_listing_cache()
+    screen = HeadlessScreen(40, 10)
+    frame = WIG.Frame(screen, 10, 40, has_border=False)
+    layout = WIG.Layout([100], fill_frame=True)
+    frame.add_layout(layout)
+    browser = layout.add_widget(ScandirFileBrowser(8, str(tmp_path)))
+    frame.fix()
+    screen.set_scenes([Scene([frame], -1)])
+    screen.draw_next_frame()
+    browser._scan_thread.join(5)
+    assert browser.frame_update_count == 1
+    screen.draw_next_frame()
+    screen.draw_next_frame()
+    assert len(browser.options) == 11
+    assert browser.scanning is False
+    assert browser.frame_update_count == 0
+
+
+def test_scandir_filebrowser_listing_cache_is_bounded(tmp_path, monkeypatch) -> None:
+    """ The least recently used listings are dropped beyond listing_cache_size """
+    monkeypatch.setattr(ScandirFileBrowser, "listing_cache_size", 2)
+    ScandirFileBrowser.clear_listing_cache()
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+    browser = ScandirFileBrowser(5, str(tmp_path / "a"))
+    for name in ("a", "b", "a", "c"):
+        browser._populate_list(str(tmp_path / name))
+        browser.wait_for_scan(5)
+    assert [key[0] for key in ScandirFileBrowser.listing_cache] == [str(tmp_path / "a"), str(tmp_path / "c")]
@@ -0,0 +1,44 @@
+# tests/test_scene_registry.py
+import asciimatics.widgets as WIG
+from asciimatics.screen import Screen
+from asciimatics_overlay_ov import HeadlessScreen, LazyScene, SceneRegistry
+
+
+def create_registry(screen: HeadlessScreen, built: list) -> SceneRegistry:
+    """ Create a registry of three frames recording their creation """
+    registry = SceneRegistry(screen)
+    for name in ("Main", "Popup", "Chess"):
+        registry.register(
+            name,
+            lambda screen, name=name: built.append(name) or WIG.Frame(screen, 10, 40, title=name)
+        )
+    return registry
+
+
+def test_scenes_are_built_when_first_played() -> None:
+    """ Handing the scenes to the screen only builds the start scene """
+    screen = HeadlessScreen(40, 10)
+    built = []
+    registry = create_registry(screen, built)
+    assert all(isinstance(scene, LazyScene) for scene in registry.scenes)
+    Screen.set_scenes(screen, registry.scenes)
+    assert built == ["Main"]
+    assert screen._unhandled_input is None
+    popup = registry.get_scene("Popup")
+    popup.reset()
+    popup.reset()
+    assert built == ["Main", "Popup"]
+    assert popup.effects[0].title.strip() == "Popup"
+    assert registry.built_names == ["Main", "Popup"]
+
+
+def test_prewarm_builds_each_scene_once() -> None:
+    """ The pre-warmed scenes are not built again when they are played """
+    screen = HeadlessScreen(40, 10)
+    built = []
+    registry = create_registry(screen, built)
+    registry.prewarm(["Chess"])
+    registry.prewarm(background=True).join()
+    registry.get_scene("Chess").reset()
+    assert sorted(built) == ["Chess", "Main", "Popup"]
+    assert built[0] == "Chess"
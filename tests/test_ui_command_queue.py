@@ -0,0 +1,90 @@
+# tests/test_ui_command_queue.py
+import threading
+from asciimatics_overlay_ov import AsciimaticsOverlay, UiCommandQueue
+
+
+class FakeLabel:
+    """ A widget stand-in recording the texts it is given """
+
+    def __init__(self) -> None:
+        self.texts = []
+
+    @property
+    def text(self) -> str:
+        return self.texts[-1] if self.texts else ""
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.texts.append(value)
+
+
+def test_queue_keeps_the_last_write_per_widget() -> None:
+    """ The updates of a widget are coalesced and the other commands keep their order """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    queue = UiCommandQueue()
+    label = FakeLabel()
+    calls = []
+    queue.update_widget(label, overlay.apply_text_to_display, "first")
+    queue.call_soon_threadsafe(calls.append, "draw")
+    queue.update_widget(label, overlay.apply_text_to_display, 42)
+    queue.call_soon_threadsafe(calls.append, "status 1", key="status")
+    queue.call_soon_threadsafe(calls.append, "status 2", key="status")
+    assert len(queue) == 3
+    assert queue.drain() == 3
+    assert label.texts == ["42"]
+    assert calls == ["draw", "status 2"]
+    assert queue.coalesced_count == 2
+    assert queue.drain() == 0
+
+
+def test_queue_keeps_the_different_kinds_of_update_of_a_widget() -> None:
+    """ The updates of a widget are coalesced per kind, the other kinds are not overwritten """
+    queue = UiCommandQueue()
+    label = FakeLabel()
+    calls = []
+
+    def set_colour(widget: FakeLabel, colour: int) -> None:
+        calls.append(("colour", colour))
+
+    def set_text(widget: FakeLabel, text: str) -> None:
+        widget.text = text
+
+    queue.update_widget(label, set_text, "first")
+    queue.update_widget(label, set_colour, 1)
+    queue.update_widget(label, set_text, "second")
+    def log(widget: FakeLabel, message: str) -> None:
+        calls.append(("log", message))
+
+    queue.update_widget(label, log, "a", kind="status")
+    queue.update_widget(label, log, "b", kind="progress")
+    queue.update_widget(label, log, "c", kind="status")
+    assert queue.drain() == 4
+    assert label.texts == ["second"]
+    assert calls == [("colour", 1), ("log", "c"), ("log", "b")]
+
+
+def test_queue_from_worker_threads() -> None:
+    """ Worker threads submit commands that only run when the UI thread drains the queue """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    queue = UiCommandQueue()
+    ui_threads = set()
+
+    def draw(row: int, value: int) -> None:
+        ui_threads.add(threading.get_ident())
+        overlay.mvprintw(f"{value:3}", 0, row)
+
+    def worker(row: int) -> None:
+        for value in range(200):
+            queue.call_soon_threadsafe(draw, row, value, key=("row", row))
+
+    threads = [threading.Thread(target=worker, args=(row,)) for row in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler = overlay.create_frame_scheduler(1000, lambda frame_number: False)
+    queue.attach(scheduler)
+    scheduler.run()
+    assert ui_threads == {threading.get_ident()}
+    assert overlay.get_screen().get_text()[:4] == ["199".ljust(80)] * 4
+    assert queue.drained_count == 4
@@ -0,0 +1,100 @@
+# tests/test_virtual_listbox.py
+import asciimatics.widgets as WIG
+from asciimatics.event import KeyboardEvent
+from asciimatics.screen import Screen
+from asciimatics_overlay_ov import AsciimaticsOverlay, HeadlessScreen
+from asciimatics_overlay_ov.widgets import VirtualOptions
+
+
+def _place(widget: WIG.Widget) -> WIG.Frame:
+    """ Lay a widget out in a frame drawn on a headless screen """
+    frame = WIG.Frame(HeadlessScreen(40, 10), 10, 40, has_border=False)
+    layout = WIG.Layout([100], fill_frame=True)
+    frame.add_layout(layout)
+    layout.add_widget(widget)
+    frame.fix()
+    return frame
+
+
+def _rows(frame: WIG.Frame, count: int, width: int = 12) -> list[str]:
+    """ Read the text drawn on the canvas of a frame """
+    return [
+        "".join(chr(frame.canvas.get_from(posx, posy)[0]) for posx in range(width)).rstrip()
+        for posy in range(count)
+    ]
+
+
+def test_virtual_listbox_only_fetches_the_visible_window() -> None:
+    """ A million options are browsed without being materialised """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    fetched = []
+
+    def fetch(start: int, stop: int) -> list[str]:
+        fetched.append((start, stop))
+        return [f"word {index}" for index in range(start, stop)]
+
+    listbox = overlay.add_virtual_listbox(fetch, None, None, height=5, length=1_000_000, prefetch=4)
+    frame = _place(listbox)
+    listbox.update(0)
+    assert _rows(frame, 5) == [f"word {index}" for index in range(5)]
+    listbox.value = 999_998
+    listbox.process_event(KeyboardEvent(Screen.KEY_UP))
+    listbox.update(1)
+    assert listbox.value == 999_997
+    assert _rows(frame, 5) == [f"word {index}" for index in range(999_994, 999_999)]
+    assert max(stop - start for start, stop in fetched) <= 5 + 2 * 4 + 2
+    assert listbox.options.fetch_count == len(fetched)
+
+
+def test_virtual_multicolumn_listbox_with_option_tuples() -> None:
+    """ The sources can be sequences of (row, value) options """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    rows = [([f"r{index}", str(index * 2)], f"id{index}") for index in range(1000)]
+    listbox = overlay.add_virtual_multicolumnlistbox(
+        rows,
+        height=3,
+        columns=[4, 4],
+        prefetch=2,
+        value_to_index=lambda value: int(value[2:]) if value[2:].isdigit() is True else None
+    )
+    frame = _place(listbox)
+    listbox.value = "id500"
+    listbox.update(0)
+    assert _rows(frame, 3, 8) == ["r498996", "r499998", "r5001000"]
+    listbox.value = "missing"
+    assert listbox.value == "id0"
+    assert VirtualOptions(["a", "b"])[-1] == ("b", 1)
+
+
+def test_virtual_options_never_scan_the_source() -> None:
+    """ The values outside of the window that are not indexes are not searched, None and unknown values fetch nothing """
+    fetched = []
+
+    def fetch(start: int, stop: int) -> list[tuple]:
+        fetched.append((start, stop))
+        return [(f"r{index}", f"id{index}") for index in range(start, stop)]
+
+    options = VirtualOptions(fetch, 1_000_000, prefetch=2)
+    assert options[10] == ("r10", "id10")
+    calls = len(fetched)
+    assert options.index_of(None) is None
+    assert options.index_of("id11") == 11
+    assert options.index_of("id900000") is None
+    assert options.index_of(["unhashable"]) is None
+    assert len(fetched) == calls
+    assert VirtualOptions(fetch, 3, value_to_index=lambda value: 2).index_of("id0") == 2
+
+
+def test_frame_reset_does_not_load_a_virtual_listbox() -> None:
+    """ Resetting the frame sets the value of the listbox to itself, which must not fetch the whole source """
+    overlay = AsciimaticsOverlay(headless=True, lightweight=True)
+    fetched = []
+
+    def fetch(start: int, stop: int) -> list[str]:
+        fetched.append((start, stop))
+        return [f"word {index}" for index in range(start, stop)]
+
+    listbox = overlay.add_virtual_listbox(fetch, None, None, height=5, length=1_000_000, prefetch=4)
+    frame = _place(listbox)
+    frame.reset()
+    assert sum(stop - start for start, stop in fetched) < 100
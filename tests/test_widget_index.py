@@ -0,0 +1,57 @@
+# tests/test_widget_index.py
+import asciimatics.widgets as WIG
+from asciimatics_overlay_ov import HeadlessScreen
+from asciimatics_overlay_ov.widgets import FrameNodes
+
+
+class IndexedFrame(WIG.Frame, FrameNodes):
+    """ A frame creating its widgets with the FrameNodes factories """
+
+    def __init__(self, screen: HeadlessScreen) -> None:
+        super().__init__(screen, 10, 40, has_border=False)
+        FrameNodes.__init__(self)
+        self.layout = WIG.Layout([100])
+        self.add_layout(self.layout)
+        for index in range(50):
+            self.layout.add_widget(self.add_input(f"Input {index}", f"input_{index}"))
+        self.layout.add_widget(WIG.Label("Indexed too", name="plain_label"))
+
+
+def test_lookups_do_not_walk_the_layouts(monkeypatch) -> None:
+    """ The lookups of the widgets of a frame use its index, built once """
+    frame = IndexedFrame(HeadlessScreen(40, 10))
+    frame.find_widget_by_name(frame, "input_12").value = "twelve"
+    walks = []
+    original = WIG.Frame.find_widget
+    monkeypatch.setattr(WIG.Frame, "find_widget", lambda self, name: walks.append(name) or original(self, name))
+    builds = []
+    original_iter = FrameNodes._iter_named_widgets
+    monkeypatch.setattr(FrameNodes, "_iter_named_widgets", staticmethod(lambda frame: builds.append(1) or original_iter(frame)))
+    assert frame.get_widget_value_by_name(frame, "input_12") == "twelve"
+    assert frame.find_widget_by_name(frame, "input_49").name == "input_49"
+    assert frame.find_widget_by_name(frame, "plain_label").text == "Indexed too"
+    assert frame.find_widget_by_name(frame, "missing") is None
+    assert walks == []
+    assert builds == []
+
+
+def test_widget_index_follows_the_layouts_of_the_frame() -> None:
+    """ The index belongs to the frame, widgets cleared from its layouts are not returned and new ones are found """
+    frame = IndexedFrame(HeadlessScreen(40, 10))
+    nodes = FrameNodes()
+    detached = nodes.add_input("Detached", "input_3")
+    assert frame.find_widget_by_name(frame, "input_3") is frame.find_widget("input_3")
+    assert nodes.find_widget_by_name(frame, "input_3") is frame.find_widget("input_3")
+    assert nodes.find_widget_by_name(frame, "input_3") is not detached
+    frame.layout.clear_widgets()
+    assert frame.find_widget_by_name(frame, "input_3") is None
+    replacement = frame.layout.add_widget(nodes.add_input("Replacement", "input_3"))
+    assert nodes.find_widget_by_name(frame, "input_3") is replacement
+    other_layout = WIG.Layout([100])
+    frame.add_layout(other_layout)
+    label = other_layout.add_widget(WIG.Label("Other", name="other"))
+    frame.fix()
+    assert frame.find_widget_by_name(frame, "other") is label
+    frame.layout._columns[0][0] = detached
+    frame.clear_widget_index(frame)
+    assert frame.find_widget_by_name(frame, "input_3") is detached